@@ -0,0 +1,32 @@
+"""Cover the ingest dedupe lookup with an index-only scan.
+
+Revision ID: 0004_ingested_videos_lookup_index
+Revises: 0003_task_stop_controls
+Create Date: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "0004_ingested_videos_lookup_index"
+down_revision: str | None = "0003_task_stop_controls"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_ingested_videos_lookup",
+        "ingested_videos",
+        ["platform", "source_id"],
+        postgresql_include=["task_id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ingested_videos_lookup", table_name="ingested_videos", if_exists=True)
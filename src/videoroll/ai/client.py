@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
 import random
+import re
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Mapping
@@ -14,6 +17,20 @@ from videoroll.utils.openai_compat import build_openai_embeddings_url
 _RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 
 
+class OpenAIStatusError(RuntimeError):
+    """An OpenAI-compatible endpoint answered with an HTTP error status."""
+
+    def __init__(self, message: str, *, status_code: int) -> None:
+        super().__init__(message)
+        self.status_code = int(status_code)
+
+    @property
+    def retryable(self) -> bool:
+        # 4xx other than timeout/rate limit (bad key, wrong URL/model, bad
+        # request) fails the same way on every attempt.
+        return not (400 <= self.status_code < 500) or self.status_code in {408, 429}
+
+
 @dataclass(frozen=True)
 class OpenAIChatConfig:
     api_key: str | None
@@ -36,20 +53,146 @@ def openai_chat_config_from_settings(settings: Mapping[str, Any]) -> OpenAIChatC
     )
 
 
+_SHARED_CLIENT_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+
 def create_openai_http_client(timeout_seconds: float) -> httpx.Client:
     t = float(timeout_seconds)
     timeout = httpx.Timeout(t, connect=min(10.0, t), read=t, write=t, pool=t)
-    return httpx.Client(timeout=timeout)
+    return httpx.Client(timeout=timeout, limits=_SHARED_CLIENT_LIMITS)
+
+
+_SHARED_CLIENTS: dict[tuple[int, float], httpx.Client] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def shared_openai_http_client(timeout_seconds: float) -> httpx.Client:
+    """
+    Return a process-wide client for one-off requests so they reuse pooled
+    keep-alive connections instead of paying a TCP/TLS handshake each time.
+
+    Keyed by PID as well as timeout: a client inherited across a prefork
+    worker fork must not share its sockets with the parent. Credentials are
+    sent per request, so key rotation needs no new client.
+    """
+    key = (os.getpid(), float(timeout_seconds))
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(key)
+        if client is None:
+            client = create_openai_http_client(timeout_seconds)
+            _SHARED_CLIENTS[key] = client
+        return client
+
+
+def close_shared_openai_http_clients() -> None:
+    with _SHARED_CLIENTS_LOCK:
+        clients = list(_SHARED_CLIENTS.values())
+        _SHARED_CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
+_MAX_BACKOFF_SECONDS = 30.0
+_RATE_LIMIT_RESET_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_RATE_LIMIT_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class _Congestion:
+    """
+    Process-wide view of how congested the OpenAI-compatible endpoint is.
+
+    Every response feeds an EWMA of retryable failures (429/5xx, timeouts,
+    transport errors). Backoff delays stretch with that rate so concurrent
+    callers sharing one quota stop retrying in lockstep, and shrink back
+    after clean successes. Rate-limit headers that report an exhausted
+    request budget also hold off the next request until the reported reset.
+    """
+
+    def __init__(self, *, alpha: float = 0.2, stretch: float = 4.0) -> None:
+        self._alpha = alpha
+        self._stretch = stretch
+        self._lock = threading.Lock()
+        self.error_rate = 0.0
+        self._not_before = 0.0
+
+    def record(self, *, failed: bool) -> None:
+        with self._lock:
+            self.error_rate += self._alpha * ((1.0 if failed else 0.0) - self.error_rate)
+
+    def backoff_seconds(self, attempt: int) -> float:
+        base = float(2 ** max(0, attempt)) * (1.0 + self._stretch * self.error_rate)
+        return min(_MAX_BACKOFF_SECONDS, base) + random.random() * 0.5
+
+    def note_rate_limit(self, headers: Mapping[str, str]) -> None:
+        remaining = str(headers.get("x-ratelimit-remaining-requests") or "").strip()
+        if remaining != "0":
+            return
+        self.hold_off(_parse_rate_limit_reset(str(headers.get("x-ratelimit-reset-requests") or "")))
+
+    def hold_off(self, seconds: float) -> None:
+        """Make every caller in this process wait ``seconds`` (capped) before its next request."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._not_before = max(self._not_before, time.monotonic() + min(_MAX_BACKOFF_SECONDS, seconds))
+
+    def wait_for_quota(self) -> None:
+        with self._lock:
+            delay = self._not_before - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _parse_rate_limit_reset(value: str) -> float:
+    """Parse OpenAI-style reset durations such as "1s", "250ms" or "6m0s"."""
+    text = value.strip()
+    if not text:
+        return 0.0
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    return sum(float(n) * _RATE_LIMIT_UNIT_SECONDS[unit] for n, unit in _RATE_LIMIT_RESET_RE.findall(text))
+
+
+_CONGESTION = _Congestion()
 
 
 def _sleep_backoff(attempt: int) -> None:
-    base = min(8.0, float(2**attempt))
-    time.sleep(base + random.random() * 0.25)
+    time.sleep(_CONGESTION.backoff_seconds(attempt))
+
+
+def _wait_before_retry(resp: httpx.Response, attempt: int) -> None:
+    # A Retry-After from the server applies to the whole quota, so it holds
+    # off every thread; the next _post() waits it out.
+    retry_after = (resp.headers.get("retry-after") or "").strip()
+    try:
+        delay = float(retry_after) if retry_after else -1.0
+    except ValueError:
+        delay = -1.0
+    if delay < 0:
+        _sleep_backoff(attempt)
+        return
+    _CONGESTION.hold_off(delay)
+
+
+def _post(client: httpx.Client, url: str, **kwargs: Any) -> httpx.Response:
+    _CONGESTION.wait_for_quota()
+    try:
+        resp = client.post(url, **kwargs)
+    except (httpx.TimeoutException, httpx.TransportError):
+        _CONGESTION.record(failed=True)
+        raise
+    _CONGESTION.record(failed=resp.status_code in _RETRYABLE_STATUS_CODES)
+    _CONGESTION.note_rate_limit(resp.headers)
+    return resp
 
 
 def _resp_snippet(resp: httpx.Response, limit: int = 200) -> str:
+    # Decode only a bounded prefix: error bodies can be large HTML pages.
     try:
-        text = resp.text or ""
+        head = resp.content[: limit * 4 + 256]
+        text = head.decode(resp.encoding or "utf-8", errors="replace")
     except Exception:
         return ""
     text = text.replace("\r", " ").replace("\n", " ").strip()
@@ -60,14 +203,17 @@ def _resp_snippet(resp: httpx.Response, limit: int = 200) -> str:
 
 def _strip_code_fence(text: str) -> str:
     out = (text or "").strip()
-    if out.startswith("```"):
-        lines = out.splitlines()
-        if lines and lines[0].startswith("```"):
-            lines = lines[1:]
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        out = "\n".join(lines).strip()
-    return out
+    if not out.startswith("```"):
+        return out
+    # Drop the opening fence line and a closing fence line by slicing, without splitting every line.
+    nl = out.find("\n")
+    if nl < 0:
+        return ""
+    body = out[nl + 1 :]
+    last_nl = body.rfind("\n")
+    if body[last_nl + 1 :].strip() == "```":
+        body = body[: last_nl + 1] if last_nl >= 0 else ""
+    return body.strip()
 
 
 def _extract_content(resp_json: dict[str, Any]) -> str:
@@ -123,26 +269,20 @@ def _request_openai_json_object_with_client(
 
         for net_attempt in range(attempts_network):
             try:
-                resp = client.post(url, headers=headers, json=req)
+                resp = _post(client, url, headers=headers, json=req)
                 try:
                     resp.raise_for_status()
                 except httpx.HTTPStatusError as e:
                     status = resp.status_code
                     if status in _RETRYABLE_STATUS_CODES and net_attempt < attempts_network - 1:
-                        retry_after = (resp.headers.get("retry-after") or "").strip()
-                        if retry_after:
-                            try:
-                                time.sleep(min(30.0, float(retry_after)))
-                            except Exception:
-                                _sleep_backoff(net_attempt)
-                        else:
-                            _sleep_backoff(net_attempt)
+                        _wait_before_retry(resp, net_attempt)
                         continue
 
                     ct = (resp.headers.get("content-type") or "").split(";")[0].strip()
                     snippet = _resp_snippet(resp)
-                    raise RuntimeError(
-                        f"OpenAI request failed (status={resp.status_code}, content-type={ct}, url={url}). {snippet}"
+                    raise OpenAIStatusError(
+                        f"OpenAI request failed (status={resp.status_code}, content-type={ct}, url={url}). {snippet}",
+                        status_code=resp.status_code,
                     ) from e
 
                 try:
@@ -155,6 +295,12 @@ def _request_openai_json_object_with_client(
                     ) from e
 
                 return _parse_json_object(resp_json)
+            except OpenAIStatusError as e:
+                if not e.retryable:
+                    # Asking again with a format notice cannot fix a rejected request.
+                    raise
+                last_err = e
+                break
             except httpx.TimeoutException as e:
                 last_err = e
                 if net_attempt < attempts_network - 1:
@@ -186,27 +332,15 @@ def request_openai_json_object(
     network_retries: int | None = None,
     client: httpx.Client | None = None,
 ) -> dict[str, Any]:
-    if client is not None:
-        return _request_openai_json_object_with_client(
-            client=client,
-            config=config,
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            format_retry_notice=format_retry_notice,
-            format_retries=format_retries,
-            network_retries=max(1, int(network_retries if network_retries is not None else config.max_retries)),
-        )
-
-    with create_openai_http_client(config.timeout_seconds) as owned_client:
-        return _request_openai_json_object_with_client(
-            client=owned_client,
-            config=config,
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            format_retry_notice=format_retry_notice,
-            format_retries=format_retries,
-            network_retries=max(1, int(network_retries if network_retries is not None else config.max_retries)),
-        )
+    return _request_openai_json_object_with_client(
+        client=client if client is not None else shared_openai_http_client(config.timeout_seconds),
+        config=config,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        format_retry_notice=format_retry_notice,
+        format_retries=format_retries,
+        network_retries=max(1, int(network_retries if network_retries is not None else config.max_retries)),
+    )
 
 
 def request_openai_embedding(
@@ -235,26 +369,20 @@ def request_openai_embedding(
         nonlocal last_err
         for net_attempt in range(attempts_network):
             try:
-                resp = c.post(url, headers=headers, json=req)
+                resp = _post(c, url, headers=headers, json=req)
                 try:
                     resp.raise_for_status()
                 except httpx.HTTPStatusError as e:
                     status = resp.status_code
                     if status in _RETRYABLE_STATUS_CODES and net_attempt < attempts_network - 1:
-                        retry_after = (resp.headers.get("retry-after") or "").strip()
-                        if retry_after:
-                            try:
-                                time.sleep(min(30.0, float(retry_after)))
-                            except Exception:
-                                _sleep_backoff(net_attempt)
-                        else:
-                            _sleep_backoff(net_attempt)
+                        _wait_before_retry(resp, net_attempt)
                         continue
 
                     ct = (resp.headers.get("content-type") or "").split(";")[0].strip()
                     snippet = _resp_snippet(resp)
-                    raise RuntimeError(
-                        f"OpenAI embedding request failed (status={resp.status_code}, content-type={ct}, url={url}). {snippet}"
+                    raise OpenAIStatusError(
+                        f"OpenAI embedding request failed (status={resp.status_code}, content-type={ct}, url={url}). {snippet}",
+                        status_code=resp.status_code,
                     ) from e
 
                 try:
@@ -294,8 +422,4 @@ def request_openai_embedding(
             raise last_err
         raise RuntimeError("OpenAI embedding request failed")
 
-    if client is not None:
-        return _with_client(client)
-
-    with create_openai_http_client(config.timeout_seconds) as owned_client:
-        return _with_client(owned_client)
+    return _with_client(client if client is not None else shared_openai_http_client(config.timeout_seconds))
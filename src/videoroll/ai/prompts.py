@@ -33,6 +33,33 @@ def build_text_translation_prompt(text: str, *, target_lang: str, style: str) ->
     )
 
 
+# The fixed parts of the subtitle prompt are assembled once; only the
+# language/style line and the JSON payload vary per batch.
+SUBTITLE_TRANSLATION_SYSTEM_PROMPT = (
+    "You are a professional subtitle translator. Return ONLY valid JSON (no markdown, no code fences, no extra text)."
+)
+_SUBTITLE_TRANSLATION_RULES = (
+    "你将收到一批字幕 block。请按 block 为单位翻译。\n"
+    "要求：\n"
+    "- 保留每个 block 的 idx 不变；不得增删 block，不得改变顺序；\n"
+    "- 只翻译 text 字段；同一 block 内多行先合并理解再翻译；\n"
+    "- 术语、人名保持一致；数字/单位尽量保留原格式；\n"
+    "- 如果输入包含 rag_context，请优先参考其中的 term_cards/knowledge_cards 来理解专有名词、梗、作品设定和技术背景；\n"
+    "- term_cards 中的 translation 是推荐译法，除非明显不符合当前上下文，否则保持一致；\n"
+    "- rag_context 来自主 agent 对当前 block 的本地 RAG/词典预检和必要研究；如果其中已有与当前 block 和 summary 贴切的译法或解释，直接据此翻译，不要假设还必须继续搜索；\n"
+    "- 输出必须是 JSON 对象，且必须包含 translations 数组；不要输出任何解释。\n"
+)
+_SUBTITLE_TRANSLATION_INPUT_HEADER = (
+    "如果输入里带 summary，请在翻译时参考它保持前后一致，并输出 updated_summary（<= 500 字符）。\n\n"
+    "输入 JSON：\n"
+)
+_SUBTITLE_TRANSLATION_OUTPUT_SPEC = (
+    "\n\n"
+    "输出 JSON 结构（必须严格遵守）：\n"
+    '{ "updated_summary": "...", "translations": [ {"idx": 1, "text": "..."}, ... ] }'
+)
+
+
 def build_subtitle_translation_prompt(
     *,
     blocks: list[dict[str, Any]],
@@ -46,33 +73,28 @@ def build_subtitle_translation_prompt(
 ) -> AIJsonPrompt:
     tgt = (target_lang or "zh").strip() or "zh"
     tone = (style or "").strip() or "口语自然"
-    payload_in: dict[str, Any] = {"target_lang": tgt, "style": tone, "blocks": blocks}
-    if enable_summary:
-        payload_in["summary"] = str(summary or "")
+    # Key order matters for provider-side prompt caching: everything that is
+    # fixed for a whole job (glossary) precedes what changes per batch
+    # (summary, rag_context), and the blocks come last.
+    payload_in: dict[str, Any] = {"target_lang": tgt, "style": tone}
     if glossary:
         payload_in["glossary"] = glossary
+    if enable_summary:
+        payload_in["summary"] = str(summary or "")
     if rag_context:
         payload_in["rag_context"] = rag_context
+    payload_in["blocks"] = blocks
 
     return AIJsonPrompt(
-        system_prompt="You are a professional subtitle translator. Return ONLY valid JSON (no markdown, no code fences, no extra text).",
-        user_prompt=(
-            "你将收到一批字幕 block。请按 block 为单位翻译。\n"
-            "要求：\n"
-            "- 保留每个 block 的 idx 不变；不得增删 block，不得改变顺序；\n"
-            "- 只翻译 text 字段；同一 block 内多行先合并理解再翻译；\n"
-            "- 术语、人名保持一致；数字/单位尽量保留原格式；\n"
-            "- 如果输入包含 rag_context，请优先参考其中的 term_cards/knowledge_cards 来理解专有名词、梗、作品设定和技术背景；\n"
-            "- term_cards 中的 translation 是推荐译法，除非明显不符合当前上下文，否则保持一致；\n"
-            "- rag_context 来自主 agent 对当前 block 的本地 RAG/词典预检和必要研究；如果其中已有与当前 block 和 summary 贴切的译法或解释，直接据此翻译，不要假设还必须继续搜索；\n"
-            "- 输出必须是 JSON 对象，且必须包含 translations 数组；不要输出任何解释。\n"
-            f"- 目标语言：{tgt}\n"
-            f"- 风格：{tone}\n\n"
-            "如果输入里带 summary，请在翻译时参考它保持前后一致，并输出 updated_summary（<= 500 字符）。\n\n"
-            "输入 JSON：\n"
-            f"{json.dumps(payload_in, ensure_ascii=False)}\n\n"
-            "输出 JSON 结构（必须严格遵守）：\n"
-            '{ "updated_summary": "...", "translations": [ {"idx": 1, "text": "..."}, ... ] }'
+        system_prompt=SUBTITLE_TRANSLATION_SYSTEM_PROMPT,
+        user_prompt="".join(
+            (
+                _SUBTITLE_TRANSLATION_RULES,
+                f"- 目标语言：{tgt}\n- 风格：{tone}\n\n",
+                _SUBTITLE_TRANSLATION_INPUT_HEADER,
+                json.dumps(payload_in, ensure_ascii=False),
+                _SUBTITLE_TRANSLATION_OUTPUT_SPEC,
+            )
         ),
         format_retry_notice="注意：上一次输出不符合 JSON/结构要求，请严格按 JSON 输出。",
         format_retries=2,
@@ -137,21 +137,24 @@ def _clean_bilibili_tags(raw_tags: Any, *, n_tags: int) -> list[str]:
         raise RuntimeError("OpenAI output missing 'tags' list")
 
     out: list[str] = []
+    append = out.append
     seen: set[str] = set()
     for item in raw_tags:
-        s = str(item or "").strip().lstrip("#").lstrip("＃")
-        s = "".join(s.split())
+        s = "".join(str(item or "").strip().lstrip("#").lstrip("＃").split())
         if not s:
             continue
-        if s.lower() == "videoroll":
+        key = s.lower()
+        if key == "videoroll":
             continue
         if len(s) > 20:
             s = s[:20]
-        key = s.lower()
+            key = s.lower()
         if key in seen:
             continue
         seen.add(key)
-        out.append(s)
+        append(s)
+        if len(out) >= n_tags:
+            break
 
     if len(out) < n_tags:
         raise RuntimeError(f"OpenAI output has too few tags (want={n_tags}, got={len(out)})")
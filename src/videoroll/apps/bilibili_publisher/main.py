@@ -15,8 +15,7 @@ from sqlalchemy.orm import Session
 from videoroll.ai.service import AIService
 from videoroll.apps.security.service_auth import install_internal_service_auth, service_token
 from videoroll.config import BilibiliPublisherSettings, get_bilibili_publisher_settings, get_subtitle_settings
-from videoroll.db.base import Base
-from videoroll.db.auto_migrate import auto_migrate
+from videoroll.db.auto_migrate import auto_migrate, create_missing_tables
 from videoroll.db.models import Asset, AssetKind, Platform, PublishBatch, PublishJob, PublishState, Task, TaskStatus
 from videoroll.db.session import db_session, get_engine
 from videoroll.storage.s3 import S3Store
@@ -77,7 +76,7 @@ def _startup() -> None:
     settings = get_bilibili_publisher_settings()
     app.state.internal_service_token = service_token(settings)
     engine = get_engine(settings.database_url)
-    Base.metadata.create_all(engine)
+    create_missing_tables(engine)
     auto_migrate(settings.database_url)
     S3Store(settings).ensure_bucket()
 
@@ -39,8 +39,7 @@ from videoroll.apps.outbox.worker_inbox import (
 )
 from videoroll.apps.subtitle_service.worker_concurrency import JobLeaseHeartbeat, acquire_job_lease, release_job_lease
 from videoroll.config import get_bilibili_publisher_settings, get_subtitle_settings
-from videoroll.db.base import Base
-from videoroll.db.auto_migrate import auto_migrate
+from videoroll.db.auto_migrate import auto_migrate, create_missing_tables
 from videoroll.db.models import Asset, AssetKind, Platform, PublishJob, PublishState, Task, TaskStatus
 from videoroll.db.session import get_engine, get_sessionmaker
 from videoroll.storage.s3 import S3Store
@@ -93,7 +92,7 @@ def _ensure_db() -> None:
         if _DB_READY_PID == pid:
             return
         engine = get_engine(settings.database_url)
-        Base.metadata.create_all(engine)
+        create_missing_tables(engine)
         auto_migrate(settings.database_url)
         _DB_READY_PID = pid
 
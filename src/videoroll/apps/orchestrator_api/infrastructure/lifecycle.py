@@ -18,9 +18,8 @@ from videoroll.apps.security.service_auth import (
     validate_bootstrap_secret,
 )
 from videoroll.config import get_orchestrator_settings
-from videoroll.db.auto_migrate import auto_migrate
-from videoroll.db.base import Base
-from videoroll.db.session import get_engine, get_sessionmaker
+from videoroll.db.auto_migrate import auto_migrate, create_missing_tables
+from videoroll.db.session import dispose_engine, get_engine, get_sessionmaker
 from videoroll.storage.s3 import S3Store
 
 
@@ -28,7 +27,7 @@ def initialize_runtime(app: FastAPI) -> OrchestratorScheduler:
     settings = get_orchestrator_settings()
     validate_bootstrap_secret(settings)
     engine = get_engine(settings.database_url)
-    Base.metadata.create_all(engine)
+    create_missing_tables(engine)
     auto_migrate(settings.database_url)
     S3Store(settings).ensure_bucket()
     Path(settings.work_dir).mkdir(parents=True, exist_ok=True)
@@ -77,3 +76,4 @@ async def orchestrator_lifespan(app: FastAPI):
     finally:
         await realtime_hub.stop()
         scheduler.stop()
+        dispose_engine(app.state.database_url)
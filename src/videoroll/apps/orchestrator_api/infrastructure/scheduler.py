@@ -187,6 +187,7 @@ class OrchestratorScheduler:
                     source_id,
                     user_agent=self.settings.youtube_user_agent,
                     default_proxy=self.settings.youtube_proxy,
+                    redis_url=self.settings.redis_url,
                     force=False,
                     raise_if_locked=False,
                     lock_owner_prefix=f"scheduled_youtube_source_scan:{self._source_scan_worker_id}",
@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 
 import httpx
-from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Request
 from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
@@ -22,6 +22,7 @@ from videoroll.apps.orchestrator_api.schemas import (
     AutoYouTubeResponse,
     AutoYouTubeTaskStartResponse,
     RemoteAutoYouTubeRequest,
+    YouTubeDownloadAcceptedResponse,
     YouTubeDownloadActionResponse,
     YouTubeHomeScanRunResponse,
     YouTubeMetaActionResponse,
@@ -30,7 +31,7 @@ from videoroll.apps.orchestrator_api.schemas import (
     YouTubeProxyTestResponse,
 )
 from videoroll.apps.orchestrator_api.services import youtube_service
-from videoroll.apps.youtube_settings_store import get_youtube_settings
+from videoroll.apps.youtube_settings_store import get_youtube_proxy
 from videoroll.config import OrchestratorSettings
 from videoroll.storage.s3 import S3Store
 
@@ -130,7 +131,7 @@ def run_youtube_home_scan_now(settings: OrchestratorSettings = Depends(get_setti
 @router.post("/settings/youtube/test", response_model=YouTubeProxyTestResponse)
 def test_youtube_proxy(payload: YouTubeProxyTestRequest, settings: OrchestratorSettings = Depends(get_settings), db: Session = Depends(get_db)) -> YouTubeProxyTestResponse:
     url = str(payload.url or "").strip() or "https://www.youtube.com/robots.txt"
-    proxy = str(payload.proxy or "").strip() if payload.proxy is not None else str(get_youtube_settings(db, default_proxy=settings.youtube_proxy).get("proxy") or "").strip()
+    proxy = str(payload.proxy or "").strip() if payload.proxy is not None else get_youtube_proxy(db, default_proxy=settings.youtube_proxy)
     return youtube_service.test_proxy(url=url, proxy=proxy, settings=settings)
 
 
@@ -144,6 +145,21 @@ def fetch_youtube_meta(task_id: uuid.UUID, settings: OrchestratorSettings = Depe
     return youtube_service.fetch_meta(task_id, settings=settings, db=db, s3=s3)
 
 
-@router.post("/tasks/{task_id}/actions/youtube_download", response_model=YouTubeDownloadActionResponse)
-def download_youtube(task_id: uuid.UUID, settings: OrchestratorSettings = Depends(get_settings), db: Session = Depends(get_db), s3: S3Store = Depends(get_s3)) -> YouTubeDownloadActionResponse:
+@router.post("/tasks/{task_id}/actions/youtube_download", response_model=YouTubeDownloadActionResponse | YouTubeDownloadAcceptedResponse)
+def download_youtube(
+    task_id: uuid.UUID,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+    settings: OrchestratorSettings = Depends(get_settings),
+    db: Session = Depends(get_db),
+    s3: S3Store = Depends(get_s3),
+) -> YouTubeDownloadActionResponse | YouTubeDownloadAcceptedResponse:
+    if background:
+        # Download + S3 upload can take minutes; hand it off and let the client
+        # poll /tasks/{id} instead of holding the request open.
+        accepted = youtube_service.accept_background_download(task_id, db=db)
+        background_tasks.add_task(youtube_service.run_background_download, task_id, settings=settings)
+        response.status_code = 202
+        return accepted
     return youtube_service.download(task_id, settings=settings, db=db, s3=s3)
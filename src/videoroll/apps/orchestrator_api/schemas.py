@@ -345,6 +345,11 @@ class YouTubeDownloadActionResponse(BaseModel):
     cover_asset: Optional[AssetRead] = None
 
 
+class YouTubeDownloadAcceptedResponse(BaseModel):
+    task_id: uuid.UUID
+    accepted: bool = True
+
+
 class AutoYouTubeRequest(BaseModel):
     url: str
     license: SourceLicense = SourceLicense.authorized
@@ -133,8 +133,14 @@ def get_task(db: Session, task_id: uuid.UUID) -> Task:
     return task
 
 
+def require_task_exists(db: Session, task_id: uuid.UUID) -> None:
+    # Existence probe only: selects the key column instead of hydrating a Task.
+    if db.query(Task.id).filter(Task.id == task_id).first() is None:
+        raise HTTPException(status_code=404, detail="task not found")
+
+
 def list_task_assets(db: Session, task_id: uuid.UUID) -> list[Asset]:
-    get_task(db, task_id)
+    require_task_exists(db, task_id)
     return db.query(Asset).filter(Asset.task_id == task_id).order_by(Asset.created_at.asc()).all()
 
 
@@ -19,6 +19,7 @@ from videoroll.apps.orchestrator_api.services.asset_service import (
     as_dict,
     read_s3_bytes,
     read_s3_json_object,
+    require_task_exists,
     write_s3_json,
 )
 from videoroll.apps.publish_gateway import (
@@ -99,7 +100,11 @@ def normalize_tags(value: Any) -> list[str]:
 
 
 def publish_job_error_message(job: PublishJob) -> str | None:
-    data = as_dict(job.response_json)
+    return publish_response_error_message(job.response_json)
+
+
+def publish_response_error_message(response_json: Any) -> str | None:
+    data = as_dict(response_json)
     if not data:
         return None
     message = str(data.get("error") or data.get("message") or data.get("detail") or "").strip()
@@ -562,10 +567,30 @@ def delete_social_publish_account(account_id: uuid.UUID, settings: OrchestratorS
 
 
 def list_task_publish_jobs(task_id: uuid.UUID, limit: int, db: Session) -> list[dict[str, Any]]:
-    if not db.get(Task, task_id):
-        raise HTTPException(status_code=404, detail="task not found")
+    require_task_exists(db, task_id)
+    # Project only the columns the summary needs; meta_json can carry the full
+    # description/tags payload, so pull just its typeid_mode key server-side.
     jobs = (
-        db.query(PublishJob)
+        db.query(
+            PublishJob.id,
+            PublishJob.task_id,
+            PublishJob.batch_id,
+            PublishJob.platform,
+            PublishJob.state,
+            PublishJob.aid,
+            PublishJob.bvid,
+            PublishJob.external_id,
+            PublishJob.external_url,
+            PublishJob.account_id,
+            PublishJob.upload_progress,
+            PublishJob.upload_active,
+            PublishJob.started_at,
+            PublishJob.finished_at,
+            PublishJob.response_json,
+            PublishJob.meta_json["typeid_mode"].as_string().label("meta_typeid_mode"),
+            PublishJob.created_at,
+            PublishJob.updated_at,
+        )
         .filter(PublishJob.task_id == task_id)
         .order_by(PublishJob.created_at.desc())
         .limit(limit)
@@ -576,7 +601,7 @@ def list_task_publish_jobs(task_id: uuid.UUID, limit: int, db: Session) -> list[
         response = as_dict(job.response_json)
         typeid = as_dict(response.get("typeid"))
         ai = as_dict(typeid.get("ai"))
-        typeid_mode = str(typeid.get("mode") or as_dict(job.meta_json).get("typeid_mode") or "").strip() or None
+        typeid_mode = str(typeid.get("mode") or job.meta_typeid_mode or "").strip() or None
         selected_by = str(typeid.get("selected_by") or "").strip() or None
         tid_value = typeid.get("selected") if typeid else response.get("tid")
         try:
@@ -607,7 +632,7 @@ def list_task_publish_jobs(task_id: uuid.UUID, limit: int, db: Session) -> list[
                 "typeid_selected_by": selected_by,
                 "typeid_ai_ok": ai_ok,
                 "typeid_ai_reason": str(ai.get("reason") or "").strip() or None,
-                "error_message": publish_job_error_message(job),
+                "error_message": publish_response_error_message(response),
                 "created_at": job.created_at,
                 "updated_at": job.updated_at,
             }
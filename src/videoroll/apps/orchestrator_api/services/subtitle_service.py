@@ -20,6 +20,7 @@ from videoroll.apps.orchestrator_api.schemas import (
     SubtitleActionRequest,
 )
 from videoroll.apps.orchestrator_api.services import publishing_service, youtube_service
+from videoroll.apps.orchestrator_api.services.asset_service import require_task_exists
 from videoroll.apps.subtitle_service.auto_profile_store import get_auto_profile
 from videoroll.config import OrchestratorSettings
 from videoroll.db.models import (
@@ -223,8 +224,7 @@ def build_subtitle_job_request(
 
 
 def list_task_subtitle_jobs(task_id: uuid.UUID, *, limit: int, db: Session) -> list[SubtitleJob]:
-    if not db.get(Task, task_id):
-        raise HTTPException(status_code=404, detail="task not found")
+    require_task_exists(db, task_id)
     return (
         db.query(SubtitleJob)
         .filter(SubtitleJob.task_id == task_id)
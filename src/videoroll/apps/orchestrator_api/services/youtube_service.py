@@ -7,17 +7,21 @@ import os
 import tempfile
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
 import httpx
 from fastapi import HTTPException
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from videoroll.apps.orchestrator_api.schemas import (
     AutoYouTubeResponse,
     AutoYouTubeTaskStartResponse,
+    YouTubeDownloadAcceptedResponse,
     YouTubeDownloadActionResponse,
     YouTubeHomeScanRunResponse,
     YouTubeMetaActionResponse,
@@ -32,6 +36,7 @@ from videoroll.apps.orchestrator_api.infrastructure.internal_http import (
 from videoroll.apps.orchestrator_api.services.asset_service import (
     queue_pending_s3_delete,
     read_s3_bytes,
+    safe_unlink,
     write_s3_text,
 )
 from videoroll.apps.orchestrator_api.youtube_downloader import (
@@ -67,13 +72,17 @@ from videoroll.db.models import (
 from videoroll.db.session import get_sessionmaker
 from videoroll.storage.s3 import S3Store
 from videoroll.utils.auto_youtube import encode_auto_youtube_created_by
-from videoroll.utils.hashing import sha256_file
+from videoroll.utils.hashing import sha256_file_with_size
 from videoroll.utils.httpx_proxy import HTTPX_PROXY_KWARG_UNSUPPORTED, format_httpx_proxy_error
 from videoroll.utils.youtube_urls import canonicalize_youtube_url, is_youtube_url
 
 
 logger = logging.getLogger(__name__)
 
+# Cover conversion shells out to ffmpeg and is CPU-bound.  Run it beside the
+# video/metadata uploads instead of after them, at most one per core.
+_COVER_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="youtube-cover")
+
 
 _BROWSER_PROXY_PATHS: dict[str, set[str]] = {
     "GET": {"youtube/sources"},
@@ -362,7 +371,7 @@ def _store_failure_log(db: Session, s3: S3Store, task_id: uuid.UUID, url: str, e
     db.commit()
 
 
-def download(task_id: uuid.UUID, *, settings: OrchestratorSettings, db: Session, s3: S3Store) -> YouTubeDownloadActionResponse:
+def _require_downloadable_task(task_id: uuid.UUID, *, db: Session) -> tuple[Task, str]:
     task = db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="task not found")
@@ -371,11 +380,35 @@ def download(task_id: uuid.UUID, *, settings: OrchestratorSettings, db: Session,
         raise HTTPException(status_code=400, detail="task is not a youtube source")
     if not url or not is_youtube_url(url):
         raise HTTPException(status_code=400, detail="task.source_url is empty" if not url else "task.source_url is not a valid youtube url")
+    return task, url
+
+
+def accept_background_download(task_id: uuid.UUID, *, db: Session) -> YouTubeDownloadAcceptedResponse:
+    _require_downloadable_task(task_id, db=db)
+    return YouTubeDownloadAcceptedResponse(task_id=task_id)
+
+
+def run_background_download(task_id: uuid.UUID, *, settings: OrchestratorSettings) -> None:
+    """Run download() outside the request; failures land in the task's logs."""
+    db = get_sessionmaker(settings.database_url)()
+    try:
+        download(task_id, settings=settings, db=db, s3=S3Store(settings))
+    except HTTPException as exc:
+        logger.warning("background youtube download failed for task %s: %s", task_id, exc.detail)
+    except Exception:
+        logger.exception("background youtube download failed for task %s", task_id)
+    finally:
+        db.close()
+
+
+def download(task_id: uuid.UUID, *, settings: OrchestratorSettings, db: Session, s3: S3Store) -> YouTubeDownloadActionResponse:
+    task, url = _require_downloadable_task(task_id, db=db)
     video_asset = db.query(Asset).filter(Asset.task_id == task_id, Asset.kind == AssetKind.video_raw).order_by(Asset.created_at.desc()).first()
     uploaded_keys: list[str] = []
     root = Path(settings.work_dir) / "youtube" / str(task_id); root.mkdir(parents=True, exist_ok=True)
-    with tempfile.TemporaryDirectory(prefix="ytdlp_", dir=str(root)) as temp:
+    with tempfile.TemporaryDirectory(prefix="ytdlp_", dir=str(root)) as temp, ExitStack() as pending:
         temp_dir = Path(temp)
+        cover_future: Future[Path | None] | None = None
         try:
             yt_settings = effective_youtube_settings(settings, db, cookie_dir=temp_dir)
         except ValueError as exc:
@@ -391,7 +424,10 @@ def download(task_id: uuid.UUID, *, settings: OrchestratorSettings, db: Session,
                 except Exception:
                     db.rollback()
                 raise HTTPException(status_code=502, detail=f"youtube download failed: {exc}" + (f"\n\n{hint}" if hint else "")) from exc
-            digest = sha256_file(video_path)
+            cover_future = _COVER_POOL.submit(download_thumbnail_jpg, info, yt_settings, work_dir=temp_dir)
+            # The temp dir must outlive the conversion, even if an upload fails.
+            pending.callback(wait, [cover_future])
+            digest, video_size = sha256_file_with_size(video_path)
             key = _unique_storage_key(
                 f"raw/{task_id}/video",
                 digest,
@@ -399,9 +435,12 @@ def download(task_id: uuid.UUID, *, settings: OrchestratorSettings, db: Session,
             )
             key_was_referenced = _storage_key_is_referenced(db, key)
             s3.upload_file(video_path, key)
+            # S3 holds the only copy we need now; free the staged video before
+            # the metadata/cover steps instead of at temp dir teardown.
+            safe_unlink(video_path)
             if not key_was_referenced:
                 uploaded_keys.append(key)
-            video_asset = Asset(task_id=task_id, kind=AssetKind.video_raw, storage_key=key, sha256=digest, size_bytes=video_path.stat().st_size); db.add(video_asset)
+            video_asset = Asset(task_id=task_id, kind=AssetKind.video_raw, storage_key=key, sha256=digest, size_bytes=video_size); db.add(video_asset)
         else:
             latest = db.query(Asset).filter(Asset.task_id == task_id, Asset.kind == AssetKind.metadata_json).order_by(Asset.created_at.desc()).first()
             try:
@@ -420,9 +459,9 @@ def download(task_id: uuid.UUID, *, settings: OrchestratorSettings, db: Session,
         meta_asset = Asset(task_id=task_id, kind=AssetKind.metadata_json, storage_key=key, sha256=digest, size_bytes=len(payload)); db.add(meta_asset)
         cover_asset = None
         try:
-            cover_path = download_thumbnail_jpg(info, yt_settings, work_dir=temp_dir)
+            cover_path = cover_future.result() if cover_future is not None else download_thumbnail_jpg(info, yt_settings, work_dir=temp_dir)
             if cover_path:
-                cover_digest = sha256_file(cover_path)
+                cover_digest, cover_size = sha256_file_with_size(cover_path)
                 cover_asset = db.query(Asset).filter(Asset.task_id == task_id, Asset.kind == AssetKind.cover_image, Asset.sha256 == cover_digest).first()
                 if not cover_asset:
                     cover_key = _unique_storage_key(
@@ -434,7 +473,7 @@ def download(task_id: uuid.UUID, *, settings: OrchestratorSettings, db: Session,
                     s3.upload_file(cover_path, cover_key, content_type="image/jpeg")
                     if not key_was_referenced:
                         uploaded_keys.append(cover_key)
-                    cover_asset = Asset(task_id=task_id, kind=AssetKind.cover_image, storage_key=cover_key, sha256=cover_digest, size_bytes=cover_path.stat().st_size); db.add(cover_asset)
+                    cover_asset = Asset(task_id=task_id, kind=AssetKind.cover_image, storage_key=cover_key, sha256=cover_digest, size_bytes=cover_size); db.add(cover_asset)
         except Exception:
             cover_asset = db.query(Asset).filter(Asset.task_id == task_id, Asset.kind == AssetKind.cover_image).order_by(Asset.created_at.desc()).first()
         if task.status in {TaskStatus.created, TaskStatus.ingested}:
@@ -515,8 +554,9 @@ def run_home_scan(settings: OrchestratorSettings, *, force: bool = False, raise_
         limit = max(1, min(int(config.get("home_scan_limit") or 10), 100))
         feed = fetch_youtube_home_feed(cookies, settings.youtube_user_agent, proxy=str(config.get("proxy") or "").strip() or None, limit=limit, long_videos_only=bool(config.get("home_scan_long_videos_only")), min_duration_seconds=max(0, int(config.get("home_scan_min_duration_seconds") or 0)), timezone_name=str(os.getenv("TZ") or "UTC"))
         profile = get_auto_profile(db); auto_publish = bool(profile.get("auto_publish")); created = []; jobs = []; skipped = 0; failed = 0; errors = []
+        known_ids = set(db.scalars(select(IngestedVideo.source_id).where(IngestedVideo.platform == "youtube", IngestedVideo.source_id.in_([v.video_id for v in feed.videos])))) if feed.videos else set()
         for item in feed.videos:
-            if db.query(IngestedVideo).filter(IngestedVideo.platform == "youtube", IngestedVideo.source_id == item.video_id).first():
+            if item.video_id in known_ids:
                 skipped += 1; continue
             try:
                 task_id, deduped, _ = ingest_youtube_source(url=item.url, license=SourceLicense.authorized, proof_url=None, settings=settings)
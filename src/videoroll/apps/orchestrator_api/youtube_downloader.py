@@ -378,7 +378,10 @@ def download_thumbnail_jpg(info: dict[str, Any], settings: YouTubeDownloaderSett
         str(out_path),
     ]
     _run(cmd)
-    if not out_path.exists() or out_path.stat().st_size <= 0:
+    try:
+        if out_path.stat().st_size <= 0:
+            return None
+    except FileNotFoundError:
         return None
     return out_path
 
@@ -567,6 +570,23 @@ def extract_youtube_channel_info(
     return _as_dict(sanitized)
 
 
+def _sized_files(work_dir: Path) -> list[tuple[int, Path]]:
+    # DirEntry caches its stat result, so each file costs a single syscall.
+    out: list[tuple[int, Path]] = []
+    with os.scandir(work_dir) as it:
+        for entry in it:
+            try:
+                if entry.is_file():
+                    out.append((entry.stat().st_size, Path(entry.path)))
+            except OSError:
+                continue
+    return out
+
+
+def _largest(files: list[tuple[int, Path]]) -> Path:
+    return max(files, key=lambda item: item[0])[1]
+
+
 def _resolve_downloaded_file(info: dict[str, Any], *, work_dir: Path) -> Path:
     info_d = _as_dict(info)
     candidates: list[Path] = []
@@ -590,15 +610,13 @@ def _resolve_downloaded_file(info: dict[str, Any], *, work_dir: Path) -> Path:
 
     # Fallback: pick the largest plausible media file in work_dir.
     media_exts = {".mp4", ".mkv", ".webm", ".mov", ".flv", ".avi", ".m4v"}
-    files = [p for p in work_dir.iterdir() if p.is_file()]
-    media_files = [p for p in files if p.suffix.lower() in media_exts and not p.name.endswith(".part")]
+    files = _sized_files(work_dir)
+    media_files = [(size, p) for size, p in files if p.suffix.lower() in media_exts and not p.name.endswith(".part")]
     if media_files:
-        media_files.sort(key=lambda p: p.stat().st_size, reverse=True)
-        return media_files[0]
+        return _largest(media_files)
 
     if files:
-        files.sort(key=lambda p: p.stat().st_size, reverse=True)
-        return files[0]
+        return _largest(files)
 
     raise RuntimeError("yt-dlp download succeeded but no output file was found")
 
@@ -669,16 +687,14 @@ def _resolve_downloaded_subtitle_file(info: dict[str, Any], *, work_dir: Path, r
 
     suffix_re = re.compile(r"\.(?:srt|vtt|ass|ssa|ttml|dfxp|srv3|srv2|srv1|json3)$", re.IGNORECASE)
     lang_tokens = {requested_lang.lower(), normalized_requested.lower()}
-    files = [p for p in work_dir.iterdir() if p.is_file() and suffix_re.search(p.name)]
+    files = [(size, p) for size, p in _sized_files(work_dir) if suffix_re.search(p.name)]
     lang_matches = [
-        p for p in files if any(token and f".{token}." in p.name.lower() for token in lang_tokens)
+        (size, p) for size, p in files if any(token and f".{token}." in p.name.lower() for token in lang_tokens)
     ]
     if lang_matches:
-        lang_matches.sort(key=lambda p: p.stat().st_size, reverse=True)
-        return lang_matches[0]
+        return _largest(lang_matches)
     if files:
-        files.sort(key=lambda p: p.stat().st_size, reverse=True)
-        return files[0]
+        return _largest(files)
     raise RuntimeError("yt-dlp subtitle download succeeded but no subtitle file was found")
 
 
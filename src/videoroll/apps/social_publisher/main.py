@@ -29,8 +29,7 @@ from videoroll.apps.social_publisher.schemas import (
 )
 from videoroll.apps.social_publisher.worker import celery_app
 from videoroll.config import SocialPublisherSettings, get_social_publisher_settings
-from videoroll.db.auto_migrate import auto_migrate
-from videoroll.db.base import Base
+from videoroll.db.auto_migrate import auto_migrate, create_missing_tables
 from videoroll.db.models import Account, Platform, PublishBatch, PublishJob, PublishState, Task, TaskStatus
 from videoroll.db.session import db_session, get_engine
 
@@ -64,7 +63,7 @@ def _startup() -> None:
     settings = get_social_publisher_settings()
     app.state.internal_service_token = service_token(settings)
     engine = get_engine(settings.database_url)
-    Base.metadata.create_all(engine)
+    create_missing_tables(engine)
     auto_migrate(settings.database_url)
 
 
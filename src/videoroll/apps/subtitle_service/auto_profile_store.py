@@ -1,44 +1,53 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from sqlalchemy.orm import Session
 
-from videoroll.db.models import AppSetting
+from videoroll.db.app_setting_cache import AppSettingCache
+from videoroll.db.app_settings import get_app_setting_value, upsert_app_setting
 
 
 AUTO_PROFILE_KEY = "subtitle.auto_profile"
 
-_ALLOWED_FORMATS = {"srt", "ass"}
-_ALLOWED_ASR_ENGINES = {"auto", "mock", "faster-whisper", "openvino"}
-_ALLOWED_TRANSLATE_PROVIDERS = {"mock", "noop", "openai"}
-_ALLOWED_YOUTUBE_SUBTITLE_MODES = {"off", "target", "auto_source"}
-_ALLOWED_ASS_STYLES = {"clean_white"}
-_ALLOWED_VIDEO_CODECS = {"av1", "h264"}
-_ALLOWED_H264_PRESETS = {
-    "ultrafast",
-    "superfast",
-    "veryfast",
-    "faster",
-    "fast",
-    "medium",
-    "slow",
-    "slower",
-    "veryslow",
-    "placebo",
-}
+# The profile is read on nearly every task/publish request but changes only
+# from the settings page.  Other processes pick up edits within the TTL.
+_CACHE = AppSettingCache(ttl_seconds=30.0)
+
+_ALLOWED_FORMATS = frozenset({"srt", "ass"})
+_ALLOWED_ASR_ENGINES = frozenset({"auto", "mock", "faster-whisper", "openvino"})
+_ALLOWED_TRANSLATE_PROVIDERS = frozenset({"mock", "noop", "openai"})
+_ALLOWED_YOUTUBE_SUBTITLE_MODES = frozenset({"off", "target", "auto_source"})
+_ALLOWED_ASS_STYLES = frozenset({"clean_white"})
+_ALLOWED_VIDEO_CODECS = frozenset({"av1", "h264"})
+_ALLOWED_H264_PRESETS = frozenset(
+    {
+        "ultrafast",
+        "superfast",
+        "veryfast",
+        "faster",
+        "fast",
+        "medium",
+        "slow",
+        "slower",
+        "veryslow",
+        "placebo",
+    }
+)
 _AV1_PRESET_MIN = 0
 _AV1_PRESET_MAX = 13
-_ALLOWED_PUBLISH_TYPEID_MODES = {"ai_summary", "bilibili_predict", "meta"}
+_ALLOWED_PUBLISH_TYPEID_MODES = frozenset({"ai_summary", "bilibili_predict", "meta"})
 _VIDEO_CRF_MIN = 0
 _VIDEO_CRF_MAX = 63
 _FONT_SCALE_PERCENT_MIN = 25
 _FONT_SCALE_PERCENT_MAX = 300
 
 
-def _default_profile() -> dict[str, Any]:
-    return {
-        "formats": ["srt", "ass"],
+_DEFAULT_PROFILE: Mapping[str, Any] = MappingProxyType(
+    {
+        "formats": ("srt", "ass"),
         "burn_in": True,
         "soft_sub": False,
         "ass_style": "clean_white",
@@ -70,23 +79,35 @@ def _default_profile() -> dict[str, Any]:
         # If false, publish as "自制" (copyright=1) while keeping the original link in description.
         "publish_enable_reprint": True,
     }
+)
+
+_BOOL_FIELDS = (
+    "burn_in",
+    "soft_sub",
+    "use_intel_gpu",
+    "translate_enabled",
+    "translate_enable_summary",
+    "bilingual",
+    "auto_publish",
+    "publish_translate_title",
+    "publish_use_youtube_cover",
+    "publish_enable_reprint",
+)
+# Stripped free text; blank falls back to the default.
+_TEXT_FIELDS = ("asr_language", "target_lang", "translate_style", "publish_title_prefix")
+# Stripped text that must be one of the allowed values (case-sensitive).
+_CHOICE_FIELDS: tuple[tuple[str, frozenset[str]], ...] = (
+    ("ass_style", _ALLOWED_ASS_STYLES),
+    ("asr_engine", _ALLOWED_ASR_ENGINES),
+    ("translate_provider", _ALLOWED_TRANSLATE_PROVIDERS),
+    ("publish_typeid_mode", _ALLOWED_PUBLISH_TYPEID_MODES),
+)
 
 
 def _as_dict(v: Any) -> dict[str, Any]:
     return v if isinstance(v, dict) else {}
 
 
-def _get_row(db: Session) -> AppSetting:
-    row = db.get(AppSetting, AUTO_PROFILE_KEY)
-    if row:
-        return row
-    row = AppSetting(key=AUTO_PROFILE_KEY, value_json={})
-    db.add(row)
-    db.commit()
-    db.refresh(row)
-    return row
-
-
 def _normalize_formats(val: Any, *, fallback: list[str]) -> list[str]:
     if not isinstance(val, list):
         return fallback
@@ -158,18 +179,27 @@ def _normalize_font_scale_percent(val: Any, *, fallback: int) -> int:
 
 
 def get_auto_profile(db: Session) -> dict[str, Any]:
-    row = db.get(AppSetting, AUTO_PROFILE_KEY)
-    stored = dict(_as_dict(row.value_json)) if row else {}
-    baseline = _default_profile()
-    merged: dict[str, Any] = {**baseline, **stored}
+    profile = _CACHE.get(db, AUTO_PROFILE_KEY, lambda: _load_auto_profile(db))
+    # Callers may mutate the result; never hand out the cached containers.
+    return {**profile, "formats": list(profile["formats"])}
 
-    merged["formats"] = _normalize_formats(merged.get("formats"), fallback=baseline["formats"])
-    merged["burn_in"] = bool(merged.get("burn_in"))
-    merged["soft_sub"] = bool(merged.get("soft_sub"))
-    merged["use_intel_gpu"] = bool(merged.get("use_intel_gpu"))
 
-    ass_style = str(merged.get("ass_style") or baseline["ass_style"]).strip() or baseline["ass_style"]
-    merged["ass_style"] = ass_style if ass_style in _ALLOWED_ASS_STYLES else baseline["ass_style"]
+def _load_auto_profile(db: Session) -> dict[str, Any]:
+    stored = _as_dict(get_app_setting_value(db, AUTO_PROFILE_KEY))
+    baseline = _DEFAULT_PROFILE
+    merged: dict[str, Any] = {**baseline, **stored}
+
+    merged["formats"] = _normalize_formats(merged.get("formats"), fallback=list(baseline["formats"]))
+    for key in _BOOL_FIELDS:
+        merged[key] = bool(merged.get(key))
+    for key in _TEXT_FIELDS:
+        merged[key] = str(merged.get(key) or baseline[key]).strip() or baseline[key]
+    for key, allowed in _CHOICE_FIELDS:
+        val = merged.get(key)
+        if isinstance(val, str) and val in allowed:
+            continue
+        val = str(val or baseline[key]).strip()
+        merged[key] = val if val in allowed else baseline[key]
 
     merged["video_codec"] = _normalize_video_codec(merged.get("video_codec"), fallback=baseline["video_codec"])
     merged["video_preset"] = _normalize_video_preset(merged.get("video_preset"), codec=merged["video_codec"])
@@ -183,10 +213,6 @@ def get_auto_profile(db: Session) -> dict[str, Any]:
         fallback=baseline["secondary_font_scale_percent"],
     )
 
-    asr_engine = str(merged.get("asr_engine") or baseline["asr_engine"]).strip() or baseline["asr_engine"]
-    merged["asr_engine"] = asr_engine if asr_engine in _ALLOWED_ASR_ENGINES else baseline["asr_engine"]
-    merged["asr_language"] = str(merged.get("asr_language") or baseline["asr_language"]).strip() or baseline["asr_language"]
-
     asr_model = merged.get("asr_model")
     asr_model = str(asr_model).strip() if asr_model is not None else ""
     merged["asr_model"] = asr_model or None
@@ -198,29 +224,12 @@ def get_auto_profile(db: Session) -> dict[str, Any]:
         fallback=youtube_subtitle_mode_fallback,
     )
     merged["prefer_youtube_subtitles"] = merged["youtube_subtitle_mode"] != "off"
-    merged["translate_enabled"] = bool(merged.get("translate_enabled"))
-    provider = str(merged.get("translate_provider") or baseline["translate_provider"]).strip() or baseline["translate_provider"]
-    merged["translate_provider"] = provider if provider in _ALLOWED_TRANSLATE_PROVIDERS else baseline["translate_provider"]
-    merged["target_lang"] = str(merged.get("target_lang") or baseline["target_lang"]).strip() or baseline["target_lang"]
-    merged["translate_style"] = str(merged.get("translate_style") or baseline["translate_style"]).strip() or baseline["translate_style"]
-    merged["translate_enable_summary"] = bool(merged.get("translate_enable_summary"))
-    merged["bilingual"] = bool(merged.get("bilingual"))
-
-    merged["auto_publish"] = bool(merged.get("auto_publish"))
-    publish_typeid_mode = str(merged.get("publish_typeid_mode") or baseline["publish_typeid_mode"]).strip() or baseline["publish_typeid_mode"]
-    merged["publish_typeid_mode"] = publish_typeid_mode if publish_typeid_mode in _ALLOWED_PUBLISH_TYPEID_MODES else baseline["publish_typeid_mode"]
-    merged["publish_title_prefix"] = str(merged.get("publish_title_prefix") or baseline["publish_title_prefix"]).strip() or baseline[
-        "publish_title_prefix"
-    ]
-    merged["publish_translate_title"] = bool(merged.get("publish_translate_title"))
-    merged["publish_use_youtube_cover"] = bool(merged.get("publish_use_youtube_cover"))
-    merged["publish_enable_reprint"] = bool(merged.get("publish_enable_reprint"))
     return merged
 
 
 def update_auto_profile(db: Session, update: dict[str, Any]) -> dict[str, Any]:
-    row = _get_row(db)
-    stored = dict(_as_dict(row.value_json))
+    prev = _as_dict(get_app_setting_value(db, AUTO_PROFILE_KEY))
+    stored = dict(prev)
 
     if "formats" in update and update["formats"] is not None:
         stored["formats"] = update["formats"]
@@ -274,7 +283,9 @@ def update_auto_profile(db: Session, update: dict[str, Any]) -> dict[str, Any]:
         val = str(update["asr_model"]).strip()
         stored["asr_model"] = val or None
 
-    row.value_json = stored
-    db.add(row)
-    db.commit()
+    # Re-saving an unchanged form is common; skip the write entirely then.
+    if stored != prev:
+        upsert_app_setting(db, AUTO_PROFILE_KEY, stored)
+        db.commit()
+        _CACHE.invalidate(AUTO_PROFILE_KEY)
     return get_auto_profile(db)
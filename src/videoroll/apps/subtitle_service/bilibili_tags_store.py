@@ -1,48 +1,63 @@
 from __future__ import annotations
 
+import re
+from collections.abc import Iterable
 from typing import Any
 
 from sqlalchemy.orm import Session
 
-from videoroll.db.models import AppSetting
+from videoroll.db.app_setting_cache import AppSettingCache
+from videoroll.db.app_settings import get_app_setting_value, upsert_app_setting
+
+
+# Tags are written once by the subtitle worker and then read repeatedly while
+# building publish requests/drafts.  Keep the TTL short: the writer is usually
+# another process, so only its own cache is invalidated on write.
+_CACHE = AppSettingCache(ttl_seconds=10.0)
 
 
 def _as_dict(v: Any) -> dict[str, Any]:
     return v if isinstance(v, dict) else {}
 
 
+# Leading hash marks (ASCII or full-width) plus any whitespace, in one pass.
+_TAG_STRIP_RE = re.compile(r"^[#＃\s]+|\s+")
+
+
+def _dedupe_casefold(tags: Iterable[str]) -> list[str]:
+    # First spelling wins; dict keeps insertion order.
+    out: dict[str, str] = {}
+    for s in tags:
+        out.setdefault(s.lower(), s)
+    return list(out.values())
+
+
+def _clean_tag(t: Any) -> str:
+    return _TAG_STRIP_RE.sub("", str(t or ""))[:20]
+
+
 def _key(task_id: str) -> str:
     return f"bilibili.tags.{task_id}"
 
 
-def get_task_bilibili_tags(db: Session, task_id: str) -> list[str]:
-    row = db.get(AppSetting, _key(task_id))
-    if not row:
-        return []
-    data = _as_dict(row.value_json)
+def _load_task_bilibili_data(db: Session, key: str) -> dict[str, Any]:
+    data = _as_dict(get_app_setting_value(db, key))
     tags = data.get("tags")
-    if not isinstance(tags, list):
-        return []
-    out: list[str] = []
-    seen: set[str] = set()
-    for t in tags:
-        s = str(t or "").strip()
-        if not s:
-            continue
-        k = s.lower()
-        if k in seen:
-            continue
-        seen.add(k)
-        out.append(s)
-    return out
+    stripped = (str(t or "").strip() for t in (tags if isinstance(tags, list) else ()))
+    return {"tags": _dedupe_casefold(s for s in stripped if s), "summary": str(data.get("summary") or "").strip()}
+
+
+def _task_bilibili_data(db: Session, task_id: str) -> dict[str, Any]:
+    key = _key(task_id)
+    return _CACHE.get(db, key, lambda: _load_task_bilibili_data(db, key))
+
+
+def get_task_bilibili_tags(db: Session, task_id: str) -> list[str]:
+    return list(_task_bilibili_data(db, task_id)["tags"])
 
 
 def get_task_bilibili_summary(db: Session, task_id: str) -> str:
-    row = db.get(AppSetting, _key(task_id))
-    if not row:
-        return ""
-    data = _as_dict(row.value_json)
-    return str(data.get("summary") or "").strip()
+    return _task_bilibili_data(db, task_id)["summary"]
 
 
 def set_task_bilibili_tags(
@@ -53,31 +68,16 @@ def set_task_bilibili_tags(
     title: str | None = None,
     summary: str | None = None,
 ) -> None:
-    clean: list[str] = []
-    seen: set[str] = set()
-    for t in tags:
-        s = str(t or "").strip().lstrip("#").lstrip("＃")
-        s = "".join(s.split())
-        if not s:
-            continue
-        if len(s) > 20:
-            s = s[:20]
-        k = s.lower()
-        if k in seen:
-            continue
-        seen.add(k)
-        clean.append(s)
-
-    row = db.get(AppSetting, _key(task_id))
-    if not row:
-        row = AppSetting(key=_key(task_id), value_json={})
-        db.add(row)
+    clean = _dedupe_casefold(s for s in map(_clean_tag, tags) if s)
 
     payload: dict[str, Any] = {"tags": clean}
     if title is not None:
         payload["title"] = str(title or "").strip()
     if summary is not None:
         payload["summary"] = str(summary or "").strip()
-    row.value_json = payload
-    db.add(row)
+    key = _key(task_id)
+    if get_app_setting_value(db, key) == payload:
+        return
+    upsert_app_setting(db, key, payload)
     db.commit()
+    _CACHE.invalidate(key)
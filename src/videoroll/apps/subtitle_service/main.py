@@ -1,30 +1,35 @@
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os
 import re
 import shutil
 import tempfile
+import threading
 import time
 import uuid
 import zipfile
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
-from typing import Any, Generator
+from typing import Any, AsyncIterator, Generator
 
 import httpx
-from fastapi import Depends, FastAPI, File, Form, HTTPException, UploadFile
+from fastapi import Depends, FastAPI, File, Form, HTTPException, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import ProgrammingError
+from starlette.concurrency import run_in_threadpool
 
+from videoroll.ai.client import close_shared_openai_http_clients
 from videoroll.ai.service import AIService
 from videoroll.apps.security.service_auth import install_internal_service_auth, service_token
 from videoroll.config import SubtitleServiceSettings, get_subtitle_settings
-from videoroll.db.base import Base
-from videoroll.db.auto_migrate import auto_migrate
+from videoroll.db.auto_migrate import auto_migrate, create_missing_tables
 from videoroll.db.models import Asset, AssetKind, RenderJob, RenderJobStatus, SourceType, SubtitleJob, SubtitleJobStatus, Task, TaskStatus
-from videoroll.db.session import db_session, get_engine
+from videoroll.db.session import db_session, dispose_engine, get_engine
 from videoroll.storage.s3 import S3Store
 from videoroll.apps.subtitle_service.schemas import (
     ASRDefaultsRead,
@@ -110,10 +115,13 @@ from videoroll.apps.subtitle_service.dictionaries import (
     update_dictionary_source,
 )
 from videoroll.apps.subtitle_service.translate_settings_store import get_translate_settings, update_translate_settings
-from videoroll.apps.subtitle_service.worker_concurrency import sync_subtitle_worker_concurrency_for_task_queue_settings
+from videoroll.apps.subtitle_service.worker_concurrency import (
+    subtitle_worker_concurrency_for_task_queue_settings,
+    sync_subtitle_worker_concurrency_for_task_queue_settings,
+)
 from videoroll.apps.subtitle_service.worker import TASK_QUEUE_LOCK_OWNER, celery_app
 from videoroll.utils.auto_youtube import parse_auto_youtube_created_by
-from videoroll.utils.cpu import process_cpu_count
+from videoroll.utils.cpu import threads_per_worker
 from videoroll.utils.httpx_proxy import HTTPX_PROXY_KWARG_UNSUPPORTED, format_httpx_proxy_error
 from videoroll.utils.intel_gpu import detect_intel_hardware
 from videoroll.realtime import publish_queue_changed
@@ -122,10 +130,14 @@ logger = logging.getLogger(__name__)
 _WHISPER_MODEL_ZIP_MAX_BYTES = 20 * 1024 * 1024 * 1024
 _WHISPER_MODEL_ZIP_MAX_FILES = 100_000
 _WHISPER_MODEL_ZIP_MAX_UNCOMPRESSED_BYTES = 40 * 1024 * 1024 * 1024
+_UPLOAD_COPY_CHUNK_BYTES = 8 * 1024 * 1024
+_ZIP_EXTRACT_CHUNK_BYTES = 1024 * 1024
 
 
-def get_settings() -> SubtitleServiceSettings:
-    return get_subtitle_settings()
+def get_settings(request: Request) -> SubtitleServiceSettings:
+    # Resolved once by the lifespan; fall back for apps served without it.
+    settings = getattr(request.app.state, "settings", None)
+    return settings if settings is not None else get_subtitle_settings()
 
 
 def get_db(settings: SubtitleServiceSettings = Depends(get_settings)) -> Generator[Session, None, None]:
@@ -212,7 +224,17 @@ def _handle_knowledge_db_error(exc: Exception, settings: SubtitleServiceSettings
     raise HTTPException(status_code=500, detail=f"knowledge database error: {exc}") from exc
 
 
-_SAFE_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$")
+@lru_cache(maxsize=None)
+def _module_installed(name: str) -> bool:
+    # find_spec locates the package without executing it; cached because the
+    # answer cannot change without a restart.
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+_SAFE_NAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]{0,63}")
 
 
 class UploadTooLargeError(ValueError):
@@ -221,23 +243,53 @@ class UploadTooLargeError(ValueError):
 
 def _validate_model_name(name: str) -> str:
     name = (name or "").strip()
-    if not _SAFE_NAME_RE.match(name):
+    if not name or len(name) > 64 or not _SAFE_NAME_RE.fullmatch(name):
         raise HTTPException(status_code=400, detail="invalid model name (allowed: [A-Za-z0-9._-], max 64 chars)")
     return name
 
 
 def _dir_size_bytes(root: Path) -> int:
+    # scandir reuses the readdir buffer for type checks and avoids a Path per
+    # entry.  Like rglob, symlinked directories are not descended into, while
+    # symlinked files (HF snapshot blobs) count with their target size.
     total = 0
-    for p in root.rglob("*"):
-        if not p.is_file():
-            continue
+    stack = [str(root)]
+    while stack:
         try:
-            total += p.stat().st_size
-        except FileNotFoundError:
+            it = os.scandir(stack.pop())
+        except OSError:
             continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        total += entry.stat().st_size
+                except OSError:
+                    continue
     return total
 
 
+# path -> (top-level st_mtime_ns, size).  Models only change through the
+# download/upload/delete endpoints below, which drop their entry explicitly.
+_MODEL_SIZE_CACHE: dict[str, tuple[int, int]] = {}
+
+
+def _model_dir_size_bytes(path: Path) -> int:
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return 0
+    key = str(path)
+    cached = _MODEL_SIZE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    size = _dir_size_bytes(path)
+    _MODEL_SIZE_CACHE[key] = (mtime_ns, size)
+    return size
+
+
 def _is_safe_zip_entry_name(name: str) -> bool:
     if not name or name.startswith("/") or name.startswith("\\"):
         return False
@@ -261,80 +313,116 @@ def _safe_extract_zip(
         infos = zf.infolist()
         if len(infos) > max_files:
             raise HTTPException(status_code=413, detail=f"zip contains too many entries (max {max_files})")
+        # Validate each entry right before extracting it; anything rejected
+        # midway is discarded with tmp_dir, so dest_dir never sees a partial model.
         total_uncompressed = 0
-        for info in infos:
-            name = info.filename
-            if not name or name.endswith("/"):
-                continue
-            if not _is_safe_zip_entry_name(name):
-                raise HTTPException(status_code=400, detail=f"unsafe zip entry: {name}")
-            total_uncompressed += int(info.file_size or 0)
-            if total_uncompressed > max_uncompressed_bytes:
-                raise HTTPException(
-                    status_code=413,
-                    detail=f"zip uncompressed size too large (max {max_uncompressed_bytes} bytes)",
-                )
         try:
             tmp_dir.mkdir(parents=True, exist_ok=False)
-            zf.extractall(tmp_dir)
+            tmp_root = tmp_dir.resolve()
+            for info in infos:
+                name = info.filename
+                if not name:
+                    continue
+                if not info.is_dir():
+                    if not _is_safe_zip_entry_name(name):
+                        raise HTTPException(status_code=400, detail=f"unsafe zip entry: {name}")
+                    total_uncompressed += int(info.file_size or 0)
+                    if total_uncompressed > max_uncompressed_bytes:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"zip uncompressed size too large (max {max_uncompressed_bytes} bytes)",
+                        )
+                target = (tmp_root / name).resolve()
+                if not target.is_relative_to(tmp_root):
+                    raise HTTPException(status_code=400, detail=f"unsafe zip entry: {name}")
+                if info.is_dir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with zf.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, _ZIP_EXTRACT_CHUNK_BYTES)
             tmp_dir.rename(dest_dir)
         except Exception:
             shutil.rmtree(tmp_dir, ignore_errors=True)
             raise
 
 
-app = FastAPI(title="videoroll-subtitle-service", version="0.1.0")
+def _copy_upload_to_tempfile(file_obj: Any, *, max_bytes: int) -> Path:
+    with tempfile.NamedTemporaryFile(prefix="whisper_model_", suffix=".zip", delete=False) as tmp:
+        tmp_path = Path(tmp.name)
+        try:
+            read_bytes = 0
+            while chunk := file_obj.read(_UPLOAD_COPY_CHUNK_BYTES):
+                read_bytes += len(chunk)
+                if read_bytes > max_bytes:
+                    raise UploadTooLargeError(f"model zip too large: max {max_bytes} bytes")
+                tmp.write(chunk)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    return tmp_path
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        o.strip()
-        for o in os.getenv("CORS_ALLOW_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000").split(",")
-        if o.strip()
-    ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-install_internal_service_auth(app, get_subtitle_settings)
 
+@lru_cache(maxsize=1)
+def _cors_origins() -> tuple[str, ...]:
+    raw = os.getenv("CORS_ALLOW_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000")
+    return tuple(o for o in (part.strip() for part in raw.split(",")) if o)
 
-@app.on_event("startup")
-def _startup() -> None:
-    settings = get_subtitle_settings()
-    app.state.internal_service_token = service_token(settings)
+
+def _startup(settings: SubtitleServiceSettings) -> None:
     engine = get_engine(settings.database_url)
-    Base.metadata.create_all(engine)
+    create_missing_tables(engine)
     auto_migrate(settings.database_url)
     S3Store(settings).ensure_bucket()
     _models_dir(settings).mkdir(parents=True, exist_ok=True)
     _dictionary_imports_dir(settings).mkdir(parents=True, exist_ok=True)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    settings = get_subtitle_settings()
+    app.state.settings = settings
+    app.state.internal_service_token = service_token(settings)
+    await run_in_threadpool(_startup, settings)
+    try:
+        yield
+    finally:
+        _close_proxy_test_clients()
+        close_shared_openai_http_clients()
+        dispose_engine(settings.database_url)
+
+
+app = FastAPI(title="videoroll-subtitle-service", version="0.1.0", lifespan=lifespan)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=list(_cors_origins()),
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+install_internal_service_auth(app, get_subtitle_settings)
+
+
 @app.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
 @app.get("/subtitle/settings", response_model=WhisperSettingsRead)
-def get_subtitle_settings_view(settings: SubtitleServiceSettings = Depends(get_settings)) -> WhisperSettingsRead:
-    try:
-        import faster_whisper  # type: ignore  # noqa: F401
-
-        fw_installed = True
-    except Exception:
-        fw_installed = False
-    try:
-        import openvino_genai  # type: ignore  # noqa: F401
-
-        ov_installed = True
-    except Exception:
-        ov_installed = False
+def get_subtitle_settings_view(
+    settings: SubtitleServiceSettings = Depends(get_settings),
+    db: Session = Depends(get_db),
+) -> WhisperSettingsRead:
+    fw_installed = _module_installed("faster_whisper")
+    ov_installed = _module_installed("openvino_genai")
     cpu_threads = int(getattr(settings, "whisper_cpu_threads", 0) or 0)
     num_workers = int(getattr(settings, "whisper_num_workers", 1) or 1)
     effective_threads = cpu_threads
     if effective_threads <= 0:
-        effective_threads = process_cpu_count() or 4
+        effective_threads = threads_per_worker(
+            subtitle_worker_concurrency_for_task_queue_settings(get_task_queue_settings(db))
+        )
     effective_workers = num_workers if num_workers > 0 else 1
     return WhisperSettingsRead(
         asr_engine=settings.asr_engine,
@@ -1253,7 +1341,7 @@ def list_whisper_models(settings: SubtitleServiceSettings = Depends(get_settings
             continue
         if p.name.startswith("."):
             continue
-        out.append(WhisperModelInfo(name=p.name, path=str(p), size_bytes=_dir_size_bytes(p)))
+        out.append(WhisperModelInfo(name=p.name, path=str(p), size_bytes=_model_dir_size_bytes(p)))
     return out
 
 
@@ -1295,7 +1383,8 @@ def download_whisper_model(
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"download failed: {type(e).__name__}: {e}") from e
 
-    return WhisperModelInfo(name=name, path=str(dest), size_bytes=_dir_size_bytes(dest))
+    _MODEL_SIZE_CACHE.pop(str(dest), None)
+    return WhisperModelInfo(name=name, path=str(dest), size_bytes=_model_dir_size_bytes(dest))
 
 
 @app.post("/subtitle/models/upload", response_model=WhisperModelInfo)
@@ -1312,25 +1401,16 @@ async def upload_whisper_model(
     if dest.exists():
         raise HTTPException(status_code=400, detail="model already exists; delete it first")
 
-    max_zip_bytes = _WHISPER_MODEL_ZIP_MAX_BYTES
-    read_bytes = 0
-    with tempfile.NamedTemporaryFile(prefix="whisper_model_", suffix=".zip", delete=False) as tmp:
-        tmp_path = Path(tmp.name)
-        try:
-            while True:
-                chunk = await file.read(1024 * 1024)
-                if not chunk:
-                    break
-                read_bytes += len(chunk)
-                if read_bytes > max_zip_bytes:
-                    raise UploadTooLargeError(f"model zip too large: max {max_zip_bytes} bytes")
-                tmp.write(chunk)
-        except UploadTooLargeError as e:
-            tmp_path.unlink(missing_ok=True)
-            raise HTTPException(status_code=413, detail=str(e)) from e
+    try:
+        tmp_path = await run_in_threadpool(_copy_upload_to_tempfile, file.file, max_bytes=_WHISPER_MODEL_ZIP_MAX_BYTES)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e)) from e
 
+    # This handler is async for the streamed upload, so the extraction and the
+    # size walk must be pushed off the event loop explicitly.
     try:
-        _safe_extract_zip(
+        await run_in_threadpool(
+            _safe_extract_zip,
             tmp_path,
             dest,
             max_files=_WHISPER_MODEL_ZIP_MAX_FILES,
@@ -1344,7 +1424,9 @@ async def upload_whisper_model(
         except Exception:
             pass
 
-    return WhisperModelInfo(name=name, path=str(dest), size_bytes=_dir_size_bytes(dest))
+    _MODEL_SIZE_CACHE.pop(str(dest), None)
+    size_bytes = await run_in_threadpool(_model_dir_size_bytes, dest)
+    return WhisperModelInfo(name=name, path=str(dest), size_bytes=size_bytes)
 
 
 @app.delete("/subtitle/models/{name}")
@@ -1354,9 +1436,49 @@ def delete_whisper_model(name: str, settings: SubtitleServiceSettings = Depends(
     if not dest.exists():
         raise HTTPException(status_code=404, detail="model not found")
     shutil.rmtree(dest, ignore_errors=True)
+    _MODEL_SIZE_CACHE.pop(str(dest), None)
     return {"deleted": True}
 
 
+_PROXY_TEST_CLIENTS_MAX = 8
+_PROXY_TEST_CLIENTS: dict[str, tuple[httpx.Client, str | None]] = {}
+_PROXY_TEST_CLIENTS_LOCK = threading.Lock()
+
+
+def _proxy_test_client(proxy: str) -> tuple[httpx.Client, str | None]:
+    """Return a pooled client for ``proxy`` and the error to report, if any.
+
+    Clients are kept per proxy string so repeated probes reuse connections.
+    Evicted clients are dropped without closing them because another request
+    may still be probing through one; GC releases their connections.
+    """
+    with _PROXY_TEST_CLIENTS_LOCK:
+        cached = _PROXY_TEST_CLIENTS.get(proxy)
+        if cached is not None:
+            return cached
+        error: str | None = None
+        if proxy:
+            try:
+                client = httpx.Client(timeout=20.0, follow_redirects=True, proxy=proxy)
+            except TypeError:
+                client = httpx.Client(timeout=20.0, follow_redirects=True)
+                error = HTTPX_PROXY_KWARG_UNSUPPORTED
+        else:
+            client = httpx.Client(timeout=20.0, follow_redirects=True)
+        while len(_PROXY_TEST_CLIENTS) >= _PROXY_TEST_CLIENTS_MAX:
+            _PROXY_TEST_CLIENTS.pop(next(iter(_PROXY_TEST_CLIENTS)))
+        _PROXY_TEST_CLIENTS[proxy] = (client, error)
+        return client, error
+
+
+def _close_proxy_test_clients() -> None:
+    with _PROXY_TEST_CLIENTS_LOCK:
+        clients = [client for client, _ in _PROXY_TEST_CLIENTS.values()]
+        _PROXY_TEST_CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
 @app.post("/subtitle/models/proxy/test", response_model=ModelDownloadProxyTestResponse)
 def test_model_download_proxy(
     payload: ModelDownloadProxyTestRequest,
@@ -1372,39 +1494,18 @@ def test_model_download_proxy(
         proxy = str(cfg.get("model_download_proxy") or "").strip()
 
     start = time.perf_counter()
-    client_kwargs: dict[str, Any] = {"timeout": 20.0, "follow_redirects": True}
-    if proxy:
-        try:
-            client_kwargs["proxy"] = proxy
-        except Exception:
-            pass
-
     try:
-        try:
-            with httpx.Client(**client_kwargs) as client:
-                resp = client.get(url)
-                ok = resp.status_code < 400
-                elapsed_ms = int((time.perf_counter() - start) * 1000)
-                return ModelDownloadProxyTestResponse(
-                    ok=ok,
-                    url=url,
-                    used_proxy=proxy or None,
-                    status_code=resp.status_code,
-                    elapsed_ms=elapsed_ms,
-                )
-        except TypeError:
-            with httpx.Client(timeout=20.0, follow_redirects=True) as client:
-                resp = client.get(url)
-                ok = resp.status_code < 400
-                elapsed_ms = int((time.perf_counter() - start) * 1000)
-                return ModelDownloadProxyTestResponse(
-                    ok=ok,
-                    url=url,
-                    used_proxy=None,
-                    status_code=resp.status_code,
-                    elapsed_ms=elapsed_ms,
-                    error=HTTPX_PROXY_KWARG_UNSUPPORTED,
-                )
+        client, client_error = _proxy_test_client(proxy)
+        resp = client.get(url)
+        elapsed_ms = int((time.perf_counter() - start) * 1000)
+        return ModelDownloadProxyTestResponse(
+            ok=resp.status_code < 400,
+            url=url,
+            used_proxy=None if client_error else proxy or None,
+            status_code=resp.status_code,
+            elapsed_ms=elapsed_ms,
+            error=client_error,
+        )
     except Exception as e:
         elapsed_ms = int((time.perf_counter() - start) * 1000)
         return ModelDownloadProxyTestResponse(
@@ -1432,6 +1533,16 @@ def create_job(payload: SubtitleJobCreate, db: Session = Depends(get_db)) -> dic
     return {"job_id": str(job.id), "status": job.status.value}
 
 
+_JOB_ARTIFACT_KINDS = (
+    AssetKind.audio_wav,
+    AssetKind.segments_json,
+    AssetKind.subtitle_srt,
+    AssetKind.subtitle_ass,
+    AssetKind.video_final,
+    AssetKind.log,
+)
+
+
 @app.get("/subtitle/jobs/{job_id}", response_model=SubtitleJobRead)
 def get_job(job_id: uuid.UUID, db: Session = Depends(get_db)) -> SubtitleJobRead:
     job = db.get(SubtitleJob, job_id)
@@ -1439,20 +1550,8 @@ def get_job(job_id: uuid.UUID, db: Session = Depends(get_db)) -> SubtitleJobRead
         raise HTTPException(status_code=404, detail="job not found")
 
     artifacts = (
-        db.query(Asset)
-        .filter(
-            Asset.task_id == job.task_id,
-            Asset.kind.in_(
-                [
-                    AssetKind.audio_wav,
-                    AssetKind.segments_json,
-                    AssetKind.subtitle_srt,
-                    AssetKind.subtitle_ass,
-                    AssetKind.video_final,
-                    AssetKind.log,
-                ]
-            ),
-        )
+        db.query(Asset.kind, Asset.storage_key)
+        .filter(Asset.task_id == job.task_id, Asset.kind.in_(_JOB_ARTIFACT_KINDS))
         .order_by(Asset.created_at.asc())
         .all()
     )
@@ -1462,7 +1561,7 @@ def get_job(job_id: uuid.UUID, db: Session = Depends(get_db)) -> SubtitleJobRead
         task_id=job.task_id,
         status=job.status.value,
         progress=job.progress,
-        artifacts=[{"kind": a.kind.value, "key": a.storage_key} for a in artifacts],
+        artifacts=[{"kind": kind.value, "key": key} for kind, key in artifacts],
         logs_key=job.logs_key,
         error_message=job.error_message,
         created_at=job.created_at,
@@ -1479,6 +1578,15 @@ def _clamp_queue_limit(v: int) -> int:
     return v
 
 
+def _task_ids_with_jobs(db: Session, task_ids: list[uuid.UUID]) -> set[uuid.UUID]:
+    """Return which of ``task_ids`` have any subtitle or render job, in two queries."""
+    if not task_ids:
+        return set()
+    found = {tid for tid, in db.query(SubtitleJob.task_id).filter(SubtitleJob.task_id.in_(task_ids)).distinct()}
+    found.update(tid for tid, in db.query(RenderJob.task_id).filter(RenderJob.task_id.in_(task_ids)).distinct())
+    return found
+
+
 def _read_task_queue(db: Session, *, limit: int) -> TaskQueueRead:
     limit = _clamp_queue_limit(limit)
     cfg = get_task_queue_settings(db)
@@ -1646,31 +1754,27 @@ def _read_task_queue(db: Session, *, limit: int) -> TaskQueueRead:
     ):
         queued_task_ids.add(tid)
 
-    recoverable_pipeline_tasks: list[Task] = []
     bootstrap_cutoff = now - timedelta(seconds=60)
-    for task in (
-        db.query(Task)
-        .filter(
-            Task.source_type == SourceType.youtube,
-            Task.status.in_([TaskStatus.ingested, TaskStatus.downloaded]),
-            unlocked,
-            Task.updated_at.is_not(None),
-            Task.updated_at < bootstrap_cutoff,
-        )
-        .order_by(Task.updated_at.asc(), Task.created_at.asc())
-        .limit(5000)
-        .all()
-    ):
-        if parse_auto_youtube_created_by(task.created_by) is None:
-            continue
-        has_jobs = (
-            db.query(SubtitleJob).filter(SubtitleJob.task_id == task.id).count()
-            + db.query(RenderJob).filter(RenderJob.task_id == task.id).count()
+    pipeline_candidates = [
+        task
+        for task in (
+            db.query(Task)
+            .filter(
+                Task.source_type == SourceType.youtube,
+                Task.status.in_([TaskStatus.ingested, TaskStatus.downloaded]),
+                unlocked,
+                Task.updated_at.is_not(None),
+                Task.updated_at < bootstrap_cutoff,
+            )
+            .order_by(Task.updated_at.asc(), Task.created_at.asc())
+            .limit(5000)
+            .all()
         )
-        if has_jobs:
-            continue
-        recoverable_pipeline_tasks.append(task)
-        queued_task_ids.add(task.id)
+        if parse_auto_youtube_created_by(task.created_by) is not None
+    ]
+    tasks_with_jobs = _task_ids_with_jobs(db, [task.id for task in pipeline_candidates])
+    recoverable_pipeline_tasks = [task for task in pipeline_candidates if task.id not in tasks_with_jobs]
+    queued_task_ids.update(task.id for task in recoverable_pipeline_tasks)
 
     queued_count = len(queued_task_ids)
 
@@ -31,6 +31,11 @@ EMBEDDING_MODEL_TO_REPO: dict[str, str] = {
 
 _SUPPORTED_MODEL_DOWNLOAD_ENGINES = {"faster-whisper", "openvino", "embedding"}
 
+# CTranslate2 checkpoints only need model.bin plus the json/txt side files
+# (config, tokenizer, vocabulary, preprocessor); skip READMEs and any other
+# weights someone pushed to a mirror repo.
+_FASTER_WHISPER_ALLOW_PATTERNS = ["*.bin", "*.json", "*.txt"]
+
 
 def normalize_model_download_engine(engine: str | None) -> str:
     out = str(engine or "").strip().lower() or "faster-whisper"
@@ -105,7 +110,15 @@ def download_model_snapshot(
     tmp.mkdir(parents=True, exist_ok=True)
     try:
         try:
-            snapshot_download(repo_id=repo_id, revision=revision, local_dir=str(tmp))
+            if engine_n == "faster-whisper":
+                snapshot_download(
+                    repo_id=repo_id,
+                    revision=revision,
+                    local_dir=str(tmp),
+                    allow_patterns=_FASTER_WHISPER_ALLOW_PATTERNS,
+                )
+            else:
+                snapshot_download(repo_id=repo_id, revision=revision, local_dir=str(tmp))
         except TypeError:
             snapshot_download(repo_id=repo_id, revision=revision, local_dir=str(tmp))
         shutil.rmtree(dest, ignore_errors=True)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import inspect
+import io
 import json
 import logging
+import os
 import re
 import shutil
 import subprocess
@@ -10,16 +12,19 @@ import threading
 import time
 import unicodedata
 import wave
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import nullcontext
 from functools import lru_cache
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, TextIO
 
 import httpx
 
-from videoroll.ai.client import OpenAIChatConfig, create_openai_http_client, request_openai_json_object
+from videoroll.ai.client import OpenAIChatConfig, OpenAIStatusError, create_openai_http_client, request_openai_json_object
+from videoroll.ai.prompts import build_subtitle_translation_prompt
 from videoroll.ai.service import AIService
+from videoroll.apps.subtitle_service.translate_cache import TranslationCache, translation_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -34,9 +39,13 @@ _ASR_SILENCE_ACTIVE_THRESHOLD = 0.015
 _ASR_SILENCE_ACTIVE_RATIO_THRESHOLD = 0.0005
 _OPENVINO_PIPELINE_CACHE: dict[tuple[str, str], Any] = {}
 _OPENVINO_PIPELINE_CACHE_LOCK = threading.Lock()
+_FASTER_WHISPER_MODEL_CACHE: dict[tuple[Any, ...], Any] = {}
+_FASTER_WHISPER_MODEL_CACHE_LOCK = threading.Lock()
+# Each loaded model holds hundreds of MB to several GB; keep only the most recent few.
+_FASTER_WHISPER_MODEL_CACHE_MAX = 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Segment:
     start: float
     end: float
@@ -164,22 +173,21 @@ def _run_logged(
         interval = float(live_upload_interval_seconds or 0)
         if interval <= 0:
             interval = 3.0
-        # Keep it responsive without busy-looping.
-        tick_sleep = min(0.25, interval)
 
+        # Block in wait() between uploads: no polling wakeups, and we return
+        # as soon as ffmpeg exits instead of on the next tick.
         next_upload_at = time.monotonic() + interval
         while True:
-            rc = proc.poll()
-            now = time.monotonic()
-            if now >= next_upload_at:
-                try:
-                    live_upload_cb()
-                except Exception:
-                    pass
-                next_upload_at = now + interval
-            if rc is not None:
+            try:
+                rc = proc.wait(timeout=max(0.0, next_upload_at - time.monotonic()))
                 break
-            time.sleep(tick_sleep)
+            except subprocess.TimeoutExpired:
+                pass
+            try:
+                live_upload_cb()
+            except Exception:
+                pass
+            next_upload_at = time.monotonic() + interval
 
         try:
             live_upload_cb()
@@ -257,18 +265,13 @@ def transcribe_faster_whisper(
         logger.info("skipping faster-whisper for effectively silent audio %s", audio_path)
         return []
 
-    try:
-        from faster_whisper import WhisperModel  # type: ignore
-    except Exception as e:  # pragma: no cover
-        raise RuntimeError("faster-whisper is not installed. Rebuild with INSTALL_ASR=1.") from e
-
     lang = None if language in {"", "auto", None} else language
-    model_kwargs: dict[str, Any] = {"device": device, "compute_type": compute_type}
+    model_kwargs: dict[str, Any] = {"device": device, "compute_type": _resolve_faster_whisper_compute_type(device, compute_type)}
     if cpu_threads is not None:
         model_kwargs["cpu_threads"] = int(cpu_threads)
     if num_workers is not None:
         model_kwargs["num_workers"] = int(num_workers)
-    model = WhisperModel(model_name, **model_kwargs)
+    model = _get_faster_whisper_model(model_name, model_kwargs)
     transcribe_kwargs: dict[str, Any] = {}
     if lang is not None:
         transcribe_kwargs["language"] = lang
@@ -317,7 +320,65 @@ def transcribe_faster_whisper(
     return out
 
 
-@dataclass(frozen=True)
+def _resolve_faster_whisper_compute_type(device: str, compute_type: str) -> str:
+    """
+    Map compute_type="auto" (or empty) to the fastest quantization for the
+    device: int8_float16 on CUDA (when the GPU supports it), int8 everywhere
+    else. CTranslate2 picks AVX2/AVX-512/VNNI kernels for int8 at runtime, so
+    the CPU case needs no ISA detection here. Explicit values pass through.
+    """
+    requested = str(compute_type or "").strip().lower()
+    if requested not in {"", "auto"}:
+        return compute_type
+    dev = str(device or "").strip().lower()
+    if dev != "cuda":
+        return "int8"
+    try:
+        import ctranslate2  # type: ignore
+
+        supported = set(ctranslate2.get_supported_compute_types("cuda"))
+    except Exception:
+        supported = set()
+    for candidate in ("int8_float16", "float16"):
+        if candidate in supported:
+            return candidate
+    # Unknown support: let CTranslate2 decide.
+    return "auto"
+
+
+def _model_dir_mtime_ns(model_name: str) -> int | None:
+    try:
+        return Path(model_name).stat().st_mtime_ns
+    except (OSError, ValueError):
+        return None
+
+
+def _get_faster_whisper_model(model_name: str, model_kwargs: dict[str, Any]) -> Any:
+    try:
+        from faster_whisper import WhisperModel  # type: ignore
+    except Exception as e:  # pragma: no cover
+        raise RuntimeError("faster-whisper is not installed. Rebuild with INSTALL_ASR=1.") from e
+
+    # Local model dirs can be replaced in place (upload/download); the mtime makes that a cache miss.
+    key = (str(model_name), _model_dir_mtime_ns(model_name), *sorted(model_kwargs.items()))
+    with _FASTER_WHISPER_MODEL_CACHE_LOCK:
+        model = _FASTER_WHISPER_MODEL_CACHE.pop(key, None)
+        if model is None:
+            model = WhisperModel(model_name, **model_kwargs)
+        _FASTER_WHISPER_MODEL_CACHE[key] = model
+        while len(_FASTER_WHISPER_MODEL_CACHE) > _FASTER_WHISPER_MODEL_CACHE_MAX:
+            del _FASTER_WHISPER_MODEL_CACHE[next(iter(_FASTER_WHISPER_MODEL_CACHE))]
+    return model
+
+
+def clear_asr_model_cache() -> None:
+    with _FASTER_WHISPER_MODEL_CACHE_LOCK:
+        _FASTER_WHISPER_MODEL_CACHE.clear()
+    with _OPENVINO_PIPELINE_CACHE_LOCK:
+        _OPENVINO_PIPELINE_CACHE.clear()
+
+
+@dataclass(frozen=True, slots=True)
 class _OpenVinoChunk:
     start: float
     end: float
@@ -676,6 +737,42 @@ def translate_segments_mock(segments: Iterable[Segment], target_lang: str) -> li
     return out
 
 
+def make_bilingual(original: Iterable[Segment], translated: Iterable[Segment]) -> list[Segment]:
+    """
+    Pair each translated segment with its source line as secondary text.
+
+    Translation keeps segment order and count, so this is a plain zip over
+    results already computed; bilingual output never costs another LLM call.
+    """
+    return [
+        Segment(
+            start=tr.start,
+            end=tr.end,
+            text=tr.text,
+            confidence=tr.confidence,
+            secondary_text=str(src.text or "").strip() or None,
+        )
+        for src, tr in zip(original, translated)
+    ]
+
+
+# Upper bound on source characters per translation request (~6k tokens at
+# ~3 chars/token); long-line videos get smaller batches instead of timeouts.
+_TRANSLATE_BATCH_CHAR_BUDGET = 18_000
+# Additive increase after each clean batch once timeouts/partial replies have
+# halved the batch size; it never grows past the configured batch_size.
+_TRANSLATE_BATCH_GROWTH = 2
+# Part of the translation cache key: bump it whenever the translation prompt
+# or its response schema changes so batches cached under the old prompt stop
+# being served.
+_TRANSLATION_PROMPT_VERSION = 1
+
+
+# Subtitle lines with no letters at all (blank, numbers, punctuation, music
+# marks) are kept as-is instead of being sent for translation.
+_UNTRANSLATABLE_TEXT_RE = re.compile(r"[\W\d_]*")
+
+
 def translate_segments_openai_with_summary(
     segments: Iterable[Segment],
     target_lang: str,
@@ -693,6 +790,8 @@ def translate_segments_openai_with_summary(
     initial_summary: str = "",
     on_batch_done: Callable[[list[Segment], str, int], None] | None = None,
     ai_service: AIService | None = None,
+    concurrency: int = 1,
+    cache: TranslationCache | None = None,
 ) -> tuple[list[Segment], str]:
     segs = list(segments)
     if not segs:
@@ -715,7 +814,20 @@ def translate_segments_openai_with_summary(
     tgt = (target_lang or "zh").strip() or "zh"
     tone = (style or "").strip() or "口语自然"
     batch_size = max(1, int(batch_size))
-    system_prompt = "You are a professional subtitle translator. Return ONLY valid JSON (no markdown, no code fences, no extra text)."
+
+    # Cache entries are whole batch responses keyed on the exact request
+    # payload (blocks, summary, glossary, RAG context), so a hit is only ever
+    # reused where the model would have seen identical input.
+    cache_model = ""
+    if cache is not None:
+        if cfg is not None:
+            runtime_cfg = cfg
+        else:
+            assert ai_service is not None
+            runtime_cfg = ai_service.resolve_current_runtime("subtitle_translation").config
+        cache_model = (
+            f"v{_TRANSLATION_PROMPT_VERSION}|{runtime_cfg.base_url}|{runtime_cfg.model}|{runtime_cfg.temperature}"
+        )
 
     def _client() -> httpx.Client:
         assert cfg is not None
@@ -726,59 +838,83 @@ def translate_segments_openai_with_summary(
             super().__init__(message)
             self.translated_prefix = translated_prefix
 
-    def _translate_batch(client: httpx.Client | None, batch: list[Segment], *, start_idx: int, summary: str) -> tuple[list[Segment], str]:
-        blocks = [{"idx": start_idx + i + 1, "text": s.text} for i, s in enumerate(batch)]
+    def _rag_context_for(batch: list[Segment], start_idx: int, summary: str) -> dict[str, Any] | None:
+        if rag_context_provider is None:
+            return None
+        return rag_context_provider(batch, start_idx, summary) or None
+
+    def _translate_batch(
+        client: httpx.Client | None,
+        batch: list[Segment],
+        *,
+        start_idx: int,
+        summary: str,
+        rag_context: dict[str, Any] | None,
+    ) -> tuple[list[Segment], str]:
+        # Only distinct, translatable texts go to the model: blank, numeric or
+        # punctuation-only lines pass through, and repeats reuse the first
+        # occurrence's translation.
+        blocks: list[dict[str, Any]] = []
+        passthrough: dict[int, str] = {}
+        repeats: dict[int, int] = {}
+        first_idx_by_text: dict[str, int] = {}
+        for i, s in enumerate(batch):
+            idx = start_idx + i + 1
+            text = s.text.strip()
+            if _UNTRANSLATABLE_TEXT_RE.fullmatch(text):
+                passthrough[idx] = text
+            elif text in first_idx_by_text:
+                repeats[idx] = first_idx_by_text[text]
+            else:
+                first_idx_by_text[text] = idx
+                blocks.append({"idx": idx, "text": s.text})
         payload_in: dict[str, Any] = {"target_lang": tgt, "style": tone, "blocks": blocks}
         if enable_summary:
             payload_in["summary"] = summary
         if glossary:
             payload_in["glossary"] = glossary
-        if rag_context_provider is not None:
-            rag_context = rag_context_provider(batch, start_idx, summary)
-            if rag_context:
-                payload_in["rag_context"] = rag_context
-
-        if ai_service is not None:
-            data = ai_service.translate_subtitle_batch(
-                blocks=blocks,
-                target_lang=tgt,
-                style=tone,
-                summary=summary,
-                enable_summary=enable_summary,
-                glossary=glossary,
-                rag_context=payload_in.get("rag_context") if isinstance(payload_in.get("rag_context"), dict) else None,
-                network_retries=3,
-            )
-        else:
-            assert cfg is not None
-            assert client is not None
-            user_prompt = (
-                "你将收到一批字幕 block。请按 block 为单位翻译。\n"
-                "要求：\n"
-                "- 保留每个 block 的 idx 不变；不得增删 block，不得改变顺序；\n"
-                "- 只翻译 text 字段；同一 block 内多行先合并理解再翻译；\n"
-                "- 术语、人名保持一致；数字/单位尽量保留原格式；\n"
-                "- 如果输入包含 rag_context，请优先参考其中的 term_cards/knowledge_cards 来理解专有名词、梗、作品设定和技术背景；\n"
-                "- term_cards 中的 translation 是推荐译法，除非明显不符合当前上下文，否则保持一致；\n"
-                "- rag_context 来自主 agent 对当前 block 的本地 RAG/词典预检和必要研究；如果其中已有与当前 block 和 summary 贴切的译法或解释，直接据此翻译，不要假设还必须继续搜索；\n"
-                "- 输出必须是 JSON 对象，且必须包含 translations 数组；不要输出任何解释。\n"
-                f"- 目标语言：{tgt}\n"
-                f"- 风格：{tone}\n\n"
-                "如果输入里带 summary，请在翻译时参考它保持前后一致，并输出 updated_summary（<= 500 字符）。\n\n"
-                "输入 JSON：\n"
-                f"{json.dumps(payload_in, ensure_ascii=False)}\n\n"
-                "输出 JSON 结构（必须严格遵守）：\n"
-                '{ "updated_summary": "...", "translations": [ {"idx": 1, "text": "..."}, ... ] }'
-            )
-            data = request_openai_json_object(
-                config=cfg,
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                client=client,
-                format_retry_notice="注意：上一次输出不符合 JSON/结构要求，请严格按 JSON 输出。",
-                format_retries=2,
-                network_retries=3,
-            )
+        if rag_context:
+            payload_in["rag_context"] = rag_context
+
+        cache_key = translation_cache_key(cache_model, payload_in) if cache is not None and blocks else None
+        data = cache.get(cache_key) if cache is not None and cache_key is not None else None
+        cache_hit = data is not None
+        if data is None:
+            if not blocks:
+                data = {"translations": []}
+            elif ai_service is not None:
+                data = ai_service.translate_subtitle_batch(
+                    blocks=blocks,
+                    target_lang=tgt,
+                    style=tone,
+                    summary=summary,
+                    enable_summary=enable_summary,
+                    glossary=glossary,
+                    rag_context=rag_context,
+                    network_retries=3,
+                )
+            else:
+                assert cfg is not None
+                assert client is not None
+                prompt = build_subtitle_translation_prompt(
+                    blocks=blocks,
+                    target_lang=tgt,
+                    style=tone,
+                    summary=summary,
+                    enable_summary=enable_summary,
+                    glossary=glossary,
+                    rag_context=rag_context,
+                    network_retries=3,
+                )
+                data = request_openai_json_object(
+                    config=cfg,
+                    system_prompt=prompt.system_prompt,
+                    user_prompt=prompt.user_prompt,
+                    client=client,
+                    format_retry_notice=prompt.format_retry_notice,
+                    format_retries=prompt.format_retries,
+                    network_retries=prompt.network_retries,
+                )
 
         translations = data.get("translations")
         if not isinstance(translations, list):
@@ -798,6 +934,10 @@ def translate_segments_openai_with_summary(
 
         expected = [b["idx"] for b in blocks]
         missing = [i for i in expected if i not in mapping]
+        mapping.update(passthrough)
+        for idx, first_idx in repeats.items():
+            if first_idx in mapping:
+                mapping[idx] = mapping[first_idx]
         if missing:
             partial_prefix: list[Segment] = []
             for i, orig in enumerate(batch):
@@ -835,21 +975,82 @@ def translate_segments_openai_with_summary(
                     confidence=orig.confidence,
                 )
             )
+        if cache is not None and cache_key is not None and not cache_hit:
+            cache.put(
+                cache_key,
+                {
+                    "updated_summary": updated_summary,
+                    "translations": [{"idx": i, "text": mapping[i]} for i in expected],
+                },
+            )
         return out_batch, updated_summary
 
+    def _batch_end(start: int, size: int) -> int:
+        end = min(len(segs), start + size)
+        chars = 0
+        for j in range(start, end):
+            chars += len(segs[j].text)
+            if chars > _TRANSLATE_BATCH_CHAR_BUDGET and j > start:
+                return j
+        return end
+
+    def _translate_concurrently(client: httpx.Client | None, idx: int) -> int:
+        # Without the running summary the batches are independent, so they can
+        # be in flight together. RAG lookups share the caller's DB session and
+        # stay on this thread; results are consumed in order so checkpoints
+        # remain a contiguous prefix. The first failure hands the remainder
+        # back to the sequential loop and its batch-halving fallbacks, unless
+        # the endpoint rejected the request outright (bad key/URL/model).
+        bounds: list[tuple[int, int]] = []
+        start = idx
+        while start < len(segs):
+            end = _batch_end(start, batch_size)
+            bounds.append((start, end))
+            start = end
+        with ThreadPoolExecutor(max_workers=min(workers, len(bounds)), thread_name_prefix="translate") as pool:
+            futures: list[Future[tuple[list[Segment], str]]] = []
+            for start, end in bounds:
+                batch = segs[start:end]
+                rag_context = _rag_context_for(batch, start, "")
+                futures.append(pool.submit(_translate_batch, client, batch, start_idx=start, summary="", rag_context=rag_context))
+            for future in futures:
+                try:
+                    translated, _ = future.result()
+                except Exception as e:
+                    for pending in futures:
+                        pending.cancel()
+                    if isinstance(e, OpenAIStatusError) and not e.retryable:
+                        raise
+                    break
+                out.extend(translated)
+                idx += len(translated)
+                if on_batch_done is not None:
+                    on_batch_done(translated, "", idx)
+        return idx
+
     summary = str(initial_summary or "").strip()[:500] if enable_summary else ""
     out: list[Segment] = list(resumed)
     cur_batch_size = batch_size
     idx = len(out)
+    workers = max(1, int(concurrency or 1))
     client_context = _client() if ai_service is None else nullcontext(None)
     with client_context as client:
+        if workers > 1 and not enable_summary and idx < len(segs):
+            idx = _translate_concurrently(client, idx)
         while idx < len(segs):
-            size = min(cur_batch_size, len(segs) - idx)
+            size = _batch_end(idx, cur_batch_size) - idx
             batch = segs[idx : idx + size]
             try:
-                translated, summary = _translate_batch(client, batch, start_idx=idx, summary=summary)
+                translated, summary = _translate_batch(
+                    client,
+                    batch,
+                    start_idx=idx,
+                    summary=summary,
+                    rag_context=_rag_context_for(batch, idx, summary),
+                )
                 out.extend(translated)
                 idx += size
+                cur_batch_size = min(batch_size, cur_batch_size + _TRANSLATE_BATCH_GROWTH)
                 if on_batch_done is not None:
                     on_batch_done(translated, summary, idx)
             except _PartialBatchTranslationError as e:
@@ -912,18 +1113,40 @@ def _srt_ts(seconds: float) -> str:
     return f"{h:02}:{m:02}:{s:02},{ms:03}"
 
 
-def segments_to_srt(segments: Iterable[Segment]) -> str:
-    lines: list[str] = []
+# Large write buffer for subtitle files: long videos produce thousands of cues.
+_SUBTITLE_WRITE_BUFFER_BYTES = 1 << 20
+
+
+def _render_srt(out: TextIO, segments: Iterable[Segment]) -> None:
+    write = out.write
+    ts = _srt_ts
+    sep = ""
     for idx, seg in enumerate(segments, start=1):
-        lines.append(str(idx))
-        lines.append(f"{_srt_ts(seg.start)} --> {_srt_ts(seg.end)}")
         body = seg.text.strip()
         secondary = str(seg.secondary_text or "").strip()
         if secondary:
             body = f"{body}\n{secondary}" if body else secondary
-        lines.append(body)
-        lines.append("")
-    return "\n".join(lines).strip() + "\n"
+        write(f"{sep}{idx}\n{ts(seg.start)} --> {ts(seg.end)}")
+        if body:
+            write(f"\n{body}")
+            sep = "\n\n"
+        else:
+            # Keep the empty body line between cues, but no trailing blank lines at the end.
+            sep = "\n\n\n"
+    write("\n")
+
+
+def segments_to_srt(segments: Iterable[Segment]) -> str:
+    buf = io.StringIO()
+    _render_srt(buf, segments)
+    return buf.getvalue()
+
+
+def write_srt(path: Path, segments: Iterable[Segment]) -> None:
+    """Stream segments to an SRT file without building the whole document in memory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="\n", buffering=_SUBTITLE_WRITE_BUFFER_BYTES) as f:
+        _render_srt(f, segments)
 
 
 _SRT_TIME_RE = re.compile(r"(?P<start>\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(?P<end>\d{2}:\d{2}:\d{2},\d{3})")
@@ -1158,6 +1381,38 @@ def segments_to_ass(
     primary_font_scale_percent: int | float = 100,
     secondary_font_scale_percent: int | float = 100,
 ) -> str:
+    buf = io.StringIO()
+    _render_ass(
+        buf,
+        segments,
+        style_name,
+        play_res_x=play_res_x,
+        play_res_y=play_res_y,
+        secondary_line_scale=secondary_line_scale,
+        primary_font_scale_percent=primary_font_scale_percent,
+        secondary_font_scale_percent=secondary_font_scale_percent,
+    )
+    return buf.getvalue()
+
+
+def write_ass(path: Path, segments: Iterable[Segment], style_name: str = "clean_white", **kwargs: Any) -> None:
+    """Stream segments to an ASS file; keyword arguments are those of segments_to_ass()."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="\n", buffering=_SUBTITLE_WRITE_BUFFER_BYTES) as f:
+        _render_ass(f, segments, style_name, **kwargs)
+
+
+def _render_ass(
+    out: TextIO,
+    segments: Iterable[Segment],
+    style_name: str = "clean_white",
+    *,
+    play_res_x: int = 1920,
+    play_res_y: int = 1080,
+    secondary_line_scale: float | None = None,
+    primary_font_scale_percent: int | float = 100,
+    secondary_font_scale_percent: int | float = 100,
+) -> None:
     if style_name not in {"clean_white"}:
         style_name = "clean_white"
 
@@ -1201,7 +1456,25 @@ def segments_to_ass(
             f"0,0,0,0,100,100,0,0,1,{secondary_outline},0,2,{margin_x},{margin_x},{margin_v},1"
         )
 
-    events: list[str] = []
+    header = [
+        "[Script Info]",
+        "ScriptType: v4.00+",
+        f"PlayResX: {play_res_x}",
+        f"PlayResY: {play_res_y}",
+        "WrapStyle: 2",
+        "ScaledBorderAndShadow: yes",
+        "",
+        "[V4+ Styles]",
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding",
+        style_default,
+        *( [style_secondary] if style_secondary else [] ),
+        "",
+        "[Events]",
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+    ]
+    write = out.write
+    write("\n".join(header))
+    write("\n")
     for seg in segments:
         text = _wrap_ass_text(
             seg.text,
@@ -1211,28 +1484,15 @@ def segments_to_ass(
         ).strip()
         if not text:
             continue
-        events.append(f"Dialogue: 0,{_ass_ts(seg.start)},{_ass_ts(seg.end)},Default,,0,0,0,,{text}")
+        write(f"Dialogue: 0,{_ass_ts(seg.start)},{_ass_ts(seg.end)},Default,,0,0,0,,{text}\n")
 
-    return "\n".join(
-        [
-            "[Script Info]",
-            "ScriptType: v4.00+",
-            f"PlayResX: {play_res_x}",
-            f"PlayResY: {play_res_y}",
-            "WrapStyle: 2",
-            "ScaledBorderAndShadow: yes",
-            "",
-            "[V4+ Styles]",
-            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding",
-            style_default,
-            *( [style_secondary] if style_secondary else [] ),
-            "",
-            "[Events]",
-            "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
-            *events,
-            "",
-        ]
-    )
+
+def _available_cpus() -> int:
+    # Honours cpuset limits (containers), unlike os.cpu_count().
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
 
 
 def render_burn_in(
@@ -1252,7 +1512,8 @@ def render_burn_in(
     output_path.parent.mkdir(parents=True, exist_ok=True)
     codec = str(video_codec or "").strip().lower() or "av1"
     ass_filter = f"ass={str(ass_path).replace(':', r'\:')}"
-    cmd = [ffmpeg_path, "-y"]
+    cpus = _available_cpus()
+    cmd = [ffmpeg_path, "-y", "-filter_threads", str(cpus)]
     intel_h264_preset_quality = {
         "placebo": 1,
         "veryslow": 1,
@@ -1335,6 +1596,8 @@ def render_burn_in(
             preset_n = None
         effective_preset_n = 4 if preset_n is None else max(0, min(13, preset_n))
         video_args = ["-c:v", "libsvtav1", "-preset", str(effective_preset_n), "-crf", str(effective_crf)]
+        # SVT-AV1 sizes its thread pool from the host core count; pin it to the cores we may actually use.
+        video_args.extend(["-svtav1-params", f"lp={cpus}"])
         filter_arg = ass_filter
 
     cmd.extend(
@@ -1386,6 +1649,12 @@ def mux_soft_sub(
     _run_logged(cmd, log_path=log_path, live_upload_cb=live_upload_cb)
 
 
-def write_json(path: Path, data: Any) -> None:
+def write_json(path: Path, data: Any, *, compact: bool = False) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if compact:
+        # Internal files only: compact output keeps json on its C encoder,
+        # while indent= falls back to the much slower pure-Python one.
+        path.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        return
+    # Segment files are user-visible artifacts, so keep them readable.
     path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
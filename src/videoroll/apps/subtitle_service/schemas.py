@@ -78,7 +78,7 @@ class WhisperSettingsRead(BaseModel):
     whisper_model: str
     whisper_model_dir: str
     whisper_device: str
-    whisper_compute_type: str
+    whisper_compute_type: str = Field(description="CTranslate2 compute type；auto = CUDA 用 int8_float16，CPU 用 int8")
     openvino_model: str
     openvino_device: str
     openvino_num_beams: int = 1
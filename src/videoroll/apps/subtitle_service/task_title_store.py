@@ -6,23 +6,28 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
-from videoroll.db.models import AppSetting, Asset, AssetKind
+from videoroll.db.app_setting_cache import AppSettingCache
+from videoroll.db.app_settings import get_app_setting_value, upsert_app_setting
+from videoroll.db.models import Asset, AssetKind
 from videoroll.storage.s3 import S3Store
 
 
+# Task lists and detail pages poll display titles; titles rarely change after
+# the subtitle worker writes them (from another process, hence the short TTL).
+_CACHE = AppSettingCache(ttl_seconds=2.0)
+_KEY_PREFIX = "task.title."
+
+
 def _as_dict(v: Any) -> dict[str, Any]:
     return v if isinstance(v, dict) else {}
 
 
 def _key(task_id: str) -> str:
-    return f"task.title.{task_id}"
+    return _KEY_PREFIX + str(task_id)
 
 
-def get_task_titles(db: Session, task_id: str) -> dict[str, str]:
-    row = db.get(AppSetting, _key(task_id))
-    if not row:
-        return {}
-    data = _as_dict(row.value_json)
+def _load_task_titles(db: Session, key: str) -> dict[str, str]:
+    data = _as_dict(get_app_setting_value(db, key))
     out: dict[str, str] = {}
     for k in ["source_title", "translated_title"]:
         v = data.get(k)
@@ -31,6 +36,11 @@ def get_task_titles(db: Session, task_id: str) -> dict[str, str]:
     return out
 
 
+def get_task_titles(db: Session, task_id: str) -> dict[str, str]:
+    key = _key(task_id)
+    return dict(_CACHE.get(db, key, lambda: _load_task_titles(db, key)))
+
+
 def get_task_display_title(db: Session, task_id: str) -> str:
     return get_task_display_title_with_s3(db, task_id, s3=None)
 
@@ -81,17 +91,22 @@ def set_task_titles(
     *,
     source_title: str | None = None,
     translated_title: str | None = None,
+    commit: bool = True,
 ) -> None:
-    row = db.get(AppSetting, _key(task_id))
-    if not row:
-        row = AppSetting(key=_key(task_id), value_json={})
-        db.add(row)
-
-    data = dict(_as_dict(row.value_json))
+    """Merge the given titles into the task's title row (one upsert; skipped when unchanged).
+
+    With commit=False the write joins the caller's transaction.
+    """
+    key = _key(task_id)
+    stored = get_app_setting_value(db, key)
+    prev = _as_dict(stored)
+    data = dict(prev)
     if source_title is not None:
         data["source_title"] = str(source_title or "").strip()
     if translated_title is not None:
         data["translated_title"] = str(translated_title or "").strip()
-    row.value_json = data
-    db.add(row)
-    db.commit()
+    if stored is None or data != prev:
+        upsert_app_setting(db, key, data)
+    if commit:
+        db.commit()
+    _CACHE.invalidate(key)
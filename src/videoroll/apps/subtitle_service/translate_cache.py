@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE_SECONDS = 90 * 24 * 3600
+
+
+def translation_cache_key(*parts: Any) -> str:
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class TranslationCache:
+    """
+    On-disk cache of translation responses, shared by every worker process on
+    the host through one SQLite file in WAL mode.
+
+    Lookups and writes never raise: a broken cache only costs a cache miss.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=5.0, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at INTEGER NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_updated_at ON cache (updated_at)")
+            self._conn.execute("DELETE FROM cache WHERE updated_at < ?", (int(time.time()) - _MAX_AGE_SECONDS,))
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+            value = json.loads(row[0]) if row else None
+        except Exception as e:
+            logger.warning("translate cache lookup failed: %s", e)
+            return None
+        return value if isinstance(value, dict) else None
+
+    def put(self, key: str, value: dict[str, Any]) -> None:
+        try:
+            raw = json.dumps(value, ensure_ascii=False)
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, updated_at) VALUES (?, ?, ?)",
+                    (key, raw, int(time.time())),
+                )
+        except Exception as e:
+            logger.warning("translate cache write failed: %s", e)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_translation_cache(path: str | Path | None) -> TranslationCache | None:
+    if not path:
+        return None
+    try:
+        return TranslationCache(Path(path))
+    except Exception as e:
+        logger.warning("translate cache disabled: %s", e)
+        return None
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from functools import lru_cache
 from typing import Any
 
 from sqlalchemy.orm import Session
 
 from videoroll.config import SubtitleServiceSettings
-from videoroll.db.models import AppSetting
+from videoroll.db.app_setting_cache import AppSettingCache
+from videoroll.db.app_settings import get_app_setting_value, upsert_app_setting
 from videoroll.utils.fernet import decrypt_str, encrypt_str
 from videoroll.utils.openai_compat import normalize_openai_base_url
 
@@ -13,6 +16,14 @@ from videoroll.utils.openai_compat import normalize_openai_base_url
 TRANSLATE_SETTINGS_KEY = "subtitle.translate"
 _SEARXNG_TIME_RANGES = {"", "day", "month", "year"}
 
+# Read by every AI-backed request (translation, publish metadata, tags) but
+# only written from the settings page.  The cached state holds the decrypted
+# keys so a hit skips both the row lookup and the Fernet work; other
+# processes pick up edits within the TTL.  The whole value_json blob is
+# fetched (a few hundred bytes, once per TTL): the update path needs all of
+# it, and projecting JSONB subkeys server-side would not save a round trip.
+_CACHE = AppSettingCache(ttl_seconds=10.0)
+
 
 def _clean_csv(value: Any, *, default: str = "", limit: int = 20) -> str:
     raw_items = str(value or default or "").replace("\n", ",").split(",")
@@ -44,42 +55,118 @@ def _clean_search_time_range(value: Any) -> str:
     return clean if clean in _SEARXNG_TIME_RANGES else ""
 
 
-def _get_row(db: Session) -> AppSetting:
-    row = db.get(AppSetting, TRANSLATE_SETTINGS_KEY)
-    if row:
-        return row
-    row = AppSetting(key=TRANSLATE_SETTINGS_KEY, value_json={})
-    db.add(row)
-    db.commit()
-    db.refresh(row)
-    return row
+def _clamped_int(value: Any, lo: int, hi: int | None, fallback: Any) -> Any:
+    """Clamp ``value`` as an int; unparsable values yield ``fallback`` as-is."""
+    # Stored values are almost always ints already; only parse the rest.
+    if type(value) is not int:
+        try:
+            value = int(value)
+        except (TypeError, ValueError, OverflowError):
+            return fallback
+    value = max(lo, value)
+    return value if hi is None else min(hi, value)
+
+
+def _clamped_float(value: Any, lo: float, hi: float, fallback: Any) -> Any:
+    """Clamp ``value`` as a float; unparsable values yield ``fallback`` as-is."""
+    if type(value) is not float:
+        try:
+            value = float(value)
+        except (TypeError, ValueError, OverflowError):
+            return fallback
+    return max(lo, min(hi, value))
 
 
 def _as_dict(v: Any) -> dict[str, Any]:
     return v if isinstance(v, dict) else {}
 
 
+@lru_cache(maxsize=32)
+def _decrypt_cached(token: str) -> str:
+    # Ciphertexts only change when a key is rotated, so TTL refreshes of the
+    # settings row reuse the plaintext instead of re-running Fernet.
+    return decrypt_str(token)
+
+
+def _decrypt_or_empty(value: Any) -> str:
+    if not isinstance(value, str) or not value.strip():
+        return ""
+    try:
+        return _decrypt_cached(value)
+    except Exception:
+        return ""
+
+
+def _normalize_stored_base_urls(stored: dict[str, Any]) -> None:
+    # Writes already normalize these; this only catches rows edited by hand or
+    # written by older code, so reads can use the stored URL as-is.
+    for section_key in ("openai", "rag_embedding_openai"):
+        section = _as_dict(stored.get(section_key))
+        base_url = section.get("base_url")
+        if base_url:
+            normalized = normalize_openai_base_url(str(base_url))
+            if normalized != base_url:
+                stored[section_key] = {**section, "base_url": normalized}
+
+
+def _load_translate_settings_state(db: Session) -> tuple[dict[str, Any], str, str]:
+    # value_json is freshly decoded per query, so it is ours to normalize in place.
+    stored = _as_dict(get_app_setting_value(db, TRANSLATE_SETTINGS_KEY))
+    _normalize_stored_base_urls(stored)
+    api_key = _decrypt_or_empty(_as_dict(stored.get("openai")).get("api_key_enc"))
+    embedding_api_key = _decrypt_or_empty(_as_dict(stored.get("rag_embedding_openai")).get("api_key_enc"))
+    return stored, api_key, embedding_api_key
+
+
+def invalidate_translate_settings_cache() -> None:
+    """Drop this process's cached translate settings (call after writing the row directly)."""
+    _CACHE.invalidate(TRANSLATE_SETTINGS_KEY)
+
+
 def get_translate_settings(db: Session, defaults: SubtitleServiceSettings) -> dict[str, Any]:
-    row = db.get(AppSetting, TRANSLATE_SETTINGS_KEY)
-    stored = dict(_as_dict(row.value_json)) if row else {}
+    # The cached state is shared; it is only read here and every call builds a fresh dict.
+    stored, api_key, embedding_api_key = _CACHE.get(
+        db, TRANSLATE_SETTINGS_KEY, lambda: _load_translate_settings_state(db)
+    )
+    return _project_translate_settings(stored, api_key, embedding_api_key, defaults)
+
+
+# (defaults object, values derived from it).  Callers pass the process-wide
+# settings singleton, so one slot is enough; identity keeps it exact.
+_DERIVED_DEFAULTS: tuple[SubtitleServiceSettings, dict[str, str]] | None = None
+
+
+def _derived_defaults(defaults: SubtitleServiceSettings) -> dict[str, str]:
+    """Normalized/cleaned forms of the env defaults, memoized per settings object."""
+    global _DERIVED_DEFAULTS
+    cached = _DERIVED_DEFAULTS
+    if cached is not None and cached[0] is defaults:
+        return cached[1]
+    derived = {
+        "openai_base_url": normalize_openai_base_url(str(defaults.openai_base_url)),
+        "rag_embedding_base_url": normalize_openai_base_url(str(defaults.rag_embedding_base_url or "").strip()),
+        "rag_search_categories": _clean_csv(None, default=defaults.rag_search_categories or "general"),
+        "rag_search_engines": _clean_csv(None, default=defaults.rag_search_engines or ""),
+        "rag_search_fallback_engines": _clean_csv(None, default=defaults.rag_search_fallback_engines or "bing,baidu"),
+        "rag_search_language": _clean_search_language(None, default=defaults.rag_search_language or "all"),
+    }
+    _DERIVED_DEFAULTS = (defaults, derived)
+    return derived
 
+
+def _project_translate_settings(
+    stored: dict[str, Any], api_key: str, embedding_api_key: str, defaults: SubtitleServiceSettings
+) -> dict[str, Any]:
     openai = _as_dict(stored.get("openai"))
-    api_key = ""
-    api_key_enc = openai.get("api_key_enc")
-    if isinstance(api_key_enc, str) and api_key_enc.strip():
-        try:
-            api_key = decrypt_str(api_key_enc)
-        except Exception:
-            api_key = ""
     embedding_openai = _as_dict(stored.get("rag_embedding_openai"))
-    embedding_api_key = ""
-    embedding_api_key_enc = embedding_openai.get("api_key_enc")
-    if isinstance(embedding_api_key_enc, str) and embedding_api_key_enc.strip():
-        try:
-            embedding_api_key = decrypt_str(embedding_api_key_enc)
-        except Exception:
-            embedding_api_key = ""
-    default_embedding_base_url = str(defaults.rag_embedding_base_url or "").strip()
+    derived = _derived_defaults(defaults)
+    # Stored URLs are normalized on write (and on load for legacy rows); only defaults need it here.
+    openai_base_url = openai.get("base_url")
+    embedding_base_url = embedding_openai.get("base_url")
+    search_categories = stored.get("rag_search_categories")
+    search_engines = stored.get("rag_search_engines")
+    search_fallback_engines = stored.get("rag_search_fallback_engines")
+    search_language = stored.get("rag_search_language")
 
     return {
         "default_provider": str(stored.get("default_provider") or defaults.translate_default_provider),
@@ -92,7 +179,7 @@ def get_translate_settings(db: Session, defaults: SubtitleServiceSettings) -> di
         ),
         "openai_api_key": api_key,
         "openai_api_key_set": bool(api_key),
-        "openai_base_url": normalize_openai_base_url(str(openai.get("base_url") or defaults.openai_base_url)),
+        "openai_base_url": str(openai_base_url) if openai_base_url else derived["openai_base_url"],
         "openai_model": str(openai.get("model") or defaults.openai_model),
         "openai_temperature": float(openai.get("temperature") or defaults.openai_temperature),
         "openai_timeout_seconds": float(openai.get("timeout_seconds") or defaults.openai_timeout_seconds),
@@ -107,7 +194,7 @@ def get_translate_settings(db: Session, defaults: SubtitleServiceSettings) -> di
         "rag_embedding_device": str(stored.get("rag_embedding_device") or defaults.rag_embedding_device),
         "rag_embedding_api_key": embedding_api_key or str(defaults.rag_embedding_api_key or ""),
         "rag_embedding_api_key_set": bool(embedding_api_key),
-        "rag_embedding_base_url": normalize_openai_base_url(str(embedding_openai.get("base_url") or default_embedding_base_url)),
+        "rag_embedding_base_url": str(embedding_base_url) if embedding_base_url else derived["rag_embedding_base_url"],
         "rag_embedding_timeout_seconds": float(
             embedding_openai.get("timeout_seconds")
             or stored.get("rag_embedding_timeout_seconds")
@@ -136,13 +223,12 @@ def get_translate_settings(db: Session, defaults: SubtitleServiceSettings) -> di
         "rag_wiki_enabled": bool(stored.get("rag_wiki_enabled") if "rag_wiki_enabled" in stored else False),
         "rag_search_enabled": bool(stored.get("rag_search_enabled") if "rag_search_enabled" in stored else defaults.rag_search_enabled),
         "rag_search_url": str(stored.get("rag_search_url") or defaults.rag_search_url),
-        "rag_search_categories": _clean_csv(stored.get("rag_search_categories"), default=defaults.rag_search_categories or "general"),
-        "rag_search_engines": _clean_csv(stored.get("rag_search_engines"), default=defaults.rag_search_engines or ""),
-        "rag_search_fallback_engines": _clean_csv(
-            stored.get("rag_search_fallback_engines"),
-            default=defaults.rag_search_fallback_engines or "bing,baidu",
+        "rag_search_categories": _clean_csv(search_categories) if search_categories else derived["rag_search_categories"],
+        "rag_search_engines": _clean_csv(search_engines) if search_engines else derived["rag_search_engines"],
+        "rag_search_fallback_engines": (
+            _clean_csv(search_fallback_engines) if search_fallback_engines else derived["rag_search_fallback_engines"]
         ),
-        "rag_search_language": _clean_search_language(stored.get("rag_search_language"), default=defaults.rag_search_language or "all"),
+        "rag_search_language": _clean_search_language(search_language) if search_language else derived["rag_search_language"],
         "rag_search_safesearch": max(
             0,
             min(
@@ -177,58 +263,104 @@ def get_translate_settings(db: Session, defaults: SubtitleServiceSettings) -> di
     }
 
 
-def update_translate_settings(db: Session, defaults: SubtitleServiceSettings, update: dict[str, Any]) -> dict[str, Any]:
-    row = _get_row(db)
-    stored = dict(_as_dict(row.value_json))
-
-    for key in [
-        "default_provider",
-        "default_target_lang",
-        "default_style",
-        "default_batch_size",
-        "default_max_retries",
-        "default_enable_summary",
-        "rag_enabled",
-        "rag_top_k",
-        "rag_min_score",
-        "rag_embedding_provider",
-        "rag_embedding_model",
-        "rag_embedding_dimensions",
-        "rag_embedding_model_dir",
-        "rag_embedding_device",
-        "rag_embedding_timeout_seconds",
-        "rag_auto_discover_terms",
-        "rag_auto_learn_terms",
-        "rag_dictionary_enabled",
-        "rag_dictionary_top_k",
-        "rag_dictionary_min_quality",
-        "rag_dictionary_auto_promote",
-        "rag_wiki_enabled",
-        "rag_search_enabled",
-        "rag_search_url",
-        "rag_search_categories",
-        "rag_search_engines",
-        "rag_search_fallback_engines",
-        "rag_search_language",
-        "rag_search_safesearch",
-        "rag_search_time_range",
-        "rag_search_pageno",
-        "rag_domain",
-        "rag_agent_parallelism",
-        "rag_agent_timeout_seconds",
-        "rag_agent_skills_enabled",
-        "rag_agent_builtin_skills_enabled",
-        "rag_agent_user_skills_enabled",
-    ]:
-        if key not in update:
-            continue
-        val = update.get(key)
+# Top-level keys copied verbatim from an update; normalization happens afterwards.
+_TOP_LEVEL_UPDATE_KEYS = (
+    "default_provider",
+    "default_target_lang",
+    "default_style",
+    "default_batch_size",
+    "default_max_retries",
+    "default_enable_summary",
+    "rag_enabled",
+    "rag_top_k",
+    "rag_min_score",
+    "rag_embedding_provider",
+    "rag_embedding_model",
+    "rag_embedding_dimensions",
+    "rag_embedding_model_dir",
+    "rag_embedding_device",
+    "rag_embedding_timeout_seconds",
+    "rag_auto_discover_terms",
+    "rag_auto_learn_terms",
+    "rag_dictionary_enabled",
+    "rag_dictionary_top_k",
+    "rag_dictionary_min_quality",
+    "rag_dictionary_auto_promote",
+    "rag_wiki_enabled",
+    "rag_search_enabled",
+    "rag_search_url",
+    "rag_search_categories",
+    "rag_search_engines",
+    "rag_search_fallback_engines",
+    "rag_search_language",
+    "rag_search_safesearch",
+    "rag_search_time_range",
+    "rag_search_pageno",
+    "rag_domain",
+    "rag_agent_parallelism",
+    "rag_agent_timeout_seconds",
+    "rag_agent_skills_enabled",
+    "rag_agent_builtin_skills_enabled",
+    "rag_agent_user_skills_enabled",
+)
+
+
+def _keep(value: Any) -> Any:
+    return value
+
+
+def _normalize_base_url(value: Any) -> str:
+    return normalize_openai_base_url(str(value or ""))
+
+
+# (update key, nested key, coercer, defaults attribute used when coercion fails).
+# Fields without a fallback let coercion errors propagate.
+_NestedField = tuple[str, str, Callable[[Any], Any], str | None]
+
+_OPENAI_FIELDS: tuple[_NestedField, ...] = (
+    ("openai_base_url", "base_url", _normalize_base_url, None),
+    ("openai_model", "model", _keep, None),
+    ("openai_temperature", "temperature", float, "openai_temperature"),
+    ("openai_timeout_seconds", "timeout_seconds", float, "openai_timeout_seconds"),
+    ("openai_max_retries", "max_retries", _keep, None),
+)
+
+_EMBEDDING_OPENAI_FIELDS: tuple[_NestedField, ...] = (
+    ("rag_embedding_base_url", "base_url", _normalize_base_url, None),
+    ("rag_embedding_timeout_seconds", "timeout_seconds", _keep, None),
+)
+
+
+def _apply_nested_fields(
+    target: dict[str, Any], update: dict[str, Any], fields: tuple[_NestedField, ...], defaults: SubtitleServiceSettings
+) -> None:
+    for update_key, stored_key, coerce, fallback_attr in fields:
+        val = update.get(update_key)
         if val is None:
             continue
-        stored[key] = val
+        if fallback_attr is None:
+            target[stored_key] = coerce(val)
+            continue
+        try:
+            target[stored_key] = coerce(val)
+        except Exception:
+            target[stored_key] = getattr(defaults, fallback_attr)
+
+
+def _apply_update(
+    stored: dict[str, Any], defaults: SubtitleServiceSettings, update: dict[str, Any]
+) -> tuple[str | None, str | None]:
+    """Fold ``update`` into ``stored`` in place; return the plaintext of any API key it set."""
+    # Nested dicts are copied before they are modified, so a shallow copy of the row is safe to pass.
+    for key in _TOP_LEVEL_UPDATE_KEYS:
+        val = update.get(key)
+        if val is not None:
+            stored[key] = val
 
     openai = dict(_as_dict(stored.get("openai")))
 
+    # Plaintext of any key written below, so the result needs no decrypt.
+    api_key: str | None = None
     if "openai_api_key" in update:
         key = update.get("openai_api_key")
         if key is None:
@@ -237,99 +369,56 @@ def update_translate_settings(db: Session, defaults: SubtitleServiceSettings, up
             key = str(key).strip()
             if not key:
                 openai.pop("api_key_enc", None)
-            else:
+            elif key != _decrypt_or_empty(openai.get("api_key_enc")):
+                # Fernet tokens are randomized; keep the old one for an unchanged key.
                 openai["api_key_enc"] = encrypt_str(key)
+            api_key = key
 
-    for key, stored_key in [
-        ("openai_base_url", "base_url"),
-        ("openai_model", "model"),
-        ("openai_temperature", "temperature"),
-        ("openai_timeout_seconds", "timeout_seconds"),
-        ("openai_max_retries", "max_retries"),
-    ]:
-        if key not in update:
-            continue
-        val = update.get(key)
-        if val is None:
-            continue
-        if key == "openai_base_url":
-            openai[stored_key] = normalize_openai_base_url(str(val))
-        else:
-            openai[stored_key] = val
+    _apply_nested_fields(openai, update, _OPENAI_FIELDS, defaults)
 
     stored["openai"] = openai
 
     embedding_openai = dict(_as_dict(stored.get("rag_embedding_openai")))
+    embedding_api_key: str | None = None
     if "rag_embedding_api_key" in update:
         key = update.get("rag_embedding_api_key")
         if key is not None:
             key = str(key).strip()
             if not key:
                 embedding_openai.pop("api_key_enc", None)
-            else:
+            elif key != _decrypt_or_empty(embedding_openai.get("api_key_enc")):
                 embedding_openai["api_key_enc"] = encrypt_str(key)
-    if "rag_embedding_base_url" in update and update.get("rag_embedding_base_url") is not None:
-        embedding_openai["base_url"] = normalize_openai_base_url(str(update.get("rag_embedding_base_url") or ""))
-    if "rag_embedding_timeout_seconds" in update and update.get("rag_embedding_timeout_seconds") is not None:
-        embedding_openai["timeout_seconds"] = update.get("rag_embedding_timeout_seconds")
+            embedding_api_key = key
+    _apply_nested_fields(embedding_openai, update, _EMBEDDING_OPENAI_FIELDS, defaults)
     stored["rag_embedding_openai"] = embedding_openai
 
     # Normalize a few types.
-    try:
-        if "default_batch_size" in stored and stored["default_batch_size"] is not None:
-            stored["default_batch_size"] = max(1, int(stored["default_batch_size"]))
-    except Exception:
-        stored["default_batch_size"] = defaults.translate_batch_size
-    try:
-        if "default_max_retries" in stored and stored["default_max_retries"] is not None:
-            stored["default_max_retries"] = max(0, min(10, int(stored["default_max_retries"])))
-    except Exception:
-        stored["default_max_retries"] = defaults.translate_max_retries
-    try:
-        stored["rag_top_k"] = max(0, min(30, int(stored.get("rag_top_k") or defaults.rag_top_k)))
-    except Exception:
-        stored["rag_top_k"] = defaults.rag_top_k
-    try:
-        stored["rag_min_score"] = max(0.0, min(1.0, float(stored.get("rag_min_score") or defaults.rag_min_score)))
-    except Exception:
-        stored["rag_min_score"] = defaults.rag_min_score
-    try:
-        stored["rag_embedding_dimensions"] = max(1, min(4096, int(stored.get("rag_embedding_dimensions") or defaults.rag_embedding_dimensions)))
-    except Exception:
-        stored["rag_embedding_dimensions"] = defaults.rag_embedding_dimensions
-    try:
-        stored["rag_agent_parallelism"] = max(1, min(8, int(stored.get("rag_agent_parallelism") or 1)))
-    except Exception:
-        stored["rag_agent_parallelism"] = 1
-    try:
-        stored["rag_agent_timeout_seconds"] = max(10.0, min(900.0, float(stored.get("rag_agent_timeout_seconds") or 120.0)))
-    except Exception:
-        stored["rag_agent_timeout_seconds"] = 120.0
-    try:
-        stored["rag_dictionary_top_k"] = max(0, min(30, int(stored.get("rag_dictionary_top_k") or getattr(defaults, "rag_dictionary_top_k", 8))))
-    except Exception:
-        stored["rag_dictionary_top_k"] = getattr(defaults, "rag_dictionary_top_k", 8)
-    try:
-        stored["rag_dictionary_min_quality"] = max(
-            0.0,
-            min(
-                1.0,
-                float(
-                    stored.get("rag_dictionary_min_quality")
-                    if stored.get("rag_dictionary_min_quality") is not None
-                    else getattr(defaults, "rag_dictionary_min_quality", 0.0)
-                ),
-            ),
-        )
-    except Exception:
-        stored["rag_dictionary_min_quality"] = getattr(defaults, "rag_dictionary_min_quality", 0.0)
-    try:
-        stored["rag_embedding_timeout_seconds"] = max(
-            1.0,
-            min(600.0, float(stored.get("rag_embedding_timeout_seconds") or defaults.rag_embedding_timeout_seconds)),
-        )
-    except Exception:
-        stored["rag_embedding_timeout_seconds"] = defaults.rag_embedding_timeout_seconds
+    if stored.get("default_batch_size") is not None:
+        stored["default_batch_size"] = _clamped_int(stored["default_batch_size"], 1, None, defaults.translate_batch_size)
+    if stored.get("default_max_retries") is not None:
+        stored["default_max_retries"] = _clamped_int(stored["default_max_retries"], 0, 10, defaults.translate_max_retries)
+    stored["rag_top_k"] = _clamped_int(stored.get("rag_top_k") or defaults.rag_top_k, 0, 30, defaults.rag_top_k)
+    stored["rag_min_score"] = _clamped_float(stored.get("rag_min_score") or defaults.rag_min_score, 0.0, 1.0, defaults.rag_min_score)
+    stored["rag_embedding_dimensions"] = _clamped_int(
+        stored.get("rag_embedding_dimensions") or defaults.rag_embedding_dimensions, 1, 4096, defaults.rag_embedding_dimensions
+    )
+    stored["rag_agent_parallelism"] = _clamped_int(stored.get("rag_agent_parallelism") or 1, 1, 8, 1)
+    stored["rag_agent_timeout_seconds"] = _clamped_float(stored.get("rag_agent_timeout_seconds") or 120.0, 10.0, 900.0, 120.0)
+    default_dictionary_top_k = getattr(defaults, "rag_dictionary_top_k", 8)
+    stored["rag_dictionary_top_k"] = _clamped_int(
+        stored.get("rag_dictionary_top_k") or default_dictionary_top_k, 0, 30, default_dictionary_top_k
+    )
+    default_min_quality = getattr(defaults, "rag_dictionary_min_quality", 0.0)
+    min_quality = stored.get("rag_dictionary_min_quality")
+    stored["rag_dictionary_min_quality"] = _clamped_float(
+        min_quality if min_quality is not None else default_min_quality, 0.0, 1.0, default_min_quality
+    )
+    stored["rag_embedding_timeout_seconds"] = _clamped_float(
+        stored.get("rag_embedding_timeout_seconds") or defaults.rag_embedding_timeout_seconds,
+        1.0,
+        600.0,
+        defaults.rag_embedding_timeout_seconds,
+    )
     for bool_key in [
         "rag_enabled",
         "rag_auto_discover_terms",
@@ -364,40 +453,53 @@ def update_translate_settings(db: Session, defaults: SubtitleServiceSettings, up
         default=defaults.rag_search_fallback_engines or "bing,baidu",
     )
     stored["rag_search_language"] = _clean_search_language(stored.get("rag_search_language"), default=defaults.rag_search_language or "all")
-    try:
-        stored["rag_search_safesearch"] = max(0, min(2, int(stored.get("rag_search_safesearch") or defaults.rag_search_safesearch or 0)))
-    except Exception:
-        stored["rag_search_safesearch"] = 0
+    stored["rag_search_safesearch"] = _clamped_int(stored.get("rag_search_safesearch") or defaults.rag_search_safesearch or 0, 0, 2, 0)
     stored["rag_search_time_range"] = _clean_search_time_range(stored.get("rag_search_time_range") or defaults.rag_search_time_range)
-    try:
-        stored["rag_search_pageno"] = max(1, min(100, int(stored.get("rag_search_pageno") or defaults.rag_search_pageno or 1)))
-    except Exception:
-        stored["rag_search_pageno"] = 1
+    stored["rag_search_pageno"] = _clamped_int(stored.get("rag_search_pageno") or defaults.rag_search_pageno or 1, 1, 100, 1)
     if "base_url" in embedding_openai:
         embedding_openai["base_url"] = normalize_openai_base_url(str(embedding_openai.get("base_url") or ""))
-    try:
-        if "timeout_seconds" in embedding_openai and embedding_openai["timeout_seconds"] is not None:
-            embedding_openai["timeout_seconds"] = max(1.0, min(600.0, float(embedding_openai.get("timeout_seconds"))))
-    except Exception:
-        embedding_openai["timeout_seconds"] = defaults.rag_embedding_timeout_seconds
-    try:
-        if "openai_temperature" in update and update["openai_temperature"] is not None:
-            openai["temperature"] = float(openai.get("temperature"))
-    except Exception:
-        openai["temperature"] = defaults.openai_temperature
-    try:
-        if "openai_timeout_seconds" in update and update["openai_timeout_seconds"] is not None:
-            openai["timeout_seconds"] = float(openai.get("timeout_seconds"))
-    except Exception:
-        openai["timeout_seconds"] = defaults.openai_timeout_seconds
-    try:
-        if "max_retries" in openai and openai["max_retries"] is not None:
-            openai["max_retries"] = max(1, min(10, int(openai.get("max_retries") or 3)))
-    except Exception:
-        openai["max_retries"] = 3
+    if embedding_openai.get("timeout_seconds") is not None:
+        embedding_openai["timeout_seconds"] = _clamped_float(
+            embedding_openai["timeout_seconds"], 1.0, 600.0, defaults.rag_embedding_timeout_seconds
+        )
+    if openai.get("max_retries") is not None:
+        openai["max_retries"] = _clamped_int(openai["max_retries"] or 3, 1, 10, 3)
+
+    return api_key, embedding_api_key
+
+
+def update_translate_settings(db: Session, defaults: SubtitleServiceSettings, update: dict[str, Any]) -> dict[str, Any]:
+    return bulk_update_translate_settings(db, defaults, [update])
+
+
+def bulk_update_translate_settings(
+    db: Session, defaults: SubtitleServiceSettings, updates: Iterable[dict[str, Any]]
+) -> dict[str, Any]:
+    """Apply ``updates`` in order with one read, at most one write, and one commit."""
+    current = _as_dict(get_app_setting_value(db, TRANSLATE_SETTINGS_KEY))
+    stored = dict(current)
+    # A legacy un-normalized URL makes stored differ from current, so it is rewritten below.
+    _normalize_stored_base_urls(stored)
+    api_key: str | None = None
+    embedding_api_key: str | None = None
+    for update in updates:
+        new_api_key, new_embedding_api_key = _apply_update(stored, defaults, update)
+        if new_api_key is not None:
+            api_key = new_api_key
+        if new_embedding_api_key is not None:
+            embedding_api_key = new_embedding_api_key
 
-    row.value_json = stored
-    db.add(row)
-    db.commit()
+    # Re-saving the settings page unchanged is common; skip the write and invalidation.
+    if stored != current:
+        upsert_app_setting(db, TRANSLATE_SETTINGS_KEY, stored)
+        db.commit()
+        if api_key is not None or embedding_api_key is not None:
+            _decrypt_cached.cache_clear()
+        invalidate_translate_settings_cache()
 
-    return get_translate_settings(db, defaults)
+    # Project the dict just written instead of reading the row back.
+    if api_key is None:
+        api_key = _decrypt_or_empty(_as_dict(stored.get("openai")).get("api_key_enc"))
+    if embedding_api_key is None:
+        embedding_api_key = _decrypt_or_empty(_as_dict(stored.get("rag_embedding_openai")).get("api_key_enc"))
+    return _project_translate_settings(stored, api_key, embedding_api_key, defaults)
@@ -10,9 +10,10 @@ import threading
 import time
 import traceback
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import httpx
 from celery import Celery
@@ -21,11 +22,10 @@ from celery.signals import worker_init
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
-from videoroll.ai.client import openai_chat_config_from_settings
+from videoroll.ai.client import OpenAIStatusError, openai_chat_config_from_settings
 from videoroll.ai.service import AIService, translate_text_openai
 from videoroll.config import get_orchestrator_settings, get_subtitle_settings
-from videoroll.db.base import Base
-from videoroll.db.auto_migrate import auto_migrate
+from videoroll.db.auto_migrate import auto_migrate, create_missing_tables
 from videoroll.db.models import (
     AppSetting,
     Asset,
@@ -48,26 +48,27 @@ from videoroll.realtime import publish_log_updated, publish_queue_changed
 from videoroll.storage.s3 import S3Store
 from videoroll.apps.security.service_auth import INTERNAL_TOKEN_HEADER, service_token
 from videoroll.utils.auto_youtube import parse_auto_youtube_created_by
-from videoroll.utils.hashing import sha256_file
+from videoroll.utils.hashing import sha256_file, sha256_file_with_size
 from videoroll.utils.task_queue import available_task_queue_capacity, task_queue_slot_reserved_for
 from videoroll.apps.subtitle_service.processing import (
     Segment,
     convert_subtitle_to_srt,
     extract_audio,
+    make_bilingual,
     mux_soft_sub,
     probe_video_resolution,
     render_burn_in,
     srt_to_segments,
     segments_from_json_data,
-    segments_to_ass,
     segments_to_json_data,
-    segments_to_srt,
     transcribe_faster_whisper,
     transcribe_mock,
     transcribe_openvino_whisper,
     translate_segments_openai_with_summary,
     translate_segments_mock,
+    write_ass,
     write_json,
+    write_srt,
 )
 from videoroll.apps.subtitle_service.asr_settings_store import get_asr_settings
 from videoroll.apps.subtitle_service.auto_profile_store import get_auto_profile
@@ -80,6 +81,7 @@ from videoroll.apps.subtitle_service.model_downloads import (
 from videoroll.apps.subtitle_service.rag import build_rag_context, rag_settings_from_translate_settings
 from videoroll.apps.subtitle_service.embeddings import embedding_settings_from_translate_settings
 from videoroll.apps.subtitle_service.task_title_store import set_task_titles
+from videoroll.apps.subtitle_service.translate_cache import open_translation_cache
 from videoroll.apps.subtitle_service.translate_settings_store import get_translate_settings
 from videoroll.apps.publish_meta_draft import apply_publish_source_overrides, default_publish_meta
 from videoroll.apps.outbox.dispatcher import dispatch_outbox_events
@@ -102,13 +104,14 @@ from videoroll.apps.subtitle_service.worker_concurrency import (
     acquire_job_lease,
     recover_expired_leases,
     release_job_lease,
+    subtitle_worker_concurrency_for_task_queue_settings,
 )
 from videoroll.apps.youtube_settings_store import (
     get_youtube_cookies_txt,
     get_youtube_settings,
     normalize_and_validate_netscape_cookies_txt,
 )
-from videoroll.utils.cpu import process_cpu_count
+from videoroll.utils.cpu import threads_per_worker
 
 
 def _unique_storage_key(prefix: str, digest: str, suffix: str) -> str:
@@ -127,6 +130,8 @@ settings = get_subtitle_settings()
 logger = logging.getLogger(__name__)
 _DB_READY_LOCK = threading.Lock()
 _DB_READY_PID: int | None = None
+_S3_STORE_LOCK = threading.Lock()
+_S3_STORE: tuple[int, S3Store] | None = None
 _TASK_QUEUE_TICK_INTERVAL_SECONDS = _positive_int_env("TASK_QUEUE_TICK_INTERVAL_SECONDS", 10)
 
 
@@ -266,6 +271,13 @@ def _ai_service() -> AIService:
     return AIService(_fresh_translate_settings)
 
 
+def _translate_cache_path() -> Path | None:
+    raw = str(settings.translate_cache_path or "").strip()
+    if raw.lower() in {"off", "none", "false", "0"}:
+        return None
+    return Path(raw) if raw else Path(settings.work_dir) / "cache" / "translate_cache.sqlite"
+
+
 def _ensure_db() -> None:
     global _DB_READY_PID
     pid = os.getpid()
@@ -275,11 +287,32 @@ def _ensure_db() -> None:
         if _DB_READY_PID == pid:
             return
         engine = get_engine(settings.database_url)
-        Base.metadata.create_all(engine)
+        create_missing_tables(engine)
         auto_migrate(settings.database_url)
         _DB_READY_PID = pid
 
 
+def _s3() -> S3Store:
+    """Return this worker process's S3Store, creating it (and the bucket) on first use.
+
+    boto3 clients are thread-safe, so tasks and their helper threads share one
+    client and its connection pool instead of rebuilding it per task.
+    """
+    global _S3_STORE
+    pid = os.getpid()
+    cached = _S3_STORE
+    if cached is not None and cached[0] == pid:
+        return cached[1]
+    with _S3_STORE_LOCK:
+        cached = _S3_STORE
+        if cached is not None and cached[0] == pid:
+            return cached[1]
+        store = S3Store(settings)
+        store.ensure_bucket()
+        _S3_STORE = (pid, store)
+        return store
+
+
 def _now() -> datetime:
     return datetime.now(tz=timezone.utc)
 
@@ -573,7 +606,10 @@ _CJK_RE = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uF900-\uFAFF]")
 
 
 def _has_cjk(text: str) -> bool:
-    return bool(_CJK_RE.search(text or ""))
+    # isascii() reads a flag on the str object, so plain-English titles skip the regex.
+    if not text or text.isascii():
+        return False
+    return _CJK_RE.search(text) is not None
 
 
 def _translate_title_openai(
@@ -735,7 +771,7 @@ def _latest_youtube_title(db: Session, store: S3Store, task_id: uuid.UUID) -> st
         return ""
     try:
         raw = _read_s3_bytes(store, asset.storage_key)
-        info = json.loads(raw.decode("utf-8")) if raw else {}
+        info = json.loads(raw) if raw else {}
     except Exception:
         return ""
     if not isinstance(info, dict):
@@ -745,17 +781,37 @@ def _latest_youtube_title(db: Session, store: S3Store, task_id: uuid.UUID) -> st
 
 
 def _segments_text_excerpt(segments: list[Segment], max_chars: int = 7000) -> str:
-    text = "\n".join((s.text or "").strip() for s in segments if (s.text or "").strip())
-    text = text.strip()
-    if not text:
-        return ""
-    if len(text) <= max_chars:
-        return text
+    # Long transcripts keep only their two ends, so take just enough text from
+    # each end rather than joining the whole transcript and slicing it.
+    head: list[str] = []
+    size = -1
+    for seg in segments:
+        text = (seg.text or "").strip()
+        if not text:
+            continue
+        head.append(text)
+        size += len(text) + 1
+        if size > max_chars:
+            break
+    else:
+        return "\n".join(head)
+
     half = max(1, max_chars // 2)
-    return (text[:half].rstrip() + "\n…\n" + text[-half:].lstrip()).strip()
+    tail: list[str] = []
+    size = -1
+    for seg in reversed(segments):
+        text = (seg.text or "").strip()
+        if not text:
+            continue
+        tail.append(text)
+        size += len(text) + 1
+        if size >= half:
+            break
+    tail.reverse()
+    return ("\n".join(head)[:half].rstrip() + "\n…\n" + "\n".join(tail)[-half:].lstrip()).strip()
 
 
-_EN_STOP = {
+_EN_STOP = frozenset({
     "the",
     "a",
     "an",
@@ -777,52 +833,54 @@ _EN_STOP = {
     "we",
     "you",
     "i",
-}
+})
+_FALLBACK_TAG_CJK_RE = re.compile(r"[\u4e00-\u9fff]{2,12}")
+_FALLBACK_TAG_EN_RE = re.compile(r"[A-Za-z][A-Za-z0-9+-]{2,15}")
+_FALLBACK_TAG_DEFAULTS = ("熟肉", "字幕", "翻译", "科技", "教程", "YouTube", "搬运", "科普")
 
 
 def _fallback_bilibili_tags(*, title: str, summary: str, transcript: str, n: int = 6) -> list[str]:
-    blob = "\n".join([title or "", summary or "", transcript or ""])
-    blob = blob.strip()
+    # Scan each part in order rather than a joined copy: neither pattern can
+    # match across the part boundary.  Matches never contain whitespace or
+    # "#" and are at most 16 chars, so they need no cleanup before use.
+    parts = [p for p in (title, summary, transcript) if p]
     out: list[str] = []
     seen: set[str] = set()
-
-    def _add(tag: str) -> None:
-        s = (tag or "").strip().lstrip("#").lstrip("＃")
-        s = "".join(s.split())
-        if not s:
-            return
-        if s.lower() == "videoroll":
-            return
-        if len(s) > 20:
-            s = s[:20]
-        k = s.lower()
-        if k in seen:
-            return
-        seen.add(k)
-        out.append(s)
+    if n <= 0:
+        return out
 
     # Prefer CJK chunks as tags.
-    for m in re.finditer(r"[\u4e00-\u9fff]{2,12}", blob):
-        _add(m.group(0))
-        if len(out) >= n:
-            return out[:n]
-
-    # Then English-ish words from title/summary.
-    for m in re.finditer(r"[A-Za-z][A-Za-z0-9+-]{2,15}", blob):
-        w = m.group(0)
-        if w.lower() in _EN_STOP:
-            continue
-        _add(w)
-        if len(out) >= n:
-            return out[:n]
+    for part in parts:
+        for m in _FALLBACK_TAG_CJK_RE.finditer(part):
+            tag = m.group(0)
+            if tag not in seen:
+                seen.add(tag)
+                out.append(tag)
+                if len(out) >= n:
+                    return out
+
+    # Then English-ish words.
+    for part in parts:
+        for m in _FALLBACK_TAG_EN_RE.finditer(part):
+            tag = m.group(0)
+            key = tag.lower()
+            if key in seen or key in _EN_STOP or key == "videoroll":
+                continue
+            seen.add(key)
+            out.append(tag)
+            if len(out) >= n:
+                return out
 
     # Generic fallback.
-    for t in ["熟肉", "字幕", "翻译", "科技", "教程", "YouTube", "搬运", "科普"]:
-        _add(t)
-        if len(out) >= n:
-            return out[:n]
+    for tag in _FALLBACK_TAG_DEFAULTS:
+        key = tag.lower()
+        if key not in seen:
+            seen.add(key)
+            out.append(tag)
+            if len(out) >= n:
+                return out
 
-    return out[:n]
+    return out
 
 
 @worker_init.connect
@@ -841,8 +899,7 @@ def _on_worker_init(**_kwargs: Any) -> None:
 @celery_app.task(name="subtitle_service.process_job", bind=True, acks_late=True, reject_on_worker_lost=True)
 def process_job(self: Any, job_id: str) -> dict[str, str]:
     _ensure_db()
-    store = S3Store(settings)
-    store.ensure_bucket()
+    store = _s3()
 
     jid = uuid.UUID(job_id)
     db = _db()
@@ -1051,7 +1108,8 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
         def _store_ass_from_segments(segs: list[Segment], *, log_prefix: str) -> str:
             play_res_x, play_res_y = _ass_resolution()
             secondary_line_scale = 0.68 if bool((req.get("translate") or {}).get("bilingual")) else None
-            ass_text = segments_to_ass(
+            write_ass(
+                ass_path,
                 segs,
                 style_name=render_cfg.get("ass_style", "clean_white"),
                 play_res_x=play_res_x,
@@ -1060,8 +1118,7 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
                 primary_font_scale_percent=render_cfg.get("primary_font_scale_percent") or 100,
                 secondary_font_scale_percent=render_cfg.get("secondary_font_scale_percent") or 100,
             )
-            ass_path.write_text(ass_text, encoding="utf-8")
-            ass_sha = sha256_file(ass_path)
+            ass_sha, ass_size = sha256_file_with_size(ass_path)
             existing_asset = (
                 db.query(Asset)
                 .filter(
@@ -1084,7 +1141,7 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
                         kind=AssetKind.subtitle_ass,
                         storage_key=ass_key_local,
                         sha256=ass_sha,
-                        size_bytes=ass_path.stat().st_size,
+                        size_bytes=ass_size,
                     )
                 )
                 existing_subtitle = (
@@ -1114,15 +1171,15 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
                 ".json",
             )
             store.upload_file(subtitle_segments_path, key, content_type="application/json")
+            # Committed together with the subtitle assets (or by the failure/stop handlers).
             _set_final_subtitle_segments_key(key)
-            db.commit()
             _safe_append_log_line(log_path, f"subtitle segments uploaded: {key}")
             return key
 
         def _store_source_segments(segs: list[Segment], *, source_label: str) -> None:
             nonlocal segments_key
             write_json(segments_path, segments_to_json_data(segs))
-            segments_sha = sha256_file(segments_path)
+            segments_sha, segments_size = sha256_file_with_size(segments_path)
             segments_key = _unique_storage_key(
                 f"sub/{task.id}/segments",
                 segments_sha,
@@ -1135,13 +1192,13 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
                     kind=AssetKind.segments_json,
                     storage_key=segments_key,
                     sha256=segments_sha,
-                    size_bytes=segments_path.stat().st_size,
+                    size_bytes=segments_size,
                 )
             )
             _raise_if_task_stopped(db, task.id)
             task.status = TaskStatus.asr_done
             db.add(task)
-            db.commit()
+            # Both callers fall through to the progress=60 commit right after this.
             _safe_append_log_line(log_path, f"{source_label}: segments={len(segs)}")
             _safe_upload_log(store, log_path, log_key)
 
@@ -1188,7 +1245,7 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
                 "translated_segments": segments_to_json_data(translated_prefix),
             }
             try:
-                write_json(translation_checkpoint_path, payload)
+                write_json(translation_checkpoint_path, payload, compact=True)
                 store.upload_file(translation_checkpoint_path, _translation_checkpoint_key(), content_type="application/json")
             except Exception as e:
                 _safe_append_log_line(log_path, f"translation checkpoint save failed: {type(e).__name__}: {e}")
@@ -1317,7 +1374,6 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
                         else:
                             _safe_append_log_line(log_path, "youtube subtitles: auto-generated source subtitle found; translation disabled; using it directly")
                     _save_job_request()
-                    db.commit()
                     _store_source_segments(segments, source_label="youtube subtitles ready")
 
         if segments is None:
@@ -1329,7 +1385,7 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
                 _safe_append_log_line(log_path, "ffmpeg: extract audio")
                 extract_audio(settings.ffmpeg_path, video_path, audio_path, log_path=log_path)
                 _safe_upload_log(store, log_path, log_key)
-                audio_sha = sha256_file(audio_path)
+                audio_sha, audio_size = sha256_file_with_size(audio_path)
                 audio_key = _unique_storage_key(
                     f"work/{task.id}/audio",
                     audio_sha,
@@ -1342,7 +1398,7 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
                         kind=AssetKind.audio_wav,
                         storage_key=audio_key,
                         sha256=audio_sha,
-                        size_bytes=audio_path.stat().st_size,
+                        size_bytes=audio_size,
                     )
                 )
             _raise_if_task_stopped(db, task.id)
@@ -1369,7 +1425,10 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
                 model_name = _resolve_faster_whisper_model(model_name, Path(settings.whisper_model_dir), proxy=proxy)
                 cpu_threads_cfg = int(getattr(settings, "whisper_cpu_threads", 0) or 0)
                 if cpu_threads_cfg <= 0:
-                    cpu_threads_cfg = process_cpu_count() or 4
+                    # The task queue's max_concurrency is also the worker pool size.
+                    cpu_threads_cfg = threads_per_worker(
+                        subtitle_worker_concurrency_for_task_queue_settings(get_task_queue_settings(db))
+                    )
                 num_workers_cfg = int(getattr(settings, "whisper_num_workers", 1) or 1)
                 if num_workers_cfg <= 0:
                     num_workers_cfg = 1
@@ -1429,6 +1488,8 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
                 msg = str(err or "")
                 if "api key is not set" in msg.lower():
                     return False
+                if isinstance(err, OpenAIStatusError) and not err.retryable:
+                    return False
                 return True
 
             def _translate_retry_countdown(attempt: int) -> float:
@@ -1498,23 +1559,30 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
                             checkpoint_segments.extend(batch_segments)
                             _save_translation_checkpoint(segments_key, checkpoint_segments, summary=updated_summary)
 
-                        segments_out, translation_summary = translate_segments_openai_with_summary(
-                            segments,
-                            target_lang=target_lang,
-                            style=style,
-                            api_key=None,
-                            base_url="",
-                            model="",
-                            temperature=translate_settings["openai_temperature"],
-                            timeout_seconds=translate_settings["openai_timeout_seconds"],
-                            batch_size=batch_size,
-                            enable_summary=enable_summary,
-                            rag_context_provider=_rag_context_provider,
-                            resume_from=resume_prefix,
-                            initial_summary=resume_summary,
-                            on_batch_done=_on_translate_batch_done,
-                            ai_service=ai_service,
-                        )
+                        translate_cache = open_translation_cache(_translate_cache_path())
+                        try:
+                            segments_out, translation_summary = translate_segments_openai_with_summary(
+                                segments,
+                                target_lang=target_lang,
+                                style=style,
+                                api_key=None,
+                                base_url="",
+                                model="",
+                                temperature=translate_settings["openai_temperature"],
+                                timeout_seconds=translate_settings["openai_timeout_seconds"],
+                                batch_size=batch_size,
+                                enable_summary=enable_summary,
+                                rag_context_provider=_rag_context_provider,
+                                resume_from=resume_prefix,
+                                initial_summary=resume_summary,
+                                on_batch_done=_on_translate_batch_done,
+                                ai_service=ai_service,
+                                concurrency=settings.translate_concurrency,
+                                cache=translate_cache,
+                            )
+                        finally:
+                            if translate_cache is not None:
+                                translate_cache.close()
                     else:
                         raise ValueError(f"unsupported translate provider: {provider}")
                     job.error_message = None
@@ -1579,29 +1647,23 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
                 pass
 
             if bilingual:
-                merged: list[Segment] = []
-                for src_seg, zh_seg in zip(segments, segments_out):
-                    merged.append(
-                        Segment(
-                            start=zh_seg.start,
-                            end=zh_seg.end,
-                            text=zh_seg.text,
-                            confidence=zh_seg.confidence,
-                            secondary_text=str(src_seg.text or "").strip() or None,
-                        )
-                    )
-                segments_out = merged
+                segments_out = make_bilingual(segments, segments_out)
 
-        srt_text = segments_to_srt(segments_out)
-        srt_path.write_text(srt_text, encoding="utf-8")
-        _store_final_subtitle_segments(segments_out)
-        srt_sha = sha256_file(srt_path)
+        write_srt(srt_path, segments_out)
+        srt_sha, srt_size = sha256_file_with_size(srt_path)
         srt_key = _unique_storage_key(
             f"sub/{task.id}/subtitle_zh",
             srt_sha,
             ".srt",
         )
-        store.upload_file(srt_path, srt_key, content_type="text/plain")
+        # The SRT upload only talks to S3, so it overlaps the segments/ASS work
+        # below; the session stays on this thread and the rows are added after.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="srt-upload") as upload_pool:
+            srt_upload = upload_pool.submit(store.upload_file, srt_path, srt_key, content_type="text/plain")
+            _store_final_subtitle_segments(segments_out)
+            if need_ass:
+                ass_key = _store_ass_from_segments(segments_out, log_prefix="subtitle ass uploaded")
+            srt_upload.result()
         _clear_translation_checkpoint()
         db.add(
             Asset(
@@ -1609,15 +1671,12 @@ def process_job(self: Any, job_id: str) -> dict[str, str]:
                 kind=AssetKind.subtitle_srt,
                 storage_key=srt_key,
                 sha256=srt_sha,
-                size_bytes=srt_path.stat().st_size,
+                size_bytes=srt_size,
             )
         )
         db.add(Subtitle(task_id=task.id, version=1, format=SubtitleFormat.srt, language="zh", storage_key=srt_key))
         _safe_append_log_line(log_path, f"subtitle srt uploaded: {srt_key}")
 
-        if need_ass:
-            ass_key = _store_ass_from_segments(segments_out, log_prefix="subtitle ass uploaded")
-
         _raise_if_task_stopped(db, task.id)
         task.status = TaskStatus.subtitle_ready
         db.add(task)
@@ -1989,8 +2048,7 @@ def render_queue_tick() -> dict[str, Any]:
 @celery_app.task(name="subtitle_service.process_render_job", bind=True, acks_late=True, reject_on_worker_lost=True)
 def process_render_job(self: Any, render_job_id: str) -> dict[str, Any]:
     _ensure_db()
-    store = S3Store(settings)
-    store.ensure_bucket()
+    store = _s3()
 
     rid = uuid.UUID(render_job_id)
     db = _db()
@@ -2142,19 +2200,19 @@ def process_render_job(self: Any, render_job_id: str) -> dict[str, Any]:
         srt_path = work_root / "subtitle_zh.srt"
         ass_path = work_root / "subtitle_zh.ass"
 
-        _safe_append_log_line(log_path, f"download: input_key={input_key}")
+        downloads = [("input_key", input_key, video_path), ("srt_key", srt_key, srt_path)]
+        if burn_in and ass_key:
+            downloads.append(("ass_key", ass_key, ass_path))
+        for label, key, _ in downloads:
+            _safe_append_log_line(log_path, f"download: {label}={key}")
         _safe_upload_log(store, log_path, log_key)
         rj.progress = max(int(rj.progress or 0), 5)
         db.add(rj)
         db.commit()
-        store.download_file(input_key, video_path)
-        _safe_append_log_line(log_path, f"download: srt_key={srt_key}")
-        _safe_upload_log(store, log_path, log_key)
-        store.download_file(srt_key, srt_path)
-        if burn_in and ass_key:
-            _safe_append_log_line(log_path, f"download: ass_key={ass_key}")
-            _safe_upload_log(store, log_path, log_key)
-            store.download_file(ass_key, ass_path)
+        # Independent S3 reads: the subtitles arrive while the video is still streaming.
+        with ThreadPoolExecutor(max_workers=len(downloads), thread_name_prefix="render-download") as download_pool:
+            for future in [download_pool.submit(store.download_file, key, path) for _, key, path in downloads]:
+                future.result()
         _safe_append_log_line(log_path, "inputs downloaded")
         _safe_upload_log(store, log_path, log_key)
 
@@ -2169,75 +2227,98 @@ def process_render_job(self: Any, render_job_id: str) -> dict[str, Any]:
         db.add(rj)
         db.commit()
 
-        if burn_in:
-            rj.progress = max(int(rj.progress or 0), 20)
-            if subtitle_job:
-                subtitle_job.progress = max(int(subtitle_job.progress or 0), 85)
-                db.add(subtitle_job)
-            db.add(rj)
-            db.commit()
+        softsub_log_path = work_root / "softsub.log"
 
-            out_video = work_root / "video_burnin.mp4"
-            _safe_append_log_line(log_path, "ffmpeg: burn-in subtitles")
-            render_burn_in(
-                settings.ffmpeg_path,
-                video_path,
-                ass_path,
-                out_video,
-                video_codec=video_codec,
-                use_intel_gpu=use_intel_gpu,
-                intel_gpu_render_device=settings.intel_gpu_render_device,
-                preset=video_preset,
-                crf=video_crf,
-                log_path=log_path,
-                live_upload_cb=_live_upload_log,
-            )
-            _safe_upload_log(store, log_path, log_key)
-            final_sha = sha256_file(out_video)
-            final_key = _unique_storage_key(
-                f"final/{task.id}/video_burnin",
-                final_sha,
-                ".mp4",
-            )
-            store.upload_file(out_video, final_key, content_type="video/mp4")
-            db.add(
-                Asset(
-                    task_id=task.id,
-                    kind=AssetKind.video_final,
-                    storage_key=final_key,
-                    sha256=final_sha,
-                    size_bytes=out_video.stat().st_size,
+        def _mux_soft_sub(mux_log_path: Path, live_upload_cb: Callable[[], None] | None) -> Path:
+            out_video = work_root / "video_softsub.mkv"
+            mux_soft_sub(settings.ffmpeg_path, video_path, srt_path, out_video, log_path=mux_log_path, live_upload_cb=live_upload_cb)
+            return out_video
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="render-softsub") as softsub_pool:
+            softsub_future: Future[Path] | None = None
+            if burn_in and soft_sub:
+                # The soft-sub mux is a stream copy, so it runs alongside the
+                # burn-in encode. It gets its own log file and no live callback:
+                # _live_upload_log touches the session. Hashing and upload stay
+                # on this thread after the burn-in succeeds, so a failed render
+                # never leaves an S3 object without an Asset row.
+                _safe_append_log_line(log_path, "ffmpeg: mux soft subtitles (alongside burn-in)")
+                softsub_log_path.unlink(missing_ok=True)
+                softsub_future = softsub_pool.submit(_mux_soft_sub, softsub_log_path, None)
+
+            if burn_in:
+                rj.progress = max(int(rj.progress or 0), 20)
+                if subtitle_job:
+                    subtitle_job.progress = max(int(subtitle_job.progress or 0), 85)
+                    db.add(subtitle_job)
+                db.add(rj)
+                db.commit()
+
+                out_video = work_root / "video_burnin.mp4"
+                _safe_append_log_line(log_path, "ffmpeg: burn-in subtitles")
+                render_burn_in(
+                    settings.ffmpeg_path,
+                    video_path,
+                    ass_path,
+                    out_video,
+                    video_codec=video_codec,
+                    use_intel_gpu=use_intel_gpu,
+                    intel_gpu_render_device=settings.intel_gpu_render_device,
+                    preset=video_preset,
+                    crf=video_crf,
+                    log_path=log_path,
+                    live_upload_cb=_live_upload_log,
+                )
+                _safe_upload_log(store, log_path, log_key)
+                final_sha, final_size = sha256_file_with_size(out_video)
+                final_key = _unique_storage_key(
+                    f"final/{task.id}/video_burnin",
+                    final_sha,
+                    ".mp4",
+                )
+                store.upload_file(out_video, final_key, content_type="video/mp4")
+                db.add(
+                    Asset(
+                        task_id=task.id,
+                        kind=AssetKind.video_final,
+                        storage_key=final_key,
+                        sha256=final_sha,
+                        size_bytes=final_size,
+                    )
                 )
-            )
 
-        if soft_sub:
-            rj.progress = max(int(rj.progress or 0), 60)
-            if subtitle_job:
-                subtitle_job.progress = max(int(subtitle_job.progress or 0), 90)
-                db.add(subtitle_job)
-            db.add(rj)
-            db.commit()
+            if soft_sub:
+                rj.progress = max(int(rj.progress or 0), 60)
+                if subtitle_job:
+                    subtitle_job.progress = max(int(subtitle_job.progress or 0), 90)
+                    db.add(subtitle_job)
+                db.add(rj)
+                db.commit()
 
-            out_video = work_root / "video_softsub.mkv"
-            _safe_append_log_line(log_path, "ffmpeg: mux soft subtitles")
-            mux_soft_sub(settings.ffmpeg_path, video_path, srt_path, out_video, log_path=log_path, live_upload_cb=_live_upload_log)
-            _safe_upload_log(store, log_path, log_key)
-            final_sha = sha256_file(out_video)
-            final_key = _unique_storage_key(
-                f"final/{task.id}/video_softsub",
-                final_sha,
-                ".mkv",
-            )
-            store.upload_file(out_video, final_key, content_type="video/x-matroska")
-            db.add(
-                Asset(
-                    task_id=task.id,
-                    kind=AssetKind.video_final,
-                    storage_key=final_key,
-                    sha256=final_sha,
-                    size_bytes=out_video.stat().st_size,
+                if softsub_future is None:
+                    _safe_append_log_line(log_path, "ffmpeg: mux soft subtitles")
+                    soft_video = _mux_soft_sub(log_path, _live_upload_log)
+                else:
+                    try:
+                        soft_video = softsub_future.result()
+                    finally:
+                        try:
+                            _safe_append_log_block(log_path, softsub_log_path.read_text(encoding="utf-8", errors="replace"))
+                        except Exception:
+                            pass
+                soft_sha, soft_size = sha256_file_with_size(soft_video)
+                soft_key = _unique_storage_key(f"final/{task.id}/video_softsub", soft_sha, ".mkv")
+                store.upload_file(soft_video, soft_key, content_type="video/x-matroska")
+                _safe_upload_log(store, log_path, log_key)
+                db.add(
+                    Asset(
+                        task_id=task.id,
+                        kind=AssetKind.video_final,
+                        storage_key=soft_key,
+                        sha256=soft_sha,
+                        size_bytes=soft_size,
+                    )
                 )
-            )
 
         _raise_if_task_stopped(db, task.id)
         if burn_in or soft_sub:
@@ -2370,7 +2451,7 @@ def _after_render_publish_impl(render_job_id: str) -> dict[str, Any]:
             PublishAllRequest.model_validate(publish_payload),
             get_orchestrator_settings(),
             db,
-            S3Store(settings),
+            _s3(),
         )
 
         # Log partial failures but don't fail the task if at least one platform succeeded.
@@ -2501,8 +2582,7 @@ def _cleanup_task_impl(self: Any, task_id: str, batch_id: str | None = None) ->
       - AssetKind.publish_result
     """
     _ensure_db()
-    store = S3Store(settings)
-    store.ensure_bucket()
+    store = _s3()
 
     db = _db()
     tid: uuid.UUID | None = None
@@ -2697,6 +2777,12 @@ def recover_publish_dispatches() -> dict[str, int]:
         db.close()
 
 
+def _asset_storage_key(asset: Any) -> str | None:
+    if not isinstance(asset, dict):
+        return None
+    return str(asset.get("storage_key") or "").strip() or None
+
+
 @celery_app.task(name="subtitle_service.auto_youtube_pipeline", bind=True, acks_late=True, reject_on_worker_lost=True)
 def auto_youtube_pipeline(self: Any, task_id: str, overrides: dict[str, Any] | None = None) -> dict[str, str]:
     """
@@ -2707,8 +2793,7 @@ def auto_youtube_pipeline(self: Any, task_id: str, overrides: dict[str, Any] | N
       - publish to bilibili (optional, according to auto profile)
     """
     _ensure_db()
-    store = S3Store(settings)
-    store.ensure_bucket()
+    store = _s3()
 
     orch_base = str(settings.orchestrator_url or "").strip().rstrip("/") or "http://localhost:8000"
 
@@ -2859,7 +2944,9 @@ def auto_youtube_pipeline(self: Any, task_id: str, overrides: dict[str, Any] | N
 
         _raise_if_task_stopped(db, task.id)
 
-        yt_meta = yt.get("metadata") if isinstance(yt, dict) else {}
+        if not isinstance(yt, dict):
+            yt = {}
+        yt_meta = yt.get("metadata")
         if not isinstance(yt_meta, dict):
             yt_meta = {}
         yt_title = str(yt_meta.get("title") or "").strip()
@@ -2867,11 +2954,7 @@ def auto_youtube_pipeline(self: Any, task_id: str, overrides: dict[str, Any] | N
         webpage_url = str(yt_meta.get("webpage_url") or task.source_url or "").strip()
         yt_uploader = str(yt_meta.get("uploader") or yt_meta.get("channel") or yt_meta.get("uploader_id") or "").strip()
 
-        video_key = None
-        if isinstance(yt, dict):
-            va = yt.get("video_asset")
-            if isinstance(va, dict):
-                video_key = str(va.get("storage_key") or "").strip() or None
+        video_key = _asset_storage_key(yt.get("video_asset"))
         if not video_key:
             latest_video = (
                 db.query(Asset)
@@ -2883,11 +2966,7 @@ def auto_youtube_pipeline(self: Any, task_id: str, overrides: dict[str, Any] | N
         if not video_key:
             raise RuntimeError("no raw video asset found after youtube_download")
 
-        cover_key = None
-        if isinstance(yt, dict):
-            ca = yt.get("cover_asset")
-            if isinstance(ca, dict):
-                cover_key = str(ca.get("storage_key") or "").strip() or None
+        cover_key = _asset_storage_key(yt.get("cover_asset"))
         if not cover_key and profile.get("publish_use_youtube_cover"):
             latest_cover = (
                 db.query(Asset)
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import os
 import uuid
+from datetime import datetime
+from functools import partial
 from typing import Generator
 
+import anyio
 from fastapi import Body, Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.exc import IntegrityError
@@ -11,8 +14,7 @@ from sqlalchemy.orm import Session
 
 from videoroll.config import YouTubeIngestSettings, get_youtube_ingest_settings
 from videoroll.apps.security.service_auth import install_internal_service_auth, service_token
-from videoroll.db.base import Base
-from videoroll.db.auto_migrate import auto_migrate
+from videoroll.db.auto_migrate import auto_migrate, create_missing_tables
 from videoroll.db.models import (
     IngestedVideo,
     SourceType,
@@ -20,8 +22,7 @@ from videoroll.db.models import (
     TaskStatus,
     YouTubeSource,
 )
-from videoroll.db.session import db_session, get_engine
-from videoroll.storage.s3 import S3Store
+from videoroll.db.session import db_session, get_engine, get_sessionmaker
 from videoroll.apps.youtube_ingest.schemas import (
     YouTubeIngestRequest,
     YouTubeIngestResponse,
@@ -70,9 +71,8 @@ def _startup() -> None:
     settings = get_youtube_ingest_settings()
     app.state.internal_service_token = service_token(settings)
     engine = get_engine(settings.database_url)
-    Base.metadata.create_all(engine)
+    create_missing_tables(engine)
     auto_migrate(settings.database_url)
-    S3Store(settings).ensure_bucket()
 
 
 @app.get("/health")
@@ -140,11 +140,19 @@ def ingest_single(payload: YouTubeIngestRequest, db: Session = Depends(get_db))
     normalized_url = canonicalize_youtube_url(payload.url)
     video_id = extract_youtube_video_id(normalized_url)
     if video_id:
-        existing = db.query(IngestedVideo).filter(IngestedVideo.platform == "youtube", IngestedVideo.source_id == video_id).first()
-        if existing:
-            return YouTubeIngestResponse(task_id=existing.task_id, deduped=True, source_id=video_id)
+        existing_task_id = (
+            db.query(IngestedVideo.task_id)
+            .filter(IngestedVideo.platform == "youtube", IngestedVideo.source_id == video_id)
+            .scalar()
+        )
+        if existing_task_id:
+            return YouTubeIngestResponse(task_id=existing_task_id, deduped=True, source_id=video_id)
 
+    # Assigned client-side so neither the video row nor the response has to
+    # read the task back after commit() expires it.
+    task_id = uuid.uuid4()
     task = Task(
+        id=task_id,
         source_type=SourceType.youtube,
         source_url=normalized_url,
         source_license=payload.license,
@@ -154,57 +162,84 @@ def ingest_single(payload: YouTubeIngestRequest, db: Session = Depends(get_db))
     db.add(task)
     if video_id:
         db.flush()
-        db.add(IngestedVideo(platform="youtube", source_id=video_id, task_id=task.id))
+        db.add(IngestedVideo(platform="youtube", source_id=video_id, task_id=task_id))
     try:
         db.commit()
     except IntegrityError as e:
         # Concurrency-safe dedupe: another request inserted the same IngestedVideo.
         db.rollback()
         if video_id:
-            existing = (
-                db.query(IngestedVideo)
+            existing_task_id = (
+                db.query(IngestedVideo.task_id)
                 .filter(IngestedVideo.platform == "youtube", IngestedVideo.source_id == video_id)
-                .first()
+                .scalar()
             )
-            if existing:
-                return YouTubeIngestResponse(task_id=existing.task_id, deduped=True, source_id=video_id)
+            if existing_task_id:
+                return YouTubeIngestResponse(task_id=existing_task_id, deduped=True, source_id=video_id)
         raise HTTPException(status_code=500, detail=f"ingest failed: {e}") from e
 
-    db.refresh(task)
-    return YouTubeIngestResponse(task_id=task.id, deduped=False, source_id=video_id)
+    return YouTubeIngestResponse(task_id=task_id, deduped=False, source_id=video_id)
 
 
-@app.post("/youtube/scan", response_model=YouTubeScanResponse)
-def scan_source(
-    payload: YouTubeScanRequest,
-    settings: YouTubeIngestSettings = Depends(get_settings),
-    db: Session = Depends(get_db),
-) -> YouTubeScanResponse:
-    src = db.query(YouTubeSource).filter(YouTubeSource.source_type == payload.source_type, YouTubeSource.source_id == payload.source_id).first()
-    if not src or not src.enabled:
-        raise HTTPException(status_code=400, detail="source not found or disabled")
+def _scan_concurrency() -> int:
     try:
-        res = scan_youtube_source_by_id(
-            db,
-            src.id,
-            user_agent=settings.user_agent,
-            default_proxy=settings.youtube_proxy,
-            limit_override=payload.limit,
-            auto_process_override=payload.auto_process,
-            since=payload.since,
-            force=True,
-            raise_if_locked=True,
-            lock_owner_prefix="manual_youtube_source_scan",
-        )
-    except KeyError as e:
-        raise HTTPException(status_code=404, detail=str(e)) from e
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e)) from e
-    except RuntimeError as e:
-        msg = str(e)
-        if "already running" in msg:
-            raise HTTPException(status_code=409, detail=msg) from e
-        raise HTTPException(status_code=502, detail=msg) from e
+        return max(1, int(os.getenv("YOUTUBE_SCAN_CONCURRENCY", "4")))
+    except ValueError:
+        return 4
+
+
+_SCAN_LIMITER: anyio.CapacityLimiter | None = None
+
+
+def _scan_limiter() -> anyio.CapacityLimiter:
+    # Scans hold a thread for the whole feed fetch; give them their own small
+    # pool so a burst of scans cannot starve the shared threadpool that every
+    # other (sync) endpoint and dependency runs on.
+    global _SCAN_LIMITER
+    if _SCAN_LIMITER is None:
+        _SCAN_LIMITER = anyio.CapacityLimiter(_scan_concurrency())
+    return _SCAN_LIMITER
+
+
+def _run_source_scan(
+    settings: YouTubeIngestSettings,
+    source_pk: uuid.UUID | None,
+    *,
+    source_type: SourceType | None = None,
+    source_id: str | None = None,
+    limit: int | None = None,
+    auto_process: bool | None = None,
+    since: datetime | None = None,
+) -> YouTubeScanResponse:
+    with get_sessionmaker(settings.database_url)() as db:
+        if source_pk is None:
+            src = db.query(YouTubeSource).filter(YouTubeSource.source_type == source_type, YouTubeSource.source_id == source_id).first()
+            if not src or not src.enabled:
+                raise HTTPException(status_code=400, detail="source not found or disabled")
+            source_pk = src.id
+        try:
+            res = scan_youtube_source_by_id(
+                db,
+                source_pk,
+                user_agent=settings.user_agent,
+                default_proxy=settings.youtube_proxy,
+                redis_url=settings.redis_url,
+                limit_override=limit,
+                auto_process_override=auto_process,
+                since=since,
+                force=True,
+                raise_if_locked=True,
+                lock_owner_prefix="manual_youtube_source_scan",
+            )
+        except KeyError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        except RuntimeError as e:
+            msg = str(e)
+            if "already running" in msg:
+                raise HTTPException(status_code=409, detail=msg) from e
+            raise HTTPException(status_code=502, detail=msg) from e
 
     return YouTubeScanResponse(
         discovered_count=res.discovered_count,
@@ -214,38 +249,35 @@ def scan_source(
     )
 
 
+@app.post("/youtube/scan", response_model=YouTubeScanResponse)
+async def scan_source(
+    payload: YouTubeScanRequest,
+    settings: YouTubeIngestSettings = Depends(get_settings),
+) -> YouTubeScanResponse:
+    scan = partial(
+        _run_source_scan,
+        settings,
+        None,
+        source_type=payload.source_type,
+        source_id=payload.source_id,
+        limit=payload.limit,
+        auto_process=payload.auto_process,
+        since=payload.since,
+    )
+    return await anyio.to_thread.run_sync(scan, limiter=_scan_limiter())
+
+
 @app.post("/youtube/sources/{source_pk}/scan", response_model=YouTubeScanResponse)
-def scan_source_by_row_id(
+async def scan_source_by_row_id(
     source_pk: uuid.UUID,
     payload: YouTubeSourceScanRequest = Body(default=YouTubeSourceScanRequest()),
     settings: YouTubeIngestSettings = Depends(get_settings),
-    db: Session = Depends(get_db),
 ) -> YouTubeScanResponse:
-    try:
-        res = scan_youtube_source_by_id(
-            db,
-            source_pk,
-            user_agent=settings.user_agent,
-            default_proxy=settings.youtube_proxy,
-            limit_override=payload.limit,
-            auto_process_override=payload.auto_process,
-            force=True,
-            raise_if_locked=True,
-            lock_owner_prefix="manual_youtube_source_scan",
-        )
-    except KeyError as e:
-        raise HTTPException(status_code=404, detail=str(e)) from e
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e)) from e
-    except RuntimeError as e:
-        msg = str(e)
-        if "already running" in msg:
-            raise HTTPException(status_code=409, detail=msg) from e
-        raise HTTPException(status_code=502, detail=msg) from e
-
-    return YouTubeScanResponse(
-        discovered_count=res.discovered_count,
-        created_task_ids=res.created_task_ids,
-        skipped_duplicates=res.skipped_duplicates,
-        started_pipeline_job_ids=res.started_pipeline_job_ids,
+    scan = partial(
+        _run_source_scan,
+        settings,
+        source_pk,
+        limit=payload.limit,
+        auto_process=payload.auto_process,
     )
+    return await anyio.to_thread.run_sync(scan, limiter=_scan_limiter())
@@ -2,18 +2,19 @@ from __future__ import annotations
 
 import logging
 import uuid
+from contextlib import AbstractContextManager, ExitStack
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
 import yt_dlp
-from sqlalchemy import select
+from sqlalchemy import delete, exists, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from videoroll.apps.subtitle_service.auto_profile_store import get_auto_profile
-from videoroll.apps.youtube_ingest.youtube_feed import fetch_youtube_feed
-from videoroll.apps.youtube_settings_store import get_youtube_settings
+from videoroll.apps.youtube_ingest.youtube_feed import FeedEntry, fetch_youtube_feed_cached
+from videoroll.apps.youtube_settings_store import get_youtube_proxy
 from videoroll.db.models import (
     IngestedVideo,
     SourceLicense,
@@ -122,20 +123,84 @@ def _looks_like_channel_id(value: str) -> bool:
     return raw.startswith("UC") and len(raw) >= 16
 
 
-def _start_auto_pipeline(task_id: uuid.UUID, *, auto_publish: bool | None = None) -> str:
+def _start_auto_pipeline(task_id: uuid.UUID, *, auto_publish: bool | None = None, producer: Any | None = None) -> str:
     from videoroll.apps.subtitle_service.worker import celery_app as subtitle_celery_app
 
     task_args: list[Any] = [str(task_id)]
     if auto_publish is not None:
         task_args.append({"auto_publish": bool(auto_publish)})
-    res = subtitle_celery_app.send_task(
-        "subtitle_service.auto_youtube_pipeline",
-        args=task_args,
-        queue="subtitle",
-    )
+    send_kwargs: dict[str, Any] = {"args": task_args, "queue": "subtitle"}
+    if producer is not None:
+        send_kwargs["producer"] = producer
+    res = subtitle_celery_app.send_task("subtitle_service.auto_youtube_pipeline", **send_kwargs)
     return str(res.id)
 
 
+def _auto_pipeline_producer() -> AbstractContextManager[Any]:
+    """Hold one broker producer for a batch of _start_auto_pipeline() calls.
+
+    send_task() otherwise checks a producer (and its connection/channel) out
+    of the pool and back in for every message.
+    """
+    from videoroll.apps.subtitle_service.worker import celery_app as subtitle_celery_app
+
+    return subtitle_celery_app.producer_or_acquire()
+
+
+def _scan_entry_rows(entry: FeedEntry, source: YouTubeSource, *, created_by: str | None) -> tuple[Task, IngestedVideo]:
+    # The task id is assigned here so the IngestedVideo row can point at it
+    # without reading anything back from the database.
+    task = Task(
+        id=uuid.uuid4(),
+        source_type=SourceType.youtube,
+        source_url=f"https://www.youtube.com/watch?v={entry.video_id}",
+        source_license=source.license,
+        source_proof_url=source.proof_url,
+        status=TaskStatus.ingested,
+        created_by=created_by,
+    )
+    video = IngestedVideo(
+        platform="youtube",
+        source_id=entry.video_id,
+        task_id=task.id,
+        published_at=entry.published_at,
+    )
+    return task, video
+
+
+def _insert_new_ingested_videos(db: Session, videos: list[IngestedVideo]) -> set[str] | None:
+    """Insert ``videos`` with ON CONFLICT DO NOTHING and return the source ids actually inserted.
+
+    Returns None without inserting anything on dialects lacking ON CONFLICT.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+
+    stmt = (
+        insert(IngestedVideo)
+        .values(
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "platform": video.platform,
+                    "source_id": video.source_id,
+                    "task_id": video.task_id,
+                    "published_at": video.published_at,
+                }
+                for video in videos
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=[IngestedVideo.platform, IngestedVideo.source_id])
+        .returning(IngestedVideo.source_id)
+    )
+    return set(db.scalars(stmt))
+
+
 def _build_resolved_source(
     source_type: str,
     source_id: str,
@@ -347,8 +412,7 @@ def upsert_youtube_source(
     user_agent: str,
     default_proxy: str | None = None,
 ) -> YouTubeSource:
-    yt_cfg = get_youtube_settings(db, default_proxy=default_proxy)
-    proxy = str(yt_cfg.get("proxy") or "").strip() or default_proxy or None
+    proxy = get_youtube_proxy(db, default_proxy=default_proxy) or default_proxy or None
 
     if str(source_input or "").strip():
         resolved = resolve_youtube_source_input(str(source_input or ""), user_agent, proxy=proxy)
@@ -416,6 +480,11 @@ def update_youtube_source(db: Session, source_pk: uuid.UUID, updates: dict[str,
     return src
 
 
+def _published_at_or_before(entry: Any, since: datetime | None) -> bool:
+    published_at = getattr(entry, "published_at", None)
+    return since is not None and published_at is not None and published_at <= since
+
+
 def _prepare_scan_entries(
     entries: list[Any],
     *,
@@ -430,8 +499,7 @@ def _prepare_scan_entries(
         video_id = str(getattr(entry, "video_id", "") or "").strip()
         if not video_id or video_id in seen_video_ids:
             continue
-        published_at = getattr(entry, "published_at", None)
-        if since is not None and published_at is not None and published_at <= since:
+        if _published_at_or_before(entry, since):
             continue
         seen_video_ids.add(video_id)
         unique_entries.append(entry)
@@ -448,6 +516,7 @@ def scan_youtube_source_by_id(
     *,
     user_agent: str,
     default_proxy: str | None = None,
+    redis_url: str | None = None,
     limit_override: int | None = None,
     auto_process_override: bool | None = None,
     since: datetime | None = None,
@@ -479,8 +548,7 @@ def scan_youtube_source_by_id(
     limit = normalize_source_scan_limit(limit_override if limit_override is not None else getattr(locked, "scan_limit", None))
     auto_process = bool(getattr(locked, "auto_process", True)) if auto_process_override is None else bool(auto_process_override)
     auto_publish = bool(get_auto_profile(db).get("auto_publish")) if auto_process else None
-    yt_cfg = get_youtube_settings(db, default_proxy=default_proxy)
-    proxy = str(yt_cfg.get("proxy") or "").strip() or default_proxy or None
+    proxy = get_youtube_proxy(db, default_proxy=default_proxy) or default_proxy or None
 
     created: list[uuid.UUID] = []
     started: list[str] = []
@@ -489,20 +557,25 @@ def scan_youtube_source_by_id(
 
     try:
         try:
-            entries = list(
-                fetch_youtube_feed(
-                    locked.source_type.value,
-                    locked.source_id,
-                    user_agent=user_agent,
-                    proxy=proxy,
-                    limit=None,
-                )
+            entries = fetch_youtube_feed_cached(
+                locked.source_type.value,
+                locked.source_id,
+                user_agent=user_agent,
+                redis_url=redis_url,
+                proxy=proxy,
+                limit=None,
             )
         except Exception as e:
             raise RuntimeError(f"fetch youtube feed failed: {e}") from e
 
         existing_video_ids: set[str] = set()
-        entry_video_ids = [entry.video_id for entry in entries if str(getattr(entry, "video_id", "") or "").strip()]
+        # The listing is cached and shared, so `since` is applied here rather
+        # than in the fetcher; it still keeps old entries out of the IN query.
+        entry_video_ids = [
+            entry.video_id
+            for entry in entries
+            if str(getattr(entry, "video_id", "") or "").strip() and not _published_at_or_before(entry, since)
+        ]
         if entry_video_ids:
             existing_rows = (
                 db.query(IngestedVideo.source_id)
@@ -518,47 +591,74 @@ def scan_youtube_source_by_id(
             since=since,
         )
 
-        for entry in selected_entries:
-            task = Task(
-                source_type=SourceType.youtube,
-                source_url=f"https://www.youtube.com/watch?v={entry.video_id}",
-                source_license=locked.license,
-                source_proof_url=locked.proof_url,
-                status=TaskStatus.ingested,
-                created_by=encode_auto_youtube_created_by("auto_youtube", auto_publish=auto_publish) if auto_process else None,
-            )
-            db.add(task)
+        created_by = encode_auto_youtube_created_by("auto_youtube", auto_publish=auto_publish) if auto_process else None
+        scan_rows = [_scan_entry_rows(entry, locked, created_by=created_by) for entry in selected_entries]
+        created_video_ids: list[tuple[uuid.UUID, str]] = []
+        if scan_rows:
+            # Read before commit() expires the rows.
+            batch_ids = [(task.id, video.source_id) for task, video in scan_rows]
+            db.add_all([task for task, _ in scan_rows])
             db.flush()
-            db.add(
-                IngestedVideo(
-                    platform="youtube",
-                    source_id=entry.video_id,
-                    task_id=task.id,
-                    published_at=entry.published_at,
-                )
-            )
-            try:
+            inserted = _insert_new_ingested_videos(db, [video for _, video in scan_rows])
+            if inserted is not None:
+                # Videos a concurrent ingest claimed since the dedupe query were
+                # skipped by ON CONFLICT; drop their tasks in the same transaction.
+                orphan_task_ids = [task.id for task, video in scan_rows if video.source_id not in inserted]
+                if orphan_task_ids:
+                    db.execute(delete(Task).where(Task.id.in_(orphan_task_ids)))
                 db.commit()
-            except IntegrityError:
-                db.rollback()
-                if (
-                    db.query(IngestedVideo)
-                    .filter(IngestedVideo.platform == "youtube", IngestedVideo.source_id == entry.video_id)
-                    .first()
-                    is not None
-                ):
-                    skipped += 1
-                    continue
-                raise
-
-            db.refresh(task)
-            created.append(task.id)
-            if auto_process:
+                batch_ids = [ids for ids in batch_ids if ids[1] in inserted]
+                skipped += len(scan_rows) - len(batch_ids)
+                created_video_ids.extend(batch_ids)
+                created.extend(task_id for task_id, _ in batch_ids)
+            else:
+                # Dialects without ON CONFLICT: one transaction for the batch. A
+                # unique-key race fails it as a unit, so redo it one entry at a
+                # time and skip whatever was taken.
+                db.add_all([video for _, video in scan_rows])
                 try:
-                    started.append(_start_auto_pipeline(task.id, auto_publish=auto_publish))
-                except Exception as e:
-                    error_message = _trim_error_message(f"{entry.video_id}: start pipeline failed: {e}")
-                    logger.exception("failed to start auto pipeline for youtube source task %s", task.id)
+                    db.commit()
+                    created_video_ids.extend(batch_ids)
+                    created.extend(task_id for task_id, _ in batch_ids)
+                except IntegrityError:
+                    db.rollback()
+                    for entry in selected_entries:
+                        task, video = _scan_entry_rows(entry, locked, created_by=created_by)
+                        task_id = task.id
+                        db.add(task)
+                        db.flush()
+                        db.add(video)
+                        try:
+                            db.commit()
+                        except IntegrityError:
+                            db.rollback()
+                            if db.scalar(
+                                select(
+                                    exists().where(
+                                        IngestedVideo.platform == "youtube",
+                                        IngestedVideo.source_id == entry.video_id,
+                                    )
+                                )
+                            ):
+                                skipped += 1
+                                continue
+                            raise
+                        created_video_ids.append((task_id, entry.video_id))
+                        created.append(task_id)
+
+        if auto_process and created_video_ids:
+            # Entered on the first pipeline start, so a broker outage still only
+            # fails the starts (tasks are created either way) rather than the scan.
+            with ExitStack() as producers:
+                producer: Any | None = None
+                for task_id, video_id in created_video_ids:
+                    try:
+                        if producer is None:
+                            producer = producers.enter_context(_auto_pipeline_producer())
+                        started.append(_start_auto_pipeline(task_id, auto_publish=auto_publish, producer=producer))
+                    except Exception as e:
+                        error_message = _trim_error_message(f"{video_id}: start pipeline failed: {e}")
+                        logger.exception("failed to start auto pipeline for youtube source task %s", task_id)
 
         finish_youtube_source_scan_lock(
             db,
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+import atexit
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 import httpx
 import yt_dlp
 from defusedxml.ElementTree import fromstring
+from redis import Redis
+
+
+logger = logging.getLogger(__name__)
+
+_FEED_CACHE_PREFIX = "videoroll:youtube-feed:v1:"
+_FEED_CACHE_CLIENT_LOCK = threading.Lock()
+_FEED_CACHE_CLIENTS: dict[tuple[int, str], Redis] = {}
 
 
 @dataclass(frozen=True)
@@ -17,8 +31,7 @@ class FeedEntry:
 
 
 def _parse_datetime(value: str) -> datetime:
-    # Expected: 2026-02-19T12:34:56+00:00 or Z
-    value = value.replace("Z", "+00:00")
+    # Expected: 2026-02-19T12:34:56+00:00 or Z (fromisoformat accepts "Z" since 3.11).
     return datetime.fromisoformat(value)
 
 
@@ -47,6 +60,59 @@ def _parse_ytdlp_entry_datetime(entry: dict[str, Any]) -> datetime:
     return _utcnow()
 
 
+# Idle instances kept per key; matches the default YOUTUBE_SCAN_CONCURRENCY.
+_FEED_YDL_POOL_SIZE = 4
+_FEED_YDL_POOLS: dict[tuple[int, str, Optional[str]], list[yt_dlp.YoutubeDL]] = {}
+_FEED_YDLS_LOCK = threading.Lock()
+
+
+def _new_feed_ydl(user_agent: str, proxy: Optional[str]) -> yt_dlp.YoutubeDL:
+    opts: dict[str, Any] = {
+        "quiet": True,
+        "no_warnings": True,
+        "extract_flat": True,
+        "skip_download": True,
+        "retries": 3,
+        "fragment_retries": 3,
+        "http_headers": {"User-Agent": user_agent},
+    }
+    if proxy:
+        opts["proxy"] = proxy
+    return yt_dlp.YoutubeDL(opts)
+
+
+@contextmanager
+def _checkout_feed_ydl(user_agent: str, proxy: Optional[str]) -> Iterator[yt_dlp.YoutubeDL]:
+    """
+    Borrow a flat-extraction YoutubeDL for (user agent, proxy).
+
+    Building one loads every extractor and a cookie jar, which costs more than
+    a small channel listing, so idle instances are pooled per key (and per
+    PID, like the RSS clients below).  A YoutubeDL is not safe for concurrent
+    use, so each checkout gets an instance of its own and concurrent scans
+    never wait on each other.
+    """
+    key = (os.getpid(), user_agent, proxy)
+    with _FEED_YDLS_LOCK:
+        pool = _FEED_YDL_POOLS.get(key)
+        ydl = pool.pop() if pool else None
+    if ydl is None:
+        ydl = _new_feed_ydl(user_agent, proxy)
+    try:
+        yield ydl
+    finally:
+        with _FEED_YDLS_LOCK:
+            pool = _FEED_YDL_POOLS.setdefault(key, [])
+            keep = len(pool) < _FEED_YDL_POOL_SIZE
+            if keep:
+                pool.append(ydl)
+        if not keep:
+            try:
+                ydl.close()
+            except Exception:
+                pass
+
+
 def _fetch_feed_ytdlp(
     source_type: str,
     source_id: str,
@@ -62,36 +128,31 @@ def _fetch_feed_ytdlp(
     else:
         raise ValueError("invalid source_type")
 
-    proxy = (proxy or "").strip() or None
-    opts: dict[str, Any] = {
-        "quiet": True,
-        "no_warnings": True,
-        "extract_flat": True,
-        "skip_download": True,
-        "retries": 3,
-        "fragment_retries": 3,
-        "http_headers": {"User-Agent": user_agent},
-    }
-    if proxy:
-        opts["proxy"] = proxy
+    playlistend: Optional[int] = None
     if limit is not None:
         try:
-            opts["playlistend"] = max(1, int(limit))
+            playlistend = max(1, int(limit))
         except Exception:
             pass
 
-    with yt_dlp.YoutubeDL(opts) as ydl:
+    with _checkout_feed_ydl(user_agent, (proxy or "").strip() or None) as ydl:
+        # playlistend lives in the pooled instance's params, so set it per call.
+        if playlistend is None:
+            ydl.params.pop("playlistend", None)
+        else:
+            ydl.params["playlistend"] = playlistend
         info = ydl.extract_info(url, download=False)
 
-    d = info if isinstance(info, dict) else {}
-    entries = d.get("entries")
-    if entries is None:
-        return []
-    if not isinstance(entries, list):
-        try:
-            entries = list(entries)  # type: ignore[arg-type]
-        except Exception:
+        d = info if isinstance(info, dict) else {}
+        entries = d.get("entries")
+        if entries is None:
             return []
+        if not isinstance(entries, list):
+            # Lazy entries may still fetch pages, so drain them while checked out.
+            try:
+                entries = list(entries)  # type: ignore[arg-type]
+            except Exception:
+                return []
 
     out: list[FeedEntry] = []
     for item in entries:
@@ -112,6 +173,52 @@ def _fetch_feed_ytdlp(
     return out
 
 
+_RSS_CLIENTS: dict[tuple[int, str, Optional[str], float], httpx.Client] = {}
+_RSS_CLIENTS_LOCK = threading.Lock()
+
+
+def _rss_http_client(user_agent: str, proxy: Optional[str], timeout_s: float) -> httpx.Client:
+    """
+    Process-wide RSS client per (user agent, proxy, timeout), so repeated
+    scans reuse keep-alive connections to youtube.com instead of paying a
+    TCP/TLS handshake per feed. Keyed by PID so forked workers never share
+    the parent's sockets.
+    """
+    key = (os.getpid(), user_agent, proxy, float(timeout_s))
+    with _RSS_CLIENTS_LOCK:
+        client = _RSS_CLIENTS.get(key)
+        if client is None:
+            headers = {"User-Agent": user_agent}
+            try:
+                if proxy:
+                    client = httpx.Client(timeout=timeout_s, headers=headers, follow_redirects=True, proxy=proxy)
+                else:
+                    client = httpx.Client(timeout=timeout_s, headers=headers, follow_redirects=True)
+            except TypeError:
+                # httpx releases without the proxy= keyword.
+                client = httpx.Client(timeout=timeout_s, headers=headers, follow_redirects=True)
+            _RSS_CLIENTS[key] = client
+        return client
+
+
+def close_youtube_feed_clients() -> None:
+    with _RSS_CLIENTS_LOCK:
+        clients: list[Any] = list(_RSS_CLIENTS.values())
+        _RSS_CLIENTS.clear()
+    with _FEED_YDLS_LOCK:
+        for pool in _FEED_YDL_POOLS.values():
+            clients.extend(pool)
+        _FEED_YDL_POOLS.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+atexit.register(close_youtube_feed_clients)
+
+
 def _fetch_feed_rss(
     source_type: str,
     source_id: str,
@@ -127,36 +234,21 @@ def _fetch_feed_rss(
     else:
         raise ValueError("invalid source_type")
 
-    headers = {"User-Agent": user_agent}
-
-    proxy = (proxy or "").strip() or None
-    client_kwargs: dict[str, Any] = {"timeout": timeout_s, "headers": headers, "follow_redirects": True}
-    if proxy:
-        try:
-            client_kwargs["proxy"] = proxy
-        except Exception:
-            pass
-
     # 2025+ YouTube RSS feeds are intermittently unavailable (often 404).
     # Prefer RSS when it works (fast), but fall back to yt-dlp extraction when it doesn't.
-    text: Optional[str] = None
+    body: Optional[bytes] = None
     try:
-        try:
-            with httpx.Client(**client_kwargs) as client:
-                resp = client.get(url)
-                resp.raise_for_status()
-                text = resp.text
-        except TypeError:
-            with httpx.Client(timeout=timeout_s, headers=headers, follow_redirects=True) as client:
-                resp = client.get(url)
-                resp.raise_for_status()
-                text = resp.text
+        resp = _rss_http_client(user_agent, (proxy or "").strip() or None, timeout_s).get(url)
+        resp.raise_for_status()
+        # Parse the raw bytes; expat honours the XML declaration's encoding,
+        # so decoding to str first would only add a copy.
+        body = resp.content
     except Exception:
-        text = None
+        body = None
 
-    if text:
+    if body:
         try:
-            root = fromstring(text)
+            root = fromstring(body)
             ns = {
                 "atom": "http://www.w3.org/2005/Atom",
                 "yt": "http://www.youtube.com/xml/schemas/2015",
@@ -222,3 +314,62 @@ def fetch_youtube_feed(
             for entry in entries:
                 yield entry
             return
+
+
+def _feed_cache_seconds() -> int:
+    try:
+        return max(0, int(os.getenv("YOUTUBE_FEED_CACHE_SECONDS", "60")))
+    except ValueError:
+        return 60
+
+
+def _feed_cache_client(redis_url: str) -> Redis:
+    key = (os.getpid(), redis_url)
+    with _FEED_CACHE_CLIENT_LOCK:
+        client = _FEED_CACHE_CLIENTS.get(key)
+        if client is None:
+            client = Redis.from_url(redis_url, decode_responses=True, socket_connect_timeout=0.5, socket_timeout=0.5)
+            _FEED_CACHE_CLIENTS[key] = client
+        return client
+
+
+def fetch_youtube_feed_cached(
+    source_type: str,
+    source_id: str,
+    user_agent: str,
+    *,
+    redis_url: Optional[str],
+    proxy: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> list[FeedEntry]:
+    """
+    fetch_youtube_feed() behind a short Redis cache (YOUTUBE_FEED_CACHE_SECONDS,
+    0 disables), so back-to-back scans of one source skip the yt-dlp/RSS fetch.
+
+    Empty results are not cached, and Redis errors fall through to a live fetch.
+    """
+    ttl = _feed_cache_seconds()
+    if not redis_url or ttl <= 0:
+        return list(fetch_youtube_feed(source_type, source_id, user_agent, proxy=proxy, limit=limit))
+
+    cache_key = f"{_FEED_CACHE_PREFIX}{source_type}:{source_id}:{'all' if limit is None else int(limit)}"
+    try:
+        raw = _feed_cache_client(redis_url).get(cache_key)
+        if raw:
+            return [
+                FeedEntry(video_id=item["video_id"], title=item["title"], published_at=_parse_datetime(item["published_at"]))
+                for item in json.loads(raw)
+            ]
+    except Exception as e:
+        logger.warning("youtube feed cache read failed: %s", e)
+
+    entries = list(fetch_youtube_feed(source_type, source_id, user_agent, proxy=proxy, limit=limit))
+    if entries:
+        payload = [
+            {"video_id": e.video_id, "title": e.title, "published_at": e.published_at.isoformat()} for e in entries
+        ]
+        try:
+            _feed_cache_client(redis_url).setex(cache_key, ttl, json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+        except Exception as e:
+            logger.warning("youtube feed cache write failed: %s", e)
+    return entries
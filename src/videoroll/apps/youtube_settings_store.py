@@ -8,12 +8,18 @@ from typing import Any, Optional
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from videoroll.db.app_setting_cache import AppSettingCache
+from videoroll.db.app_settings import get_app_setting_value
 from videoroll.db.models import AppSetting
 from videoroll.utils.fernet import decrypt_str, encrypt_str
 
 
 YOUTUBE_SETTINGS_KEY = "youtube.settings"
 
+# Source scans only need the proxy, which changes from the settings page;
+# get_youtube_settings() also decrypts and parses the stored cookies.
+_PROXY_CACHE = AppSettingCache(ttl_seconds=10.0)
+
 _MAX_PROXY_LEN = 2048
 _MAX_COOKIES_LEN = 200_000
 _MAX_ERROR_LEN = 1000
@@ -394,6 +400,21 @@ def get_youtube_settings(db: Session, *, default_proxy: Optional[str] = None) ->
     }
 
 
+def _load_stored_proxy(db: Session) -> Optional[str]:
+    stored = _as_dict(get_app_setting_value(db, YOUTUBE_SETTINGS_KEY))
+    if "proxy" not in stored:
+        return None
+    return str(stored.get("proxy") or "").strip()[:_MAX_PROXY_LEN]
+
+
+def get_youtube_proxy(db: Session, *, default_proxy: Optional[str] = None) -> str:
+    """Same value as get_youtube_settings(...)["proxy"], served from a short TTL cache."""
+    stored = _PROXY_CACHE.get(db, YOUTUBE_SETTINGS_KEY, lambda: _load_stored_proxy(db))
+    if stored is None:
+        return str(default_proxy or "").strip()[:_MAX_PROXY_LEN]
+    return stored
+
+
 def update_youtube_settings(db: Session, update: dict[str, Any], *, default_proxy: Optional[str] = None) -> dict[str, Any]:
     row = _get_row(db)
     stored = dict(_as_dict(row.value_json))
@@ -460,6 +481,7 @@ def update_youtube_settings(db: Session, update: dict[str, Any], *, default_prox
     row.value_json = stored
     db.add(row)
     db.commit()
+    _PROXY_CACHE.invalidate(YOUTUBE_SETTINGS_KEY)
 
     return get_youtube_settings(db, default_proxy=default_proxy)
 
@@ -58,14 +58,15 @@ class SubtitleServiceSettings(CommonSettings):
     asr_engine: str = Field("faster-whisper", alias="SUBTITLE_ASR_ENGINE")
     whisper_model: str = Field("tiny", alias="SUBTITLE_WHISPER_MODEL")
     whisper_device: str = Field("cpu", alias="SUBTITLE_WHISPER_DEVICE")
-    whisper_compute_type: str = Field("int8", alias="SUBTITLE_WHISPER_COMPUTE_TYPE")
+    # CTranslate2 compute type; "auto" picks int8_float16 on CUDA and int8 on CPU.
+    whisper_compute_type: str = Field("auto", alias="SUBTITLE_WHISPER_COMPUTE_TYPE")
     whisper_model_dir: str = Field("/models/whisper", alias="SUBTITLE_WHISPER_MODEL_DIR")
     openvino_model: str = Field("", alias="SUBTITLE_OPENVINO_MODEL")
     openvino_device: str = Field("GPU", alias="SUBTITLE_OPENVINO_DEVICE")
     openvino_num_beams: int = Field(1, alias="SUBTITLE_OPENVINO_NUM_BEAMS")
     openvino_max_new_tokens: int = Field(448, alias="SUBTITLE_OPENVINO_MAX_NEW_TOKENS")
     # faster-whisper runtime parallelism (CPU only):
-    # - cpu_threads=0 means "auto" (use available CPUs).
+    # - cpu_threads=0 means "auto" (available CPUs split across the task queue max_concurrency).
     # - num_workers defaults to 1 to avoid memory spikes.
     whisper_cpu_threads: int = Field(0, alias="SUBTITLE_WHISPER_CPU_THREADS")
     whisper_num_workers: int = Field(1, alias="SUBTITLE_WHISPER_NUM_WORKERS")
@@ -86,6 +87,12 @@ class SubtitleServiceSettings(CommonSettings):
     translate_batch_size: int = Field(50, alias="SUBTITLE_TRANSLATE_BATCH_SIZE")
     translate_enable_summary: bool = Field(True, alias="SUBTITLE_TRANSLATE_ENABLE_SUMMARY")
     translate_max_retries: int = Field(2, alias="SUBTITLE_TRANSLATE_MAX_RETRIES")
+    # Batches translated in parallel per job; only applies when the running
+    # summary is disabled, since each batch otherwise depends on the last.
+    translate_concurrency: int = Field(4, alias="SUBTITLE_TRANSLATE_CONCURRENCY")
+    # SQLite file caching translation responses; empty means
+    # <WORK_DIR>/cache/translate_cache.sqlite, "off" disables it.
+    translate_cache_path: str = Field("", alias="SUBTITLE_TRANSLATE_CACHE")
 
     openai_api_key: str | None = Field(None, alias="OPENAI_API_KEY")
     openai_base_url: str = Field("https://api.openai.com/v1", alias="OPENAI_BASE_URL")
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+
+T = TypeVar("T")
+
+
+class AppSettingCache:
+    """Process-local TTL cache for values derived from AppSetting rows.
+
+    Entries are scoped to the session's engine so separate databases (and
+    throwaway test engines) never share values.  Writers call invalidate()
+    after committing; other processes converge once their entry expires.
+    Sessions without a bind (test doubles) always read through.
+
+    When an entry expires, one thread reloads it while concurrent readers
+    keep getting the expired value instead of all hitting the database.
+    Invalidated entries have nothing stale to serve and are reloaded by
+    whoever asks.
+    """
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int = 1024) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: weakref.WeakKeyDictionary[Any, dict[str, tuple[float, Any]]] = weakref.WeakKeyDictionary()
+        self._refreshing: set[tuple[int, str]] = set()
+
+    @staticmethod
+    def _bind(db: Any) -> Any | None:
+        get_bind = getattr(db, "get_bind", None)
+        if get_bind is None:
+            return None
+        try:
+            return get_bind()
+        except Exception:
+            return None
+
+    def get(self, db: Any, key: str, load: Callable[[], T]) -> T:
+        bind = self._bind(db)
+        if bind is None:
+            return load()
+        now = time.monotonic()
+        refresh_key: tuple[int, str] | None = None
+        with self._lock:
+            entry = self._entries.get(bind, {}).get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    return entry[1]
+                refresh_key = (id(bind), key)
+                if refresh_key in self._refreshing:
+                    return entry[1]
+                self._refreshing.add(refresh_key)
+        try:
+            value = load()
+            with self._lock:
+                entries = self._entries.setdefault(bind, {})
+                entries.pop(key, None)
+                entries[key] = (now + self._ttl_seconds, value)
+                if len(entries) > self._max_entries:
+                    self._evict(entries, now)
+        finally:
+            if refresh_key is not None:
+                with self._lock:
+                    self._refreshing.discard(refresh_key)
+        return value
+
+    def _evict(self, entries: dict[str, tuple[float, Any]], now: float) -> None:
+        for stale in [k for k, (expires_at, _) in entries.items() if expires_at <= now]:
+            del entries[stale]
+        # Still full: drop the oldest inserts first (dicts keep insertion order).
+        while len(entries) > self._max_entries:
+            del entries[next(iter(entries))]
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            for entries in self._entries.values():
+                entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
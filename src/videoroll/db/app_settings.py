@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.orm import Session
+
+from videoroll.db.models import AppSetting
+
+
+# Built once so hot settings lookups skip statement construction; SQLAlchemy's
+# per-engine compiled cache then serves every call from the same cache key.
+_SELECT_VALUE_JSON = select(AppSetting.value_json).where(AppSetting.key == bindparam("key"))
+
+
+def get_app_setting_value(db: Session, key: str) -> Any:
+    """Return the stored value_json for ``key`` (or None) without loading the ORM row."""
+    return db.execute(_SELECT_VALUE_JSON, {"key": key}).scalar_one_or_none()
+
+
+def upsert_app_setting(db: Session, key: str, value_json: dict[str, Any]) -> None:
+    """Insert or replace one AppSetting value in a single statement.
+
+    Does not commit.  Any AppSetting instance for ``key`` already loaded in
+    ``db`` is left stale, so callers should not mix this with ORM reads of
+    the same row inside one transaction.
+    """
+    upsert_app_settings(db, {key: value_json})
+
+
+def upsert_app_settings(db: Session, values: Mapping[str, dict[str, Any]]) -> None:
+    """Insert or replace several AppSetting values with one multi-row statement.
+
+    Same caveats as upsert_app_setting(); an empty mapping is a no-op.
+    """
+    if not values:
+        return
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        for key, value_json in values.items():
+            row = db.get(AppSetting, key)
+            if row is None:
+                db.add(AppSetting(key=key, value_json=value_json))
+            else:
+                row.value_json = value_json
+        db.flush()
+        return
+
+    stmt = insert(AppSetting).values([{"key": key, "value_json": value_json} for key, value_json in values.items()])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AppSetting.key],
+        # Core upserts skip Python-side onupdate hooks, so bump updated_at here.
+        set_={"value_json": stmt.excluded.value_json, "updated_at": func.now()},
+    )
+    db.execute(stmt)
@@ -5,9 +5,10 @@ import os
 from contextlib import contextmanager
 from functools import lru_cache
 
-from sqlalchemy import inspect, text
+from sqlalchemy import MetaData, inspect, text
 from sqlalchemy.engine import Engine
 
+from videoroll.db.base import Base
 from videoroll.db.session import get_engine
 
 
@@ -246,6 +247,21 @@ def _ensure_scheduler_indexes(engine: Engine) -> None:
             conn.execute(text("CREATE INDEX IF NOT EXISTS ix_render_jobs_status_created_at ON render_jobs (status, created_at)"))
 
 
+def _ensure_ingested_videos_lookup_index(engine: Engine) -> None:
+    # INCLUDE is Postgres-only; elsewhere the unique constraint already serves the lookup.
+    if (engine.dialect.name or "").lower() != "postgresql":
+        return
+    if "ingested_videos" not in set(inspect(engine).get_table_names()):
+        return
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_ingested_videos_lookup "
+                "ON ingested_videos (platform, source_id) INCLUDE (task_id)"
+            )
+        )
+
+
 def _ensure_publish_jobs_generic_columns(engine: Engine) -> None:
     insp = inspect(engine)
     if "publish_jobs" not in set(insp.get_table_names()):
@@ -698,6 +714,20 @@ def _ensure_pgvector_rag_tables(engine: Engine) -> None:
         )
 
 
+def create_missing_tables(engine: Engine, metadata: MetaData | None = None) -> None:
+    """
+    Base.metadata.create_all() limited to tables the database does not have yet.
+
+    create_all() probes every table with its own query on each startup; one
+    table-name listing lets an initialised database skip all of that.
+    """
+    metadata = Base.metadata if metadata is None else metadata
+    existing = set(inspect(engine).get_table_names())
+    missing = [table for table in metadata.sorted_tables if table.name not in existing]
+    if missing:
+        metadata.create_all(engine, tables=missing)
+
+
 def auto_migrate_engine(engine: Engine) -> None:
     """
     Legacy additive compatibility checks for deployments without Alembic.
@@ -718,6 +748,7 @@ def auto_migrate_engine(engine: Engine) -> None:
         _backfill_publish_batch_lifecycle(engine)
         _ensure_account_check_columns(engine)
         _ensure_scheduler_indexes(engine)
+        _ensure_ingested_videos_lookup_index(engine)
         _ensure_pgvector_rag_tables(engine)
 
 
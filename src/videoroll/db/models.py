@@ -22,7 +22,7 @@ from sqlalchemy import (
     text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, WriteOnlyMapped, mapped_column, relationship
 
 from videoroll.db.base import Base
 
@@ -160,7 +160,9 @@ class Task(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
 
-    assets: Mapped[list["Asset"]] = relationship(back_populates="task", cascade="all, delete-orphan")
+    # Tasks accumulate many assets (segments, logs, subtitles); never load them
+    # all implicitly.  Query via task.assets.select() or asset_service instead.
+    assets: WriteOnlyMapped["Asset"] = relationship(back_populates="task", cascade="all, delete-orphan", passive_deletes=True)
     subtitles: Mapped[list["Subtitle"]] = relationship(back_populates="task", cascade="all, delete-orphan")
     publish_jobs: Mapped[list["PublishJob"]] = relationship(back_populates="task", cascade="all, delete-orphan")
     publish_batches: Mapped[list["PublishBatch"]] = relationship(back_populates="task", cascade="all, delete-orphan")
@@ -256,8 +258,10 @@ class PublishJob(Base):
 
     task: Mapped["Task"] = relationship(back_populates="publish_jobs")
     batch: Mapped[Optional["PublishBatch"]] = relationship(back_populates="publish_jobs")
-    account: Mapped[Optional["Account"]] = relationship(foreign_keys=[account_id])
-    bili_account: Mapped[Optional["Account"]] = relationship(foreign_keys=[bili_account_id])
+    # Job listings filter on the id columns only; loading an account per job
+    # row must be an explicit selectinload/joinedload, never an implicit N+1.
+    account: Mapped[Optional["Account"]] = relationship(foreign_keys=[account_id], lazy="raise_on_sql")
+    bili_account: Mapped[Optional["Account"]] = relationship(foreign_keys=[bili_account_id], lazy="raise_on_sql")
 
     __table_args__ = (
         Index("ix_publish_jobs_task_state", "task_id", "state"),
@@ -541,6 +545,8 @@ class IngestedVideo(Base):
 
     __table_args__ = (
         UniqueConstraint("platform", "source_id", name="uq_ingested_videos_platform_source_id"),
+        # Covers the ingest dedupe lookup (platform, source_id) -> task_id as an index-only scan.
+        Index("ix_ingested_videos_lookup", "platform", "source_id", postgresql_include=["task_id"]),
         Index("ix_ingested_videos_task", "task_id"),
     )
 
@@ -27,14 +27,46 @@ def _engine_connect_args(database_url: str) -> dict[str, object]:
         return {}
     if url.get_backend_name() == "postgresql" and url.get_driver_name() == "psycopg":
         # PgBouncer/transaction-pooling setups can fail with
-        # "prepared statement already exists" when psycopg auto-prepares queries.
-        return {"prepare_threshold": None}
+        # "prepared statement already exists" when psycopg auto-prepares queries,
+        # so server-side prepares are opt-in for direct connections.
+        threshold = _env_int("DB_PREPARE_THRESHOLD", 0)
+        return {"prepare_threshold": threshold if threshold > 0 else None}
     return {}
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _engine_pool_kwargs(database_url: str) -> dict[str, object]:
+    try:
+        url = make_url(database_url)
+    except Exception:
+        return {}
+    if url.get_backend_name() != "postgresql":
+        return {}
+    # SQLAlchemy's default 5+10 is smaller than the FastAPI threadpool, so
+    # request threads queued on the pool under bursts.  Connections are still
+    # opened lazily; idle ones are recycled before proxies/managed DBs cut them.
+    return {
+        "pool_size": max(1, _env_int("DB_POOL_SIZE", 10)),
+        "max_overflow": max(0, _env_int("DB_MAX_OVERFLOW", 20)),
+        "pool_recycle": _env_int("DB_POOL_RECYCLE_SECONDS", 300),
+        "pool_timeout": max(1, _env_int("DB_POOL_TIMEOUT_SECONDS", 30)),
+    }
+
+
 @lru_cache
 def _get_engine_cached(database_url: str, pid: int) -> Engine:
-    return create_engine(database_url, pool_pre_ping=True, connect_args=_engine_connect_args(database_url))
+    return create_engine(
+        database_url,
+        pool_pre_ping=True,
+        connect_args=_engine_connect_args(database_url),
+        **_engine_pool_kwargs(database_url),
+    )
 
 
 def get_engine(database_url: str) -> Engine:
@@ -43,9 +75,19 @@ def get_engine(database_url: str) -> Engine:
     return _get_engine_cached(database_url, os.getpid())
 
 
+def dispose_engine(database_url: str) -> None:
+    """Close this process's pooled connections, e.g. when an app shuts down."""
+    get_engine(database_url).dispose()
+
+
+@lru_cache
+def _get_sessionmaker_cached(database_url: str, pid: int) -> sessionmaker[Session]:
+    return sessionmaker(bind=_get_engine_cached(database_url, pid), autocommit=False, autoflush=False)
+
+
 def get_sessionmaker(database_url: str) -> sessionmaker[Session]:
-    engine = get_engine(database_url)
-    return sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    # Workers open a session per task/helper call; reuse one factory per engine.
+    return _get_sessionmaker_cached(database_url, os.getpid())
 
 
 def db_session(database_url: str) -> Generator[Session, None, None]:
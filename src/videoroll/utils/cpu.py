@@ -49,6 +49,20 @@ def process_cpu_count() -> int:
     return min(candidates)
 
 
+def threads_per_worker(concurrency: int) -> int:
+    """
+    Share this process's CPUs evenly between ``concurrency`` pool workers.
+
+    Each prefork child otherwise sizes its thread pool to every CPU, so N
+    concurrent ASR jobs would run N x CPUs threads and thrash.
+    """
+    try:
+        n = int(concurrency)
+    except Exception:
+        n = 1
+    return max(1, (process_cpu_count() or 4) // max(1, n))
+
+
 def _cgroup_cpu_quota_count() -> int | None:
     """
     Estimate CPUs from cgroup quota.
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import fcntl
+import os
+import tempfile
 from functools import lru_cache
 from pathlib import Path
 
@@ -16,6 +19,10 @@ def _secret_dir_candidates() -> list[Path]:
 def _ensure_writable_dir() -> Path:
     last_err: Exception | None = None
     for d in _secret_dir_candidates():
+        # An existing writable dir (the usual case after the first boot) needs
+        # no probe file; os.access also reports read-only mounts.
+        if d.is_dir() and os.access(d, os.W_OK):
+            return d
         try:
             d.mkdir(parents=True, exist_ok=True)
             test = d / ".write_test"
@@ -32,6 +39,46 @@ def _key_path() -> Path:
     return _ensure_writable_dir() / "fernet.key"
 
 
+def _read_key(key_path: Path) -> bytes:
+    try:
+        return key_path.read_bytes()
+    except FileNotFoundError:
+        return b""
+
+
+def _write_temp_key(key: bytes, directory: Path) -> Path:
+    # mkstemp creates the file 0o600; fsync so a published key is never torn.
+    fd, tmp = tempfile.mkstemp(prefix=".fernet.key.", dir=directory)
+    try:
+        os.write(fd, key)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return Path(tmp)
+
+
+def _publish_key(key_path: Path, key: bytes) -> bytes:
+    """
+    Make sure key_path holds a complete key and return whatever ended up on
+    disk, so concurrently booting workers all agree on one key.
+    """
+    tmp = _write_temp_key(key, key_path.parent)
+    try:
+        try:
+            # link() only succeeds if key_path does not exist yet.
+            os.link(tmp, key_path)
+        except FileExistsError:
+            # An empty leftover from an interrupted legacy write: replace it,
+            # re-checking under a lock so only one worker does.
+            with open(key_path.parent / ".fernet.key.lock", "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                if not _read_key(key_path):
+                    os.replace(tmp, key_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return _read_key(key_path)
+
+
 @lru_cache
 def _fernet():
     try:
@@ -40,13 +87,9 @@ def _fernet():
         raise RuntimeError("cryptography is not installed") from e
 
     key_path = _key_path()
-    if key_path.exists():
-        key = key_path.read_bytes()
-        if key:
-            return Fernet(key)
-
-    key = Fernet.generate_key()
-    key_path.write_bytes(key)
+    key = _read_key(key_path)
+    if not key:
+        key = _publish_key(key_path, Fernet.generate_key())
     return Fernet(key)
 
 
@@ -63,5 +106,6 @@ def decrypt_str(token: str) -> str:
     if not token:
         return ""
     f = _fernet()
-    return f.decrypt(token.encode("utf-8")).decode("utf-8")
+    # Fernet accepts the urlsafe-base64 token as str; no need to copy it into bytes first.
+    return f.decrypt(token).decode("utf-8")
 
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 import hashlib
+import os
 from pathlib import Path
 
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
+    # file_digest hashes straight from the file's buffer in C, avoiding a
+    # Python-level read loop and a bytes allocation per chunk.
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
+
+def sha256_file_with_size(path: Path) -> tuple[str, int]:
+    """Return (sha256 hex digest, size in bytes) from a single open of ``path``.
+
+    The size comes from fstat on the same handle, so it always describes the
+    bytes that were hashed.
+    """
+    with path.open("rb") as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+        return digest, os.fstat(f.fileno()).st_size
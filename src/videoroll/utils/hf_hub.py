@@ -6,6 +6,11 @@ import os
 
 import httpx
 
+# Proxy the current client factory was installed for.  huggingface_hub keeps
+# one pooled client per factory and drops it whenever a factory is set, so
+# repeat calls with the same proxy must not reinstall it.
+_configured_proxy: str | None = None
+
 
 def configure_hf_hub_proxy(proxy: str | None) -> None:
     """
@@ -20,6 +25,7 @@ def configure_hf_hub_proxy(proxy: str | None) -> None:
     except Exception:
         return
 
+    global _configured_proxy
     set_factory = getattr(huggingface_hub, "set_client_factory", None)
     proxy = (proxy or "").strip()
     if not callable(set_factory):
@@ -41,8 +47,11 @@ def configure_hf_hub_proxy(proxy: str | None) -> None:
             return httpx.Client(proxy=proxy, timeout=60.0, follow_redirects=True, trust_env=True)
         return httpx.Client(timeout=60.0, follow_redirects=True, trust_env=True)
 
+    if proxy == _configured_proxy:
+        return
     try:
         set_factory(_factory)  # type: ignore[misc]
     except Exception:
         # Best-effort: don't fail model downloads just because we can't hook HF client.
         return
+    _configured_proxy = proxy
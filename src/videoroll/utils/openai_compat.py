@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import functools
 from urllib.parse import urlparse, urlunparse
 
 
 DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
 
+# The URL helpers below are pure and see only a handful of configured base
+# URLs, so they are memoized to keep urlparse off every LLM request.
+
 
 def _ensure_scheme(url: str, default_scheme: str = "https") -> str:
     u = (url or "").strip()
@@ -15,6 +19,7 @@ def _ensure_scheme(url: str, default_scheme: str = "https") -> str:
     return u
 
 
+@functools.lru_cache(maxsize=256)
 def normalize_openai_base_url(base_url: str) -> str:
     """
     Normalize an OpenAI-compatible base URL.
@@ -38,6 +43,7 @@ def normalize_openai_base_url(base_url: str) -> str:
     return normalized.rstrip("/")
 
 
+@functools.lru_cache(maxsize=256)
 def build_openai_chat_completions_url(base_url: str) -> str:
     """
     Accepts either:
@@ -56,6 +62,7 @@ def build_openai_chat_completions_url(base_url: str) -> str:
     return base.rstrip("/") + "/chat/completions"
 
 
+@functools.lru_cache(maxsize=256)
 def build_openai_embeddings_url(base_url: str) -> str:
     """
     Accepts either:
@@ -7,6 +7,9 @@ from urllib.parse import parse_qs, urlparse
 _YOUTUBE_VIDEO_ID_RE = re.compile(r"^[A-Za-z0-9_-]{6,}$")
 _YOUTUBE_CHANNEL_ID_RE = re.compile(r"^UC[A-Za-z0-9_-]{10,}$")
 _YOUTUBE_PLAYLIST_ID_RE = re.compile(r"^(PL|UU|LL|FL|RD|OLAK5uy_)[A-Za-z0-9_-]{8,}$")
+# The form canonicalize_youtube_url() and source scans produce; matching it
+# directly skips urlparse/parse_qs for the common case.
+_CANONICAL_WATCH_URL_RE = re.compile(r"https://www\.youtube\.com/watch\?v=([A-Za-z0-9_-]{6,})")
 
 
 def _youtube_host(host: str | None) -> str:
@@ -59,8 +62,13 @@ def is_youtube_url(url: str) -> bool:
 
 
 def extract_youtube_video_id(url: str) -> Optional[str]:
+    raw = str(url or "").strip()
+    canonical = _CANONICAL_WATCH_URL_RE.fullmatch(raw)
+    if canonical:
+        return canonical.group(1)
+
     try:
-        parsed = urlparse(str(url or "").strip())
+        parsed = urlparse(raw)
     except Exception:
         return None
 
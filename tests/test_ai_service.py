@@ -40,9 +40,9 @@ except ModuleNotFoundError:
     sys.modules["httpx"] = fake_httpx
 
 from videoroll.ai.client import OpenAIChatConfig, openai_chat_config_from_settings
-from videoroll.ai import service
+from videoroll.ai import client, service
 from videoroll.ai.providers import AIProviderRegistry
-from videoroll.ai.prompts import AIJsonPrompt
+from videoroll.ai.prompts import AIJsonPrompt, build_subtitle_translation_prompt
 from videoroll.ai.runtime import AIRuntime
 
 
@@ -62,6 +62,10 @@ class _FakeResponse:
 
 class AIServiceTests(unittest.TestCase):
     def setUp(self) -> None:
+        # Tests swap in fake httpx clients; never reuse one across tests.
+        shared_clients = patch.dict(client._SHARED_CLIENTS, clear=True)
+        shared_clients.start()
+        self.addCleanup(shared_clients.stop)
         self.config = OpenAIChatConfig(
             api_key="test-key",
             base_url="https://example.invalid/v1",
@@ -335,5 +339,93 @@ class AIServiceTests(unittest.TestCase):
         self.assertEqual(calls[0][1], "fake")
 
 
+class CongestionBackoffTests(unittest.TestCase):
+    def test_backoff_stretches_with_recent_failures_and_recovers(self) -> None:
+        congestion = client._Congestion()
+
+        with patch.object(client.random, "random", return_value=0.0):
+            calm = congestion.backoff_seconds(1)
+            for _ in range(10):
+                congestion.record(failed=True)
+            congested = congestion.backoff_seconds(1)
+            for _ in range(30):
+                congestion.record(failed=False)
+            recovered = congestion.backoff_seconds(1)
+
+            self.assertEqual(calm, 2.0)
+            self.assertGreater(congested, 6.0)
+            self.assertLess(recovered, 2.1)
+            self.assertEqual(congestion.backoff_seconds(10), 30.0)
+
+    def test_exhausted_rate_limit_headers_delay_the_next_request(self) -> None:
+        congestion = client._Congestion()
+        congestion.note_rate_limit({"x-ratelimit-remaining-requests": "5", "x-ratelimit-reset-requests": "1s"})
+
+        with patch.object(client.time, "sleep") as sleep:
+            congestion.wait_for_quota()
+            sleep.assert_not_called()
+
+            congestion.note_rate_limit({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "1m30s"})
+            congestion.wait_for_quota()
+
+        self.assertGreater(sleep.call_args.args[0], 29.0)
+        self.assertEqual(client._parse_rate_limit_reset("250ms"), 0.25)
+
+    def test_retry_after_holds_off_every_caller(self) -> None:
+        congestion = client._Congestion()
+
+        class _Resp:
+            def __init__(self, retry_after: str) -> None:
+                self.headers = {"retry-after": retry_after}
+
+        with patch.object(client, "_CONGESTION", congestion), patch.object(client.time, "sleep") as sleep:
+            client._wait_before_retry(_Resp("3"), 0)  # type: ignore[arg-type]
+            sleep.assert_not_called()
+            congestion.wait_for_quota()
+            self.assertGreater(sleep.call_args.args[0], 2.5)
+
+            sleep.reset_mock()
+            client._wait_before_retry(_Resp("Wed, 21 Oct 2015 07:28:00 GMT"), 0)  # type: ignore[arg-type]
+            sleep.assert_called_once()
+
+
+class ResponseSnippetTests(unittest.TestCase):
+    def test_snippet_decodes_only_a_bounded_prefix(self) -> None:
+        body = "<html>错误".encode("utf-8") + b"\r\n" + b"x" * 100_000
+        resp = client.httpx.Response(502, content=body, headers={"content-type": "text/html; charset=utf-8"})
+
+        snippet = client._resp_snippet(resp, limit=20)
+
+        self.assertEqual(snippet, "<html>错误  " + "x" * 10 + "…")
+
+
+class StripCodeFenceTests(unittest.TestCase):
+    def test_strip_code_fence_handles_plain_and_fenced_json(self) -> None:
+        self.assertEqual(client._strip_code_fence('  {"a": 1}\n'), '{"a": 1}')
+        self.assertEqual(client._strip_code_fence('```json\n{"a": 1}\n```'), '{"a": 1}')
+        self.assertEqual(client._strip_code_fence('```\n{"a": 1}\n{"b": 2}'), '{"a": 1}\n{"b": 2}')
+        self.assertEqual(client._strip_code_fence("```json"), "")
+
+
+class SubtitlePromptTests(unittest.TestCase):
+    def test_batches_of_one_job_share_the_prompt_prefix_up_to_the_blocks(self) -> None:
+        def prompt(blocks: list[dict[str, object]], summary: str) -> str:
+            return build_subtitle_translation_prompt(
+                blocks=blocks,
+                target_lang="zh",
+                style="自然",
+                summary=summary,
+                glossary={"Kubernetes": "K8s"},
+            ).user_prompt
+
+        first = prompt([{"idx": 1, "text": "one"}], "")
+        second = prompt([{"idx": 2, "text": "two"}], "")
+
+        prefix_len = len(first[: first.index('"blocks"')])
+        self.assertEqual(first[:prefix_len], second[:prefix_len])
+        self.assertIn('"glossary"', first[:prefix_len])
+        self.assertLess(prompt([], "s").index('"summary"'), prompt([], "s").index('"blocks"'))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from videoroll.db.app_setting_cache import AppSettingCache
+
+
+class _Bind:
+    pass
+
+
+class _Db:
+    def __init__(self, bind: _Bind) -> None:
+        self._bind = bind
+
+    def get_bind(self) -> _Bind:
+        return self._bind
+
+
+def test_expired_entry_is_reloaded_by_one_thread_while_others_get_the_stale_value() -> None:
+    cache = AppSettingCache(ttl_seconds=0.0)
+    bind = _Bind()
+    db = _Db(bind)
+    assert cache.get(db, "k", lambda: "old") == "old"
+
+    started = threading.Event()
+    release = threading.Event()
+    loads: list[str] = []
+
+    def slow_load() -> str:
+        loads.append("slow")
+        started.set()
+        release.wait(5)
+        return "new"
+
+    results: list[str] = []
+    refresher = threading.Thread(target=lambda: results.append(cache.get(db, "k", slow_load)))
+    refresher.start()
+    assert started.wait(5)
+
+    stale = cache.get(db, "k", lambda: loads.append("fast") or "other")
+
+    release.set()
+    refresher.join(5)
+    assert stale == "old"
+    assert results == ["new"]
+    assert loads == ["slow"]
+
+
+def test_invalidated_entry_is_reloaded_immediately() -> None:
+    cache = AppSettingCache(ttl_seconds=60.0)
+    db = _Db(_Bind())
+    assert cache.get(db, "k", lambda: 1) == 1
+
+    cache.invalidate("k")
+
+    assert cache.get(db, "k", lambda: 2) == 2
+
+
+def test_failed_reload_does_not_block_later_refreshes() -> None:
+    cache = AppSettingCache(ttl_seconds=0.0)
+    db = _Db(_Bind())
+    cache.get(db, "k", lambda: 1)
+
+    def boom() -> int:
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        cache.get(db, "k", boom)
+
+    assert cache.get(db, "k", lambda: 3) == 3
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from videoroll.db.app_settings import get_app_setting_value, upsert_app_settings
+from videoroll.db.base import Base
+from videoroll.db.models import AppSetting
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(_type: JSONB, _compiler: object, **_kwargs: object) -> str:
+    return "JSON"
+
+
+def test_upsert_app_settings_inserts_and_replaces_rows_in_one_statement() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=[AppSetting.__table__])
+    db = sessionmaker(bind=engine)()
+    try:
+        db.add(AppSetting(key="a", value_json={"v": 1}))
+        db.commit()
+
+        upsert_app_settings(db, {"a": {"v": 2}, "b": {"v": 3}})
+        upsert_app_settings(db, {})
+        db.commit()
+
+        assert get_app_setting_value(db, "a") == {"v": 2}
+        assert get_app_setting_value(db, "b") == {"v": 3}
+        assert get_app_setting_value(db, "missing") is None
+    finally:
+        db.close()
+
+
+def test_get_app_setting_value_reuses_the_compiled_statement() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=[AppSetting.__table__])
+    db = sessionmaker(bind=engine)()
+    try:
+        hits: list[object] = []
+        event.listen(engine, "after_cursor_execute", lambda *args: hits.append(args[4].cache_hit))
+
+        get_app_setting_value(db, "a")
+        get_app_setting_value(db, "b")
+
+        assert hits == [CacheStats.CACHE_MISS, CacheStats.CACHE_HIT]
+    finally:
+        db.close()
@@ -1,12 +1,29 @@
-from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, inspect
+from sqlalchemy import Column, ForeignKey, Integer, MetaData, String, Table, create_engine, event, inspect
 
 from videoroll.db.auto_migrate import (
     _ensure_app_settings_version_column,
     _ensure_job_lease_columns,
     _ensure_publish_jobs_generic_columns,
+    create_missing_tables,
 )
 
 
+def test_create_missing_tables_only_creates_absent_tables() -> None:
+    engine = create_engine("sqlite://")
+    metadata = MetaData()
+    Table("parents", metadata, Column("id", Integer, primary_key=True))
+    Table("children", metadata, Column("id", Integer, primary_key=True), Column("parent_id", ForeignKey("parents.id")))
+    metadata.tables["parents"].create(engine)
+
+    create_missing_tables(engine, metadata)
+    assert set(inspect(engine).get_table_names()) == {"parents", "children"}
+
+    statements: list[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    create_missing_tables(engine, metadata)
+    assert len(statements) == 1
+
+
 def test_auto_migrate_adds_optimistic_version_to_legacy_app_settings() -> None:
     engine = create_engine("sqlite://")
     legacy = MetaData()
@@ -1,40 +1,101 @@
 from __future__ import annotations
 
-import types
 import unittest
 
-from videoroll.apps.subtitle_service.auto_profile_store import AUTO_PROFILE_KEY, get_auto_profile
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
 
+from videoroll.apps.subtitle_service.auto_profile_store import AUTO_PROFILE_KEY, get_auto_profile, update_auto_profile
+from videoroll.db.base import Base
+from videoroll.db.models import AppSetting
 
-class _FakeDb:
-    def __init__(self, value_json: dict[str, object] | None = None) -> None:
-        self._row = types.SimpleNamespace(value_json=value_json) if value_json is not None else None
 
-    def get(self, _model: object, key: str) -> object | None:
-        assert key == AUTO_PROFILE_KEY
-        return self._row
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(_type: JSONB, _compiler: object, **_kwargs: object) -> str:
+    return "JSON"
+
+
+def _sqlite_session() -> Session:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=[AppSetting.__table__])
+    return sessionmaker(bind=engine)()
 
 
 class AutoProfileStoreTests(unittest.TestCase):
     def test_get_auto_profile_uses_current_font_scale_defaults(self) -> None:
-        profile = get_auto_profile(_FakeDb())
+        db = _sqlite_session()
+        self.addCleanup(db.close)
+
+        profile = get_auto_profile(db)
 
         self.assertEqual(profile["primary_font_scale_percent"], 100)
         self.assertEqual(profile["secondary_font_scale_percent"], 100)
 
     def test_get_auto_profile_clamps_and_normalizes_font_scale_percent(self) -> None:
-        profile = get_auto_profile(
-            _FakeDb(
-                {
+        db = _sqlite_session()
+        self.addCleanup(db.close)
+        db.add(
+            AppSetting(
+                key=AUTO_PROFILE_KEY,
+                value_json={
                     "primary_font_scale_percent": "180",
                     "secondary_font_scale_percent": 999,
-                }
+                },
             )
         )
+        db.commit()
+
+        profile = get_auto_profile(db)
 
         self.assertEqual(profile["primary_font_scale_percent"], 180)
         self.assertEqual(profile["secondary_font_scale_percent"], 300)
 
+    def test_get_auto_profile_caches_reads_until_update(self) -> None:
+        db = _sqlite_session()
+        self.addCleanup(db.close)
+        db.add(AppSetting(key=AUTO_PROFILE_KEY, value_json={"target_lang": "ja"}))
+        db.commit()
+        statements: list[str] = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        first = get_auto_profile(db)
+        first["formats"].append("mutated")
+        second = get_auto_profile(db)
+
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(second["target_lang"], "ja")
+        self.assertEqual(second["formats"], ["srt", "ass"])
+
+        updated = update_auto_profile(db, {"target_lang": "en"})
+
+        self.assertEqual(updated["target_lang"], "en")
+        self.assertEqual(get_auto_profile(db)["target_lang"], "en")
+
+    def test_update_auto_profile_creates_missing_row(self) -> None:
+        db = _sqlite_session()
+        self.addCleanup(db.close)
+
+        updated = update_auto_profile(db, {"target_lang": "en", "formats": ["ass"]})
+
+        self.assertEqual(updated["target_lang"], "en")
+        self.assertEqual(updated["formats"], ["ass"])
+        self.assertEqual(db.get(AppSetting, AUTO_PROFILE_KEY).value_json["formats"], ["ass"])
+
+    def test_update_auto_profile_skips_write_when_nothing_changes(self) -> None:
+        db = _sqlite_session()
+        self.addCleanup(db.close)
+        update_auto_profile(db, {"target_lang": "en", "video_crf": None})
+        statements: list[str] = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        profile = update_auto_profile(db, {"target_lang": "en", "video_crf": None})
+
+        self.assertEqual(profile["target_lang"], "en")
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].lstrip().upper().startswith("SELECT"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from videoroll.apps.subtitle_service.bilibili_tags_store import (
+    get_task_bilibili_summary,
+    get_task_bilibili_tags,
+    set_task_bilibili_tags,
+)
+from videoroll.db.base import Base
+from videoroll.db.models import AppSetting
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(_type: JSONB, _compiler: object, **_kwargs: object) -> str:
+    return "JSON"
+
+
+def _sqlite_session() -> Session:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=[AppSetting.__table__])
+    return sessionmaker(bind=engine)()
+
+
+def test_set_task_bilibili_tags_cleans_truncates_and_dedupes_case_insensitively() -> None:
+    db = _sqlite_session()
+    try:
+        set_task_bilibili_tags(
+            db,
+            "task-1",
+            tags=["  #Python ", "＃python", "machine learning", "", None, "x" * 30, "Machine　Learning"],  # type: ignore[list-item]
+            summary=" summary ",
+        )
+
+        assert get_task_bilibili_tags(db, "task-1") == ["Python", "machinelearning", "x" * 20]
+        assert get_task_bilibili_summary(db, "task-1") == "summary"
+
+        set_task_bilibili_tags(db, "task-1", tags=["rust"], summary="")
+
+        assert get_task_bilibili_tags(db, "task-1") == ["rust"]
+        assert db.query(AppSetting).count() == 1
+    finally:
+        db.close()
+
+
+def test_get_task_bilibili_tags_ignores_malformed_rows() -> None:
+    db = _sqlite_session()
+    try:
+        db.add(AppSetting(key="bilibili.tags.task-2", value_json={"tags": "not-a-list"}))
+        db.commit()
+
+        assert get_task_bilibili_tags(db, "task-2") == []
+        assert get_task_bilibili_summary(db, "task-3") == ""
+    finally:
+        db.close()
+
+
+def test_set_task_bilibili_tags_skips_write_when_payload_is_unchanged() -> None:
+    db = _sqlite_session()
+    try:
+        set_task_bilibili_tags(db, "task-4", tags=["rust"], summary="s")
+        statements: list[str] = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        set_task_bilibili_tags(db, "task-4", tags=[" #rust"], summary=" s ")
+
+        assert len(statements) == 1
+        assert statements[0].lstrip().upper().startswith("SELECT")
+    finally:
+        db.close()
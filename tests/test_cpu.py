@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from videoroll.utils import cpu
+
+
+def test_threads_per_worker_splits_cpus_between_pool_workers() -> None:
+    with patch.object(cpu, "process_cpu_count", return_value=16):
+        assert cpu.threads_per_worker(1) == 16
+        assert cpu.threads_per_worker(4) == 4
+        assert cpu.threads_per_worker(3) == 5
+        assert cpu.threads_per_worker(32) == 1
+        assert cpu.threads_per_worker(0) == 16
+
+
+def test_threads_per_worker_falls_back_when_cpu_count_is_unknown() -> None:
+    with patch.object(cpu, "process_cpu_count", return_value=0):
+        assert cpu.threads_per_worker(2) == 2
@@ -6,11 +6,11 @@ from videoroll.db import session as session_module
 
 def test_get_engine_isolated_per_pid(monkeypatch) -> None:
     session_module._get_engine_cached.cache_clear()
-    calls: list[tuple[str, bool, dict[str, object]]] = []
+    calls: list[tuple[str, dict[str, object]]] = []
 
-    def fake_create_engine(url: str, *, pool_pre_ping: bool, connect_args: dict[str, object]):
+    def fake_create_engine(url: str, **kwargs: object):
         engine = object()
-        calls.append((url, pool_pre_ping, connect_args))
+        calls.append((url, kwargs))
         return engine
 
     monkeypatch.setattr(session_module, "create_engine", fake_create_engine)
@@ -21,6 +21,7 @@ def test_get_engine_isolated_per_pid(monkeypatch) -> None:
 
     assert first is second
     assert len(calls) == 1
+    assert calls[0][1]["pool_pre_ping"] is True
 
     monkeypatch.setattr(session_module.os, "getpid", lambda: 1002)
     third = session_module.get_engine("postgresql+psycopg://user:pass@db/app")
@@ -29,6 +30,29 @@ def test_get_engine_isolated_per_pid(monkeypatch) -> None:
     assert len(calls) == 2
 
 
+def test_engine_pool_kwargs_apply_to_postgres_only(monkeypatch) -> None:
+    monkeypatch.setenv("DB_POOL_SIZE", "7")
+    monkeypatch.delenv("DB_MAX_OVERFLOW", raising=False)
+
+    assert session_module._engine_pool_kwargs("postgresql+psycopg://user:pass@db/app") == {
+        "pool_size": 7,
+        "max_overflow": 20,
+        "pool_recycle": 300,
+        "pool_timeout": 30,
+    }
+    assert session_module._engine_pool_kwargs("sqlite:///:memory:") == {}
+
+
+def test_psycopg_prepared_statements_are_opt_in(monkeypatch) -> None:
+    url = "postgresql+psycopg://user:pass@db/app"
+    monkeypatch.delenv("DB_PREPARE_THRESHOLD", raising=False)
+    assert session_module._engine_connect_args(url) == {"prepare_threshold": None}
+
+    monkeypatch.setenv("DB_PREPARE_THRESHOLD", "5")
+    assert session_module._engine_connect_args(url) == {"prepare_threshold": 5}
+    assert session_module._engine_connect_args("sqlite:///:memory:") == {}
+
+
 def test_auto_migrate_cached_per_pid(monkeypatch) -> None:
     auto_migrate_module._auto_migrate_cached.cache_clear()
     calls: list[tuple[str, object]] = []
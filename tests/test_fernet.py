@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from cryptography.fernet import Fernet
+
+from videoroll.utils import fernet as fernet_module
+
+
+def test_encrypt_and_decrypt_round_trip_as_str(monkeypatch) -> None:
+    key = Fernet(Fernet.generate_key())
+    monkeypatch.setattr(fernet_module, "_fernet", lambda: key)
+
+    token = fernet_module.encrypt_str(" sk-secret ")
+
+    assert isinstance(token, str)
+    assert fernet_module.decrypt_str(f" {token}\n") == "sk-secret"
+    assert fernet_module.encrypt_str("") == ""
+    assert fernet_module.decrypt_str("") == ""
+
+
+def test_existing_writable_secret_dir_is_used_without_a_probe_file(monkeypatch, tmp_path) -> None:
+    missing = tmp_path / "missing"
+    existing = tmp_path / "secrets"
+    existing.mkdir()
+    monkeypatch.setattr(fernet_module, "_secret_dir_candidates", lambda: [existing, missing])
+
+    assert fernet_module._key_path() == existing / "fernet.key"
+    assert list(existing.iterdir()) == []
+    assert not missing.exists()
+
+
+def test_new_key_is_created_exclusively_and_owner_only(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(fernet_module, "_secret_dir_candidates", lambda: [tmp_path])
+    fernet_module._fernet.cache_clear()
+    try:
+        token = fernet_module.encrypt_str("secret")
+    finally:
+        fernet_module._fernet.cache_clear()
+
+    key_path = tmp_path / "fernet.key"
+    assert key_path.stat().st_mode & 0o777 == 0o600
+    assert Fernet(key_path.read_bytes()).decrypt(token.encode("utf-8")) == b"secret"
+
+
+def test_key_written_by_a_concurrent_worker_is_reused(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(fernet_module, "_secret_dir_candidates", lambda: [tmp_path])
+    other_key = Fernet.generate_key()
+    key_path = tmp_path / "fernet.key"
+    real_link = fernet_module.os.link
+
+    def link_after_other_worker(src, dst) -> None:
+        # The other worker publishes its key between our read and our link.
+        key_path.write_bytes(other_key)
+        real_link(src, dst)
+
+    monkeypatch.setattr(fernet_module.os, "link", link_after_other_worker)
+    fernet_module._fernet.cache_clear()
+    try:
+        token = fernet_module.encrypt_str("secret")
+    finally:
+        fernet_module._fernet.cache_clear()
+
+    assert key_path.read_bytes() == other_key
+    assert Fernet(other_key).decrypt(token.encode("utf-8")) == b"secret"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".fernet.key.lock", "fernet.key"]
+
+
+def test_empty_leftover_key_file_is_replaced_once(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(fernet_module, "_secret_dir_candidates", lambda: [tmp_path])
+    key_path = tmp_path / "fernet.key"
+    key_path.write_bytes(b"")
+
+    first = fernet_module._publish_key(key_path, Fernet.generate_key())
+    second = fernet_module._publish_key(key_path, Fernet.generate_key())
+
+    assert first and first == second == key_path.read_bytes()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".fernet.key.lock", "fernet.key"]
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from videoroll.utils.hashing import sha256_file, sha256_file_with_size
+
+
+def test_sha256_file_with_size_matches_separate_hash_and_stat(tmp_path: Path) -> None:
+    path = tmp_path / "blob.bin"
+    data = bytes(range(256)) * 1000
+    path.write_bytes(data)
+
+    digest, size = sha256_file_with_size(path)
+
+    assert digest == hashlib.sha256(data).hexdigest() == sha256_file(path)
+    assert size == len(data) == path.stat().st_size
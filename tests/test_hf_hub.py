@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import sys
+import types
+
+import pytest
+
+from videoroll.utils import hf_hub
+
+
+def test_configure_hf_hub_proxy_only_reinstalls_factory_when_proxy_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    factories: list[object] = []
+    fake_hub = types.ModuleType("huggingface_hub")
+    fake_hub.set_client_factory = factories.append  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "huggingface_hub", fake_hub)
+    monkeypatch.setattr(hf_hub, "_configured_proxy", None)
+
+    hf_hub.configure_hf_hub_proxy("http://proxy:1")
+    hf_hub.configure_hf_hub_proxy(" http://proxy:1 ")
+    assert len(factories) == 1
+
+    hf_hub.configure_hf_hub_proxy(None)
+    hf_hub.configure_hf_hub_proxy("")
+    assert len(factories) == 2
@@ -33,3 +33,38 @@ class HttpxProxyUtilsTests(TestCase):
             format_httpx_proxy_error(error, proxy="http://127.0.0.1:7890"),
             "connection timeout",
         )
+
+
+class ModelDownloadProxyTestClientTests(TestCase):
+    def test_proxy_test_clients_are_reused_per_proxy_and_closed(self) -> None:
+        from videoroll.apps.subtitle_service import main as subtitle_main
+
+        subtitle_main._close_proxy_test_clients()
+        self.addCleanup(subtitle_main._close_proxy_test_clients)
+
+        first, first_error = subtitle_main._proxy_test_client("http://127.0.0.1:7890")
+        again, _ = subtitle_main._proxy_test_client("http://127.0.0.1:7890")
+        direct, _ = subtitle_main._proxy_test_client("")
+
+        self.assertIs(first, again)
+        self.assertIsNot(first, direct)
+        self.assertIsNone(first_error)
+
+        subtitle_main._close_proxy_test_clients()
+
+        self.assertTrue(first.is_closed)
+        self.assertTrue(direct.is_closed)
+
+    def test_evicted_proxy_test_clients_stay_open_for_in_flight_probes(self) -> None:
+        from videoroll.apps.subtitle_service import main as subtitle_main
+
+        subtitle_main._close_proxy_test_clients()
+        self.addCleanup(subtitle_main._close_proxy_test_clients)
+
+        oldest, _ = subtitle_main._proxy_test_client("http://127.0.0.1:7000")
+        self.addCleanup(oldest.close)
+        for port in range(7001, 7001 + subtitle_main._PROXY_TEST_CLIENTS_MAX):
+            subtitle_main._proxy_test_client(f"http://127.0.0.1:{port}")
+
+        self.assertNotIn("http://127.0.0.1:7000", subtitle_main._PROXY_TEST_CLIENTS)
+        self.assertFalse(oldest.is_closed)
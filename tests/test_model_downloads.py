@@ -60,6 +60,37 @@ class ModelDownloadsTests(unittest.TestCase):
             else:
                 sys.modules["huggingface_hub"] = prev
 
+    def test_faster_whisper_download_limits_files_and_falls_back_on_old_hub(self) -> None:
+        fake_hf = types.ModuleType("huggingface_hub")
+        calls: list[dict[str, object]] = []
+
+        def snapshot_download(*, repo_id: str, revision: str | None = None, local_dir: str, **kwargs: object) -> None:
+            calls.append(dict(kwargs))
+            if kwargs:
+                raise TypeError("unexpected keyword argument 'allow_patterns'")
+            Path(local_dir).mkdir(parents=True, exist_ok=True)
+            (Path(local_dir) / "model.bin").write_bytes(b"x")
+
+        fake_hf.snapshot_download = snapshot_download  # type: ignore[attr-defined]
+        prev = sys.modules.get("huggingface_hub")
+        sys.modules["huggingface_hub"] = fake_hf
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                dest = download_model_snapshot(
+                    engine="faster-whisper",
+                    model="small",
+                    model_dir=Path(tmpdir),
+                    name="small",
+                )
+                self.assertTrue((dest / "model.bin").exists())
+                self.assertEqual(calls[0], {"allow_patterns": ["*.bin", "*.json", "*.txt"]})
+                self.assertEqual(calls[1], {})
+        finally:
+            if prev is None:
+                sys.modules.pop("huggingface_hub", None)
+            else:
+                sys.modules["huggingface_hub"] = prev
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 import uuid
 
 import pytest
+from fastapi import HTTPException
 
 from videoroll.apps.orchestrator_api.services import youtube_service
 from videoroll.db.models import SourceLicense
@@ -141,3 +142,29 @@ def test_fetch_meta_never_immediately_deletes_a_deterministic_key(tmp_path) -> N
         youtube_service.fetch_meta(task_id, settings=settings, db=db, s3=s3)  # type: ignore[arg-type]
 
     s3.delete_object.assert_not_called()
+
+
+def test_background_download_logs_failures_and_always_closes_session() -> None:
+    task_id = uuid.uuid4()
+    db = Mock()
+    settings = SimpleNamespace(database_url="sqlite://")
+
+    with (
+        patch.object(youtube_service, "get_sessionmaker", return_value=lambda: db),
+        patch.object(youtube_service, "S3Store"),
+        patch.object(youtube_service, "download", side_effect=HTTPException(status_code=502, detail="boom")) as download,
+    ):
+        youtube_service.run_background_download(task_id, settings=settings)  # type: ignore[arg-type]
+
+    download.assert_called_once()
+    db.close.assert_called_once()
+
+
+def test_accept_background_download_rejects_non_youtube_task() -> None:
+    db = Mock()
+    db.get.return_value = SimpleNamespace(source_type=SimpleNamespace(value="upload"), source_url="")
+
+    with pytest.raises(HTTPException) as exc_info:
+        youtube_service.accept_background_download(uuid.uuid4(), db=db)  # type: ignore[arg-type]
+
+    assert exc_info.value.status_code == 400
@@ -36,6 +36,40 @@ class ProcessingAsrSilenceTests(unittest.TestCase):
 
         self.assertEqual(segments, [])
 
+    def test_faster_whisper_model_is_loaded_once_per_config(self) -> None:
+        created: list[tuple[str, dict[str, object]]] = []
+
+        class FakeWhisperModel:
+            def __init__(self, model_name: str, **kwargs: object) -> None:
+                created.append((model_name, kwargs))
+
+        fake_module = types.ModuleType("faster_whisper")
+        fake_module.WhisperModel = FakeWhisperModel
+        self.addCleanup(processing.clear_asr_model_cache)
+        with (
+            patch.dict(sys.modules, {"faster_whisper": fake_module}),
+            patch.object(processing, "_FASTER_WHISPER_MODEL_CACHE", {}),
+        ):
+            kwargs = {"device": "cpu", "compute_type": "int8"}
+            first = processing._get_faster_whisper_model("tiny", dict(kwargs))
+            second = processing._get_faster_whisper_model("tiny", dict(kwargs))
+            processing._get_faster_whisper_model("tiny", {**kwargs, "compute_type": "float16"})
+            processing._get_faster_whisper_model("base", dict(kwargs))
+            third = processing._get_faster_whisper_model("tiny", dict(kwargs))
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual([name for name, _ in created], ["tiny", "tiny", "base", "tiny"])
+
+    def test_faster_whisper_auto_compute_type_follows_device(self) -> None:
+        fake_ct2 = types.ModuleType("ctranslate2")
+        fake_ct2.get_supported_compute_types = lambda _device: {"float32", "float16", "int8_float16", "int8"}
+        with patch.dict(sys.modules, {"ctranslate2": fake_ct2}):
+            self.assertEqual(processing._resolve_faster_whisper_compute_type("cuda", "auto"), "int8_float16")
+        self.assertEqual(processing._resolve_faster_whisper_compute_type("cpu", "auto"), "int8")
+        self.assertEqual(processing._resolve_faster_whisper_compute_type("cpu", ""), "int8")
+        self.assertEqual(processing._resolve_faster_whisper_compute_type("cuda", "float16"), "float16")
+
     def test_transcribe_openvino_whisper_skips_pipeline_for_effectively_silent_audio(self) -> None:
         with (
             patch.object(processing, "_read_wav_as_float_mono_16k", return_value=([0.0] * 320, 2.0)),
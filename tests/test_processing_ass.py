@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import json
+import pickle
 import sys
+import tempfile
 import types
 import unittest
+from pathlib import Path
 
 try:
     import httpx as _httpx  # type: ignore
@@ -16,7 +20,17 @@ except ModuleNotFoundError:
     fake_httpx.Client = Client
     sys.modules["httpx"] = fake_httpx
 
-from videoroll.apps.subtitle_service.processing import Segment, segments_to_ass
+from videoroll.apps.subtitle_service.processing import (
+    Segment,
+    make_bilingual,
+    segments_from_json_data,
+    segments_to_ass,
+    segments_to_json_data,
+    segments_to_srt,
+    write_ass,
+    write_json,
+    write_srt,
+)
 
 
 class ProcessingAssTests(unittest.TestCase):
@@ -58,6 +72,74 @@ class ProcessingAssTests(unittest.TestCase):
         self.assertIn("Style: Default,Noto Sans CJK SC,87,", ass_text)
         self.assertIn("Style: Secondary,Noto Sans CJK SC,49,", ass_text)
 
+    def test_segments_to_srt_formats_cues_and_secondary_lines(self) -> None:
+        srt_text = segments_to_srt(
+            [
+                Segment(start=0.0, end=1.2345, text=" 你好 ", secondary_text="Hello"),
+                Segment(start=3661.9996, end=3663.5, text="second"),
+            ]
+        )
+
+        self.assertEqual(
+            srt_text,
+            "1\n00:00:00,000 --> 00:00:01,234\n你好\nHello\n\n2\n01:01:02,000 --> 01:01:03,500\nsecond\n",
+        )
+
+    def test_streaming_writers_match_in_memory_rendering(self) -> None:
+        segments = [
+            Segment(start=0.0, end=1.5, text="第一句", secondary_text="First line"),
+            Segment(start=2.0, end=3.0, text="   "),
+            Segment(start=4.0, end=5.0, text="最后一句"),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            srt_path = Path(tmp) / "nested" / "out.srt"
+            ass_path = Path(tmp) / "nested" / "out.ass"
+            write_srt(srt_path, segments)
+            write_ass(ass_path, segments, secondary_line_scale=0.68, play_res_x=1080, play_res_y=1920)
+
+            self.assertEqual(srt_path.read_text(encoding="utf-8"), segments_to_srt(segments))
+            self.assertEqual(
+                ass_path.read_text(encoding="utf-8"),
+                segments_to_ass(segments, secondary_line_scale=0.68, play_res_x=1080, play_res_y=1920),
+            )
+
+    def test_make_bilingual_keeps_translated_timing_and_adds_source_line(self) -> None:
+        merged = make_bilingual(
+            [Segment(start=0.0, end=1.0, text=" Hello "), Segment(start=1.0, end=2.0, text="  ")],
+            [Segment(start=0.0, end=1.2, text="你好", confidence=0.5), Segment(start=1.0, end=2.0, text="……")],
+        )
+
+        self.assertEqual(
+            merged,
+            [
+                Segment(start=0.0, end=1.2, text="你好", confidence=0.5, secondary_text="Hello"),
+                Segment(start=1.0, end=2.0, text="……", secondary_text=None),
+            ],
+        )
+
+    def test_segment_is_slotted_and_picklable(self) -> None:
+        seg = Segment(start=1.0, end=2.0, text="hi", confidence=0.9, secondary_text="嗨")
+
+        self.assertFalse(hasattr(seg, "__dict__"))
+        self.assertEqual(pickle.loads(pickle.dumps(seg)), seg)
+
+    def test_write_json_indents_artifacts_and_compacts_internal_files(self) -> None:
+        segments = [Segment(start=0.0, end=1.5, text="你好", secondary_text="Hello")]
+        with tempfile.TemporaryDirectory() as tmp:
+            artifact = Path(tmp) / "nested" / "segments.json"
+            internal = Path(tmp) / "checkpoint.json"
+            write_json(artifact, segments_to_json_data(segments))
+            write_json(internal, segments_to_json_data(segments), compact=True)
+            artifact_raw = artifact.read_text(encoding="utf-8")
+            internal_raw = internal.read_text(encoding="utf-8")
+
+        self.assertIn("你好", artifact_raw)
+        self.assertIn("\n  ", artifact_raw)
+        self.assertNotIn("\n", internal_raw)
+        self.assertEqual(segments_from_json_data(json.loads(artifact_raw)), segments)
+        self.assertEqual(segments_from_json_data(json.loads(internal_raw)), segments)
+
 
 if __name__ == "__main__":
     unittest.main()
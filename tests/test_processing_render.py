@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import subprocess
 import sys
+import tempfile
+import time
 import types
 import unittest
 from pathlib import Path
@@ -18,7 +21,7 @@ except ModuleNotFoundError:
     fake_httpx.Client = Client
     sys.modules["httpx"] = fake_httpx
 
-from videoroll.apps.subtitle_service.processing import render_burn_in
+from videoroll.apps.subtitle_service.processing import _run_logged, render_burn_in
 
 
 class ProcessingRenderTests(unittest.TestCase):
@@ -47,6 +50,29 @@ class ProcessingRenderTests(unittest.TestCase):
         self.assertIn("ass=/tmp/subtitle.ass", cmd)
         self.assertNotIn("h264_vaapi", cmd)
 
+    def test_render_burn_in_cpu_av1_limits_svt_threads_to_available_cpus(self) -> None:
+        calls: list[list[str]] = []
+
+        def fake_run_logged(cmd: list[str], **_kwargs: object) -> None:
+            calls.append(cmd)
+
+        with (
+            patch("videoroll.apps.subtitle_service.processing._run_logged", side_effect=fake_run_logged),
+            patch("videoroll.apps.subtitle_service.processing._available_cpus", return_value=6),
+        ):
+            render_burn_in(
+                "ffmpeg",
+                Path("/tmp/input.mp4"),
+                Path("/tmp/subtitle.ass"),
+                Path("/tmp/out.mp4"),
+            )
+
+        cmd = calls[0]
+        self.assertIn("libsvtav1", cmd)
+        self.assertEqual(cmd[cmd.index("-svtav1-params") + 1], "lp=6")
+        self.assertEqual(cmd[cmd.index("-filter_threads") + 1], "6")
+        self.assertLess(cmd.index("-filter_threads"), cmd.index("-i"))
+
     def test_render_burn_in_intel_h264_uses_vaapi(self) -> None:
         calls: list[list[str]] = []
 
@@ -130,5 +156,35 @@ class ProcessingRenderTests(unittest.TestCase):
                 )
 
 
+class RunLoggedTests(unittest.TestCase):
+    def test_live_upload_runs_while_waiting_and_once_after_exit(self) -> None:
+        uploads: list[float] = []
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "ffmpeg.log"
+            started = time.monotonic()
+            _run_logged(
+                [sys.executable, "-c", "import time; print('working'); time.sleep(0.35)"],
+                log_path=log_path,
+                live_upload_cb=lambda: uploads.append(time.monotonic()),
+                live_upload_interval_seconds=0.1,
+            )
+            elapsed = time.monotonic() - started
+
+            self.assertIn("working", log_path.read_text(encoding="utf-8"))
+        self.assertGreaterEqual(len(uploads), 3)
+        self.assertLess(elapsed, 2.0)
+
+    def test_nonzero_exit_raises_after_final_upload(self) -> None:
+        uploads: list[int] = []
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(subprocess.CalledProcessError):
+                _run_logged(
+                    [sys.executable, "-c", "raise SystemExit(3)"],
+                    log_path=Path(tmp) / "ffmpeg.log",
+                    live_upload_cb=lambda: uploads.append(1),
+                )
+        self.assertEqual(uploads, [1])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,9 +4,20 @@ import uuid
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
 from videoroll.apps.orchestrator_api.schemas import PublishBatchSummary
-from videoroll.apps.orchestrator_api.services.publishing_service import list_task_publish_batches
-from videoroll.db.models import Platform, PublishState
+from videoroll.apps.orchestrator_api.services.publishing_service import list_task_publish_batches, list_task_publish_jobs
+from videoroll.db.base import Base
+from videoroll.db.models import Platform, PublishJob, PublishState, SourceLicense, SourceType, Task
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(_type: JSONB, _compiler: object, **_kwargs: object) -> str:
+    return "JSON"
 
 
 def test_publish_batch_summary_exposes_state_and_expected_targets() -> None:
@@ -69,3 +80,30 @@ def test_publish_batch_list_includes_worker_failure_for_each_target() -> None:
 
     assert result[0]["outcomes"]["douyin:default"]["state"] == "failed"
     assert result[0]["outcomes"]["douyin:default"]["detail"] == "browser upload failed"
+
+
+def test_publish_job_list_projects_typeid_mode_and_error_message() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=[Task.__table__, PublishJob.__table__])
+    db = sessionmaker(bind=engine)()
+    try:
+        task = Task(source_type=SourceType.local, source_license=SourceLicense.own)
+        db.add(task)
+        db.flush()
+        db.add(
+            PublishJob(
+                task_id=task.id,
+                meta_json={"typeid_mode": "ai_summary", "desc": "x" * 1000},
+                response_json={"error": "upload rejected", "code": 21015},
+            )
+        )
+        db.commit()
+
+        result = list_task_publish_jobs(task.id, 20, db)
+    finally:
+        db.close()
+
+    assert len(result) == 1
+    assert result[0]["typeid_mode"] == "ai_summary"
+    assert result[0]["error_message"] == "upload rejected (code=21015)"
+    assert result[0]["platform"] == "bilibili"
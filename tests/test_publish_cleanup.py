@@ -30,10 +30,9 @@ def test_cleanup_retries_and_clears_marker_when_subtitle_work_is_in_flight() ->
     with (
         patch("videoroll.apps.subtitle_service.worker._ensure_db"),
         patch("videoroll.apps.subtitle_service.worker._db", return_value=db),
-        patch("videoroll.apps.subtitle_service.worker.S3Store") as store_cls,
+        patch("videoroll.apps.subtitle_service.worker._s3"),
         patch.object(cleanup_task, "retry", side_effect=Retry()),
     ):
-        store_cls.return_value.ensure_bucket.return_value = None
         with pytest.raises(Retry):
             cleanup_task.run(str(task_id), str(batch_id))
 
@@ -24,6 +24,11 @@ def test_publish_job_exposes_bilibili_upload_progress() -> None:
     assert "upload_active" in columns
 
 
+def test_publish_job_accounts_are_never_lazy_loaded() -> None:
+    for name in ("account", "bili_account"):
+        assert PublishJob.__mapper__.relationships[name].lazy == "raise_on_sql"
+
+
 def test_publish_requests_and_responses_carry_batch_and_job_identifiers() -> None:
     batch_id = uuid.uuid4()
     payload = SocialPublishRequest.model_validate(
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from videoroll.storage import s3 as s3_module
+
+
+def _settings(**overrides: object) -> SimpleNamespace:
+    values: dict[str, object] = {
+        "s3_bucket": "videoroll",
+        "s3_endpoint_url": "http://minio:9000",
+        "s3_access_key_id": "key",
+        "s3_secret_access_key": "secret",
+        "s3_region_name": "us-east-1",
+        "s3_use_ssl": False,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _store() -> tuple[s3_module.S3Store, MagicMock]:
+    s3_module.clear_s3_clients()
+    settings = _settings()
+    client = MagicMock()
+    with patch.object(s3_module.boto3, "client", return_value=client) as client_factory:
+        store = s3_module.S3Store(settings)  # type: ignore[arg-type]
+    assert client_factory.call_args.kwargs["config"].max_pool_connections >= 2 * s3_module._TRANSFER_CONFIG.max_request_concurrency
+    return store, client
+
+
+def test_transfers_use_the_shared_multipart_config(tmp_path: Path) -> None:
+    store, client = _store()
+
+    store.upload_file(tmp_path / "final.mp4", "final/a.mp4")
+    store.download_file("final/a.mp4", tmp_path / "out" / "a.mp4")
+    store.copy_object("final/a.mp4", "final/b.mp4")
+
+    for call in (client.upload_file.call_args, client.download_file.call_args, client.copy.call_args):
+        assert call.kwargs["Config"] is s3_module._TRANSFER_CONFIG
+    assert client.upload_file.call_args.kwargs["ExtraArgs"] == {"ContentType": "video/mp4"}
+    assert s3_module._TRANSFER_CONFIG.multipart_chunksize == 16 * 1024 * 1024
+
+
+def test_put_bytes_goes_multipart_only_above_the_part_size() -> None:
+    store, client = _store()
+    client.put_object.return_value = {"ETag": '"abc"'}
+
+    small = store.put_bytes(b"{}", "meta/a.json", content_type="application/json")
+    large = store.put_bytes(b"x" * (s3_module._MULTIPART_CHUNK_BYTES + 1), "logs/a.txt")
+
+    assert small.etag == '"abc"'
+    client.put_object.assert_called_once()
+    assert large.etag is None
+    assert client.upload_fileobj.call_args.args[1:] == ("videoroll", "logs/a.txt")
+    assert client.upload_fileobj.call_args.kwargs["Config"] is s3_module._TRANSFER_CONFIG
+
+
+def test_stores_share_one_client_per_connection_settings() -> None:
+    s3_module.clear_s3_clients()
+    try:
+        with patch.object(s3_module.boto3, "client", side_effect=lambda *a, **kw: MagicMock()) as client_factory:
+            first = s3_module.S3Store(_settings())  # type: ignore[arg-type]
+            second = s3_module.S3Store(_settings(s3_bucket="other"))  # type: ignore[arg-type]
+            rotated = s3_module.S3Store(_settings(s3_secret_access_key="rotated"))  # type: ignore[arg-type]
+
+        assert client_factory.call_count == 2
+        assert first._client is second._client
+        assert rotated._client is not first._client
+        assert second.bucket == "other"
+    finally:
+        s3_module.clear_s3_clients()
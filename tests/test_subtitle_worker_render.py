@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from videoroll.apps.subtitle_service import worker
+from videoroll.db.base import Base
+from videoroll.db.models import (
+    Asset,
+    AssetKind,
+    PublishJob,
+    RenderJob,
+    RenderJobStatus,
+    SourceLicense,
+    SourceType,
+    SubtitleJob,
+    Task,
+    TaskStatus,
+)
+
+
+_TABLES = [Task.__table__, Asset.__table__, SubtitleJob.__table__, RenderJob.__table__, PublishJob.__table__]
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(_type: JSONB, _compiler: object, **_kwargs: object) -> str:
+    return "JSON"
+
+
+@pytest.fixture
+def session_factory() -> sessionmaker[Session]:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=_TABLES)
+    try:
+        yield sessionmaker(bind=engine, expire_on_commit=False)
+    finally:
+        Base.metadata.drop_all(engine, tables=list(reversed(_TABLES)))
+        engine.dispose()
+
+
+def _write_output(*args: object, **_kwargs: object) -> None:
+    out = args[3]
+    assert isinstance(out, Path)
+    out.write_bytes(out.name.encode("utf-8"))
+
+
+def test_render_job_with_burn_in_and_soft_sub_uploads_both_videos(
+    session_factory: sessionmaker[Session], tmp_path: Path
+) -> None:
+    with session_factory() as db:
+        task = Task(
+            source_type=SourceType.local,
+            source_license=SourceLicense.own,
+            lock_owner=worker.TASK_QUEUE_LOCK_OWNER,
+        )
+        db.add(task)
+        db.flush()
+        rj = RenderJob(
+            task_id=task.id,
+            status=RenderJobStatus.queued,
+            request_json={
+                "input_key": "raw/input.mp4",
+                "srt_key": "sub/zh.srt",
+                "ass_key": "sub/zh.ass",
+                "burn_in": True,
+                "soft_sub": True,
+            },
+        )
+        db.add(rj)
+        db.commit()
+        task_id, render_job_id = task.id, rj.id
+
+    store = MagicMock()
+    store.download_file.side_effect = lambda _key, path: Path(path).write_bytes(b"input")
+    settings = SimpleNamespace(work_dir=str(tmp_path), ffmpeg_path="ffmpeg", intel_gpu_render_device=None)
+
+    with (
+        patch.object(worker, "settings", settings),
+        patch.object(worker, "_ensure_db"),
+        patch.object(worker, "_s3", return_value=store),
+        patch.object(worker, "_db", side_effect=session_factory),
+        patch.object(worker, "celery_app"),
+        patch.object(worker, "_TaskQueueHeartbeat"),
+        patch.object(worker, "JobLeaseHeartbeat"),
+        patch.object(worker, "render_burn_in", side_effect=_write_output) as render_burn_in,
+        patch.object(worker, "mux_soft_sub", side_effect=_write_output) as mux_soft_sub,
+    ):
+        result = worker.process_render_job.run(str(render_job_id))
+
+    assert result == {"status": "ok"}
+    render_burn_in.assert_called_once()
+    mux_soft_sub.assert_called_once()
+    uploaded = [call.args[1] for call in store.upload_file.call_args_list]
+    assert any(key.startswith(f"final/{task_id}/video_burnin") for key in uploaded)
+    assert any(key.startswith(f"final/{task_id}/video_softsub") for key in uploaded)
+
+    with session_factory() as db:
+        assert db.get(RenderJob, render_job_id).status == RenderJobStatus.succeeded
+        assert db.get(Task, task_id).status == TaskStatus.rendered
+        finals = db.query(Asset.storage_key).filter(Asset.kind == AssetKind.video_final).all()
+        assert len(finals) == 2
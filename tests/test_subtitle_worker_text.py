@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from videoroll.apps.subtitle_service.processing import Segment
+from videoroll.apps.subtitle_service.worker import _fallback_bilibili_tags, _has_cjk, _segments_text_excerpt
+
+
+def test_fallback_tags_prefer_cjk_then_english_then_defaults() -> None:
+    tags = _fallback_bilibili_tags(
+        title="深度学习 入门 with Python",
+        summary="The videoroll demo of PyTorch and python",
+        transcript="深度学习",
+        n=6,
+    )
+
+    assert tags == ["深度学习", "入门", "Python", "demo", "PyTorch", "熟肉"]
+
+
+def test_fallback_tags_stop_at_n() -> None:
+    assert _fallback_bilibili_tags(title="一二三 四五六 七八九", summary="", transcript="", n=2) == ["一二三", "四五六"]
+    assert _fallback_bilibili_tags(title="", summary="", transcript="", n=3) == ["熟肉", "字幕", "翻译"]
+
+
+def test_has_cjk_detects_cjk_and_skips_ascii() -> None:
+    assert _has_cjk("Python 入门")
+    assert _has_cjk("カタカナ")
+    assert not _has_cjk("Plain English title")
+    assert not _has_cjk("Café résumé")
+    assert not _has_cjk("")
+
+
+def test_segments_text_excerpt_keeps_both_ends_of_long_transcripts() -> None:
+    segments = [Segment(start=float(i), end=float(i + 1), text=f" line{i:03d} ") for i in range(200)]
+
+    assert _segments_text_excerpt(segments[:3], max_chars=100) == "line000\nline001\nline002"
+    excerpt = _segments_text_excerpt(segments, max_chars=20)
+    assert excerpt == "line000\nli\n…\n98\nline199"
+    assert _segments_text_excerpt([Segment(start=0.0, end=1.0, text="  ")]) == ""
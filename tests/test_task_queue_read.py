@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from videoroll.apps.subtitle_service.main import _task_ids_with_jobs
+from videoroll.db.base import Base
+from videoroll.db.models import RenderJob, SourceLicense, SourceType, SubtitleJob, Task
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(_type: JSONB, _compiler: object, **_kwargs: object) -> str:
+    return "JSON"
+
+
+def test_task_ids_with_jobs_checks_every_task_in_two_queries() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=[Task.__table__, SubtitleJob.__table__, RenderJob.__table__])
+    db = sessionmaker(bind=engine)()
+    try:
+        ids = [uuid.uuid4() for _ in range(4)]
+        db.add_all([Task(id=tid, source_type=SourceType.youtube, source_license=SourceLicense.own) for tid in ids])
+        db.flush()
+        db.add_all(
+            [
+                SubtitleJob(task_id=ids[0]),
+                SubtitleJob(task_id=ids[0]),
+                RenderJob(task_id=ids[1]),
+                SubtitleJob(task_id=ids[2]),
+                RenderJob(task_id=ids[2]),
+            ]
+        )
+        db.commit()
+
+        statements: list[str] = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        assert _task_ids_with_jobs(db, ids) == {ids[0], ids[1], ids[2]}
+        assert len(statements) == 2
+        assert _task_ids_with_jobs(db, []) == set()
+        assert len(statements) == 2
+    finally:
+        db.close()
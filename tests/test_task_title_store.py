@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from videoroll.apps.subtitle_service.task_title_store import get_task_display_title, get_task_titles, set_task_titles
+from videoroll.db.base import Base
+from videoroll.db.models import AppSetting
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(_type: JSONB, _compiler: object, **_kwargs: object) -> str:
+    return "JSON"
+
+
+def _sqlite_session() -> Session:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=[AppSetting.__table__])
+    return sessionmaker(bind=engine)()
+
+
+def test_set_task_titles_merges_partial_updates() -> None:
+    db = _sqlite_session()
+    try:
+        set_task_titles(db, "task-1", source_title=" Source ")
+        set_task_titles(db, "task-1", translated_title=" 译名 ")
+
+        assert get_task_titles(db, "task-1") == {"source_title": "Source", "translated_title": "译名"}
+        assert get_task_display_title(db, "task-1") == "译名"
+        assert db.query(AppSetting).count() == 1
+    finally:
+        db.close()
+
+
+def test_set_task_titles_without_commit_joins_caller_transaction() -> None:
+    db = _sqlite_session()
+    try:
+        set_task_titles(db, "task-1", source_title="Source", commit=False)
+        db.rollback()
+
+        assert get_task_titles(db, "task-1") == {}
+    finally:
+        db.close()
+
+
+def test_set_task_titles_skips_write_when_unchanged() -> None:
+    db = _sqlite_session()
+    try:
+        set_task_titles(db, "task-1", source_title="Source", translated_title="译名")
+        statements: list[str] = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        set_task_titles(db, "task-1", source_title="Source", translated_title="译名")
+
+        assert [s for s in statements if not s.lstrip().upper().startswith("SELECT")] == []
+    finally:
+        db.close()
+
+
+def test_get_task_titles_is_cached_until_written() -> None:
+    db = _sqlite_session()
+    try:
+        set_task_titles(db, "task-1", source_title="Source")
+        assert get_task_titles(db, "task-1") == {"source_title": "Source"}
+
+        statements: list[str] = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+        titles = get_task_titles(db, "task-1")
+        titles["source_title"] = "mutated"
+        assert get_task_titles(db, "task-1") == {"source_title": "Source"}
+        assert statements == []
+
+        set_task_titles(db, "task-1", translated_title="译名")
+        assert get_task_titles(db, "task-1") == {"source_title": "Source", "translated_title": "译名"}
+    finally:
+        db.close()
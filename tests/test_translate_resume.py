@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import json
+import re
 import sys
+import tempfile
+import threading
 import types
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 try:
@@ -41,6 +45,8 @@ except ModuleNotFoundError:
 
 from videoroll.apps.subtitle_service import processing
 from videoroll.apps.subtitle_service.processing import Segment
+from videoroll.apps.subtitle_service.translate_cache import TranslationCache
+from videoroll.ai import client as ai_client
 from videoroll.ai.service import AIService
 
 
@@ -58,7 +64,26 @@ class _FakeResponse:
         return self._payload
 
 
+def _completion(content: dict[str, object]) -> _FakeResponse:
+    return _FakeResponse({"choices": [{"message": {"content": json.dumps(content, ensure_ascii=False)}}]})
+
+
+class _RejectedResponse:
+    status_code = 401
+    headers = {"content-type": "application/json"}
+    text = '{"error": {"message": "invalid api key"}}'
+
+    def raise_for_status(self) -> None:
+        raise ai_client.httpx.HTTPStatusError("401 Unauthorized", request=None, response=None)  # type: ignore[arg-type]
+
+
 class TranslateResumeTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # Tests swap in fake httpx clients; never reuse one across tests.
+        shared_clients = patch.dict(ai_client._SHARED_CLIENTS, clear=True)
+        shared_clients.start()
+        self.addCleanup(shared_clients.stop)
+
     def test_resume_uses_existing_prefix_and_summary(self) -> None:
         source_segments = [
             Segment(start=0.0, end=1.0, text="one"),
@@ -264,6 +289,217 @@ class TranslateResumeTests(unittest.TestCase):
         self.assertIn('"summary": "summary-start"', str(second_prompt))
         self.assertIn('"idx": 3', str(second_prompt))
 
+    def test_concurrent_batches_keep_order_and_fall_back_to_sequential_on_failure(self) -> None:
+        source_segments = [Segment(start=float(i), end=float(i + 1), text=f"s{i}") for i in range(4)]
+        lock = threading.Lock()
+        calls_per_idx: dict[int, int] = {}
+        rag_threads: set[str] = set()
+
+        class FakeClient:
+            def __enter__(self) -> "FakeClient":
+                return self
+
+            def __exit__(self, _exc_type: object, _exc: object, _tb: object) -> None:
+                return None
+
+            def post(self, _url: str, *, headers: dict[str, str], json: dict[str, object]) -> _FakeResponse:
+                del headers
+                prompt = str(json["messages"][1]["content"])  # type: ignore[index]
+                idx = int(re.search(r'"idx": (\d+)', prompt).group(1))  # type: ignore[union-attr]
+                with lock:
+                    calls_per_idx[idx] = calls_per_idx.get(idx, 0) + 1
+                    first_call = calls_per_idx[idx] == 1
+                translations = [] if idx == 2 and first_call else [{"idx": idx, "text": f"t{idx}"}]
+                return _completion({"updated_summary": "", "translations": translations})
+
+        def rag_context_provider(batch: list[Segment], start_idx: int, summary: str) -> None:
+            del batch, start_idx, summary
+            rag_threads.add(threading.current_thread().name)
+            return None
+
+        batch_events: list[int] = []
+
+        with patch.object(processing, "create_openai_http_client", lambda _timeout: FakeClient()):
+            translated, summary = processing.translate_segments_openai_with_summary(
+                source_segments,
+                target_lang="zh",
+                style="自然",
+                api_key="test-key",
+                base_url="https://example.invalid/v1",
+                model="fake-model",
+                batch_size=1,
+                enable_summary=False,
+                rag_context_provider=rag_context_provider,
+                on_batch_done=lambda _batch, _summary, completed: batch_events.append(completed),
+                concurrency=3,
+            )
+
+        self.assertEqual([seg.text for seg in translated], ["t1", "t2", "t3", "t4"])
+        self.assertEqual(summary, "")
+        self.assertEqual(batch_events, [1, 2, 3, 4])
+        self.assertEqual(calls_per_idx[2], 2)
+        self.assertEqual(rag_threads, {threading.current_thread().name})
+
+    def test_rejected_request_fails_fast_without_sequential_fallback(self) -> None:
+        source_segments = [Segment(start=float(i), end=float(i + 1), text=f"s{i}") for i in range(4)]
+        lock = threading.Lock()
+        posts: list[int] = []
+
+        class FakeClient:
+            def __enter__(self) -> "FakeClient":
+                return self
+
+            def __exit__(self, _exc_type: object, _exc: object, _tb: object) -> None:
+                return None
+
+            def post(self, _url: str, *, headers: dict[str, str], json: dict[str, object]) -> _RejectedResponse:
+                del headers, json
+                with lock:
+                    posts.append(1)
+                return _RejectedResponse()
+
+        with patch.object(processing, "create_openai_http_client", lambda _timeout: FakeClient()):
+            with self.assertRaises(ai_client.OpenAIStatusError) as ctx:
+                processing.translate_segments_openai_with_summary(
+                    source_segments,
+                    target_lang="zh",
+                    style="自然",
+                    api_key="bad-key",
+                    base_url="https://example.invalid/v1",
+                    model="fake-model",
+                    batch_size=1,
+                    enable_summary=False,
+                    concurrency=2,
+                )
+
+        self.assertEqual(ctx.exception.status_code, 401)
+        self.assertFalse(ctx.exception.retryable)
+        # At most one attempt per batch that had already started: no format
+        # retries and no sequential re-run of the failed batch.
+        self.assertLessEqual(len(posts), len(source_segments))
+
+    def test_batch_size_recovers_after_halving_and_respects_char_budget(self) -> None:
+        def run(source_segments: list[Segment], *, partial_first: bool) -> list[int]:
+            sizes: list[int] = []
+
+            class FakeClient:
+                def __enter__(self) -> "FakeClient":
+                    return self
+
+                def __exit__(self, _exc_type: object, _exc: object, _tb: object) -> None:
+                    return None
+
+                def post(self, _url: str, *, headers: dict[str, str], json: dict[str, object]) -> _FakeResponse:
+                    del headers
+                    prompt = str(json["messages"][1]["content"]).split("输出 JSON")[0]  # type: ignore[index]
+                    idxs = [int(i) for i in re.findall(r'"idx": (\d+)', prompt)]
+                    sizes.append(len(idxs))
+                    if partial_first and len(sizes) == 1:
+                        idxs = idxs[:1]
+                    return _completion({"translations": [{"idx": i, "text": f"t{i}"} for i in idxs]})
+
+            with patch.object(processing, "create_openai_http_client", lambda _timeout: FakeClient()):
+                translated, _summary = processing.translate_segments_openai_with_summary(
+                    source_segments,
+                    target_lang="zh",
+                    style="自然",
+                    api_key="test-key",
+                    base_url="https://example.invalid/v1",
+                    model="fake-model",
+                    batch_size=4,
+                    enable_summary=False,
+                )
+            self.assertEqual([seg.text for seg in translated], [f"t{i + 1}" for i in range(len(source_segments))])
+            return sizes
+
+        short = [Segment(start=float(i), end=float(i + 1), text=f"line {chr(97 + i)}") for i in range(8)]
+        self.assertEqual(run(short, partial_first=True), [4, 2, 4, 1])
+
+        long_text = "x" * (processing._TRANSLATE_BATCH_CHAR_BUDGET // 2 + 1)
+        long = [Segment(start=float(i), end=float(i + 1), text=f"{long_text}{chr(97 + i)}") for i in range(3)]
+        self.assertEqual(run(long, partial_first=False), [1, 1, 1])
+
+    def test_cached_batches_skip_the_request_on_rerun(self) -> None:
+        source_segments = [Segment(start=0.0, end=1.0, text="one"), Segment(start=1.0, end=2.0, text="two")]
+        seen_requests: list[dict[str, object]] = []
+
+        class FakeClient:
+            def __enter__(self) -> "FakeClient":
+                return self
+
+            def __exit__(self, _exc_type: object, _exc: object, _tb: object) -> None:
+                return None
+
+            def post(self, _url: str, *, headers: dict[str, str], json: dict[str, object]) -> _FakeResponse:
+                del headers
+                seen_requests.append(json)
+                n = len(seen_requests)
+                return _completion({"updated_summary": f"summary-{n}", "translations": [{"idx": n, "text": f"t{n}"}]})
+
+        def run(cache: TranslationCache) -> tuple[list[str], str]:
+            with patch.object(processing, "create_openai_http_client", lambda _timeout: FakeClient()):
+                translated, summary = processing.translate_segments_openai_with_summary(
+                    source_segments,
+                    target_lang="zh",
+                    style="自然",
+                    api_key="test-key",
+                    base_url="https://example.invalid/v1",
+                    model="fake-model",
+                    batch_size=1,
+                    cache=cache,
+                )
+            return [seg.text for seg in translated], summary
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = TranslationCache(Path(tmp) / "translate_cache.sqlite")
+            self.addCleanup(cache.close)
+
+            first = run(cache)
+            second = run(cache)
+
+        self.assertEqual(first, (["t1", "t2"], "summary-2"))
+        self.assertEqual(second, first)
+        self.assertEqual(len(seen_requests), 2)
+
+    def test_blank_numeric_and_repeated_lines_are_not_sent_twice(self) -> None:
+        source_segments = [
+            Segment(start=0.0, end=1.0, text="Hello"),
+            Segment(start=1.0, end=2.0, text="2024"),
+            Segment(start=2.0, end=3.0, text=" Hello "),
+            Segment(start=3.0, end=4.0, text="♪ ... ♪"),
+            Segment(start=4.0, end=5.0, text="Bye"),
+        ]
+        sent_blocks: list[list[tuple[int, str]]] = []
+
+        class FakeClient:
+            def __enter__(self) -> "FakeClient":
+                return self
+
+            def __exit__(self, _exc_type: object, _exc: object, _tb: object) -> None:
+                return None
+
+            def post(self, _url: str, *, headers: dict[str, str], json: dict[str, object]) -> _FakeResponse:
+                del headers
+                messages = json["messages"]
+                assert isinstance(messages, list)
+                blocks = [(int(i), t) for i, t in re.findall(r'"idx": (\d+), "text": "([^"]*)"', str(messages[-1]["content"]).split("输出 JSON")[0])]
+                sent_blocks.append(blocks)
+                return _completion({"translations": [{"idx": i, "text": f"译{t}"} for i, t in blocks]})
+
+        with patch.object(processing, "create_openai_http_client", lambda _timeout: FakeClient()):
+            translated, _summary = processing.translate_segments_openai_with_summary(
+                source_segments,
+                target_lang="zh",
+                style="自然",
+                api_key="test-key",
+                base_url="https://example.invalid/v1",
+                model="fake-model",
+                enable_summary=False,
+            )
+
+        self.assertEqual(sent_blocks, [[(1, "Hello"), (5, "Bye")]])
+        self.assertEqual([seg.text for seg in translated], ["译Hello", "2024", "译Hello", "♪ ... ♪", "译Bye"])
+
     def test_rag_context_provider_is_included_in_prompt(self) -> None:
         source_segments = [Segment(start=0.0, end=1.0, text="Rush B with an AWP")]
         seen_requests: list[dict[str, object]] = []
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from videoroll.apps.subtitle_service import translate_settings_store as store
+from videoroll.config import SubtitleServiceSettings
+from videoroll.db.base import Base
+from videoroll.db.models import AppSetting
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(_type: JSONB, _compiler: object, **_kwargs: object) -> str:
+    return "JSON"
+
+
+def _sqlite_session() -> Session:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=[AppSetting.__table__])
+    return sessionmaker(bind=engine)()
+
+
+def _fake_encrypt(value: str) -> str:
+    return f"enc:{value}"
+
+
+def _fake_decrypt(token: str) -> str:
+    return token.removeprefix("enc:")
+
+
+def test_get_translate_settings_reuses_cached_row_and_decrypted_key() -> None:
+    db = _sqlite_session()
+    defaults = SubtitleServiceSettings()
+    try:
+        with patch.object(store, "encrypt_str", _fake_encrypt), patch.object(
+            store, "decrypt_str", side_effect=_fake_decrypt
+        ) as decrypt:
+            store.update_translate_settings(db, defaults, {"openai_api_key": "sk-one", "openai_model": "m1"})
+            store.get_translate_settings(db, defaults)
+            decrypt.reset_mock()
+            statements: list[str] = []
+            event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+            first = store.get_translate_settings(db, defaults)
+            first["openai_model"] = "mutated"
+            second = store.get_translate_settings(db, defaults)
+
+        assert second["openai_api_key"] == "sk-one"
+        assert second["openai_model"] == "m1"
+        assert statements == []
+        assert decrypt.call_count == 0
+    finally:
+        db.close()
+
+
+def test_update_translate_settings_invalidates_cache() -> None:
+    db = _sqlite_session()
+    defaults = SubtitleServiceSettings()
+    try:
+        with patch.object(store, "encrypt_str", _fake_encrypt), patch.object(store, "decrypt_str", _fake_decrypt):
+            store.update_translate_settings(db, defaults, {"openai_api_key": "sk-one"})
+            assert store.get_translate_settings(db, defaults)["openai_api_key"] == "sk-one"
+
+            updated = store.update_translate_settings(db, defaults, {"openai_api_key": "sk-two"})
+
+            assert updated["openai_api_key"] == "sk-two"
+            assert store.get_translate_settings(db, defaults)["openai_api_key"] == "sk-two"
+    finally:
+        db.close()
+
+
+def test_reloading_settings_does_not_decrypt_an_unchanged_key_again() -> None:
+    db = _sqlite_session()
+    defaults = SubtitleServiceSettings()
+    try:
+        with patch.object(store, "encrypt_str", _fake_encrypt), patch.object(
+            store, "decrypt_str", side_effect=_fake_decrypt
+        ) as decrypt:
+            store.update_translate_settings(db, defaults, {"openai_api_key": "sk-one"})
+            store.get_translate_settings(db, defaults)
+            store.invalidate_translate_settings_cache()
+            decrypt.reset_mock()
+
+            settings = store.get_translate_settings(db, defaults)
+
+        assert settings["openai_api_key"] == "sk-one"
+        assert decrypt.call_count == 0
+    finally:
+        db.close()
+
+
+def test_update_translate_settings_writes_with_a_single_upsert() -> None:
+    db = _sqlite_session()
+    defaults = SubtitleServiceSettings()
+    try:
+        statements: list[str] = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        store.update_translate_settings(db, defaults, {"openai_model": "m1"})
+        store.update_translate_settings(db, defaults, {"default_style": "casual"})
+
+        writes = [s for s in statements if not s.lstrip().upper().startswith("SELECT")]
+        assert len(writes) == 2
+        assert all("ON CONFLICT" in s for s in writes)
+        assert db.query(AppSetting).count() == 1
+        settings = store.get_translate_settings(db, defaults)
+        assert settings["openai_model"] == "m1"
+        assert settings["default_style"] == "casual"
+    finally:
+        db.close()
+
+
+def test_get_translate_settings_does_not_load_orm_rows() -> None:
+    db = _sqlite_session()
+    defaults = SubtitleServiceSettings()
+    try:
+        store.update_translate_settings(db, defaults, {"openai_model": "m1"})
+        db.expunge_all()
+        store.invalidate_translate_settings_cache()
+
+        assert store.get_translate_settings(db, defaults)["openai_model"] == "m1"
+        assert len(db.identity_map) == 0
+    finally:
+        db.close()
+
+
+def test_update_translate_settings_returns_written_values_without_reading_back() -> None:
+    db = _sqlite_session()
+    defaults = SubtitleServiceSettings()
+    try:
+        with patch.object(store, "encrypt_str", _fake_encrypt), patch.object(
+            store, "decrypt_str", side_effect=_fake_decrypt
+        ) as decrypt:
+            statements: list[str] = []
+            event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+            updated = store.update_translate_settings(db, defaults, {"openai_api_key": "sk-one", "openai_model": "m1"})
+            assert decrypt.call_count == 0
+            reread = store.get_translate_settings(db, defaults)
+
+        assert updated["openai_api_key"] == "sk-one"
+        assert updated["openai_model"] == "m1"
+        assert updated == reread
+        # One read before the write, one for the explicit re-read above.
+        assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 2
+    finally:
+        db.close()
+
+
+def test_update_translate_settings_coerces_nested_openai_fields() -> None:
+    db = _sqlite_session()
+    defaults = SubtitleServiceSettings()
+    try:
+        updated = store.update_translate_settings(
+            db,
+            defaults,
+            {
+                "openai_base_url": "api.example.com",
+                "openai_temperature": "0.4",
+                "openai_timeout_seconds": "soon",
+                "openai_max_retries": 50,
+                "rag_embedding_base_url": "emb.example.com",
+                "rag_embedding_timeout_seconds": 5000,
+                "default_style": None,
+            },
+        )
+
+        assert updated["openai_base_url"] == "https://api.example.com/v1"
+        assert updated["openai_temperature"] == 0.4
+        assert updated["openai_timeout_seconds"] == defaults.openai_timeout_seconds
+        assert updated["openai_max_retries"] == 10
+        assert updated["rag_embedding_base_url"] == "https://emb.example.com/v1"
+        assert updated["rag_embedding_timeout_seconds"] == 600.0
+        assert updated["default_style"] == defaults.translate_default_style
+    finally:
+        db.close()
+
+
+def test_update_translate_settings_skips_write_when_unchanged() -> None:
+    db = _sqlite_session()
+    defaults = SubtitleServiceSettings()
+    update = {"openai_api_key": "sk-one", "openai_model": "m1", "rag_top_k": 5}
+    try:
+        with patch.object(store, "encrypt_str", side_effect=_fake_encrypt) as encrypt, patch.object(
+            store, "decrypt_str", _fake_decrypt
+        ):
+            store.update_translate_settings(db, defaults, update)
+            encrypt.reset_mock()
+            statements: list[str] = []
+            event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+            settings = store.update_translate_settings(db, defaults, update)
+
+        assert settings["openai_api_key"] == "sk-one"
+        assert settings["rag_top_k"] == 5
+        assert encrypt.call_count == 0
+        assert [s for s in statements if not s.lstrip().upper().startswith("SELECT")] == []
+    finally:
+        db.close()
+
+
+def test_bulk_update_translate_settings_applies_patches_in_order_with_one_write() -> None:
+    db = _sqlite_session()
+    defaults = SubtitleServiceSettings()
+    try:
+        statements: list[str] = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        with patch.object(store, "encrypt_str", _fake_encrypt), patch.object(store, "decrypt_str", _fake_decrypt):
+            settings = store.bulk_update_translate_settings(
+                db,
+                defaults,
+                [
+                    {"openai_model": "m1", "openai_api_key": "sk-one"},
+                    {"openai_model": "m2", "rag_top_k": 7},
+                ],
+            )
+
+        assert settings["openai_model"] == "m2"
+        assert settings["openai_api_key"] == "sk-one"
+        assert settings["rag_top_k"] == 7
+        assert len([s for s in statements if not s.lstrip().upper().startswith("SELECT")]) == 1
+    finally:
+        db.close()
+
+
+def test_legacy_unnormalized_base_url_is_normalized_on_load_and_rewritten_on_update() -> None:
+    db = _sqlite_session()
+    defaults = SubtitleServiceSettings()
+    try:
+        db.add(AppSetting(key=store.TRANSLATE_SETTINGS_KEY, value_json={"openai": {"base_url": "api.example.com/"}}))
+        db.commit()
+
+        assert store.get_translate_settings(db, defaults)["openai_base_url"] == "https://api.example.com/v1"
+
+        store.update_translate_settings(db, defaults, {})
+        db.expire_all()
+
+        assert db.get(AppSetting, store.TRANSLATE_SETTINGS_KEY).value_json["openai"]["base_url"] == "https://api.example.com/v1"
+    finally:
+        db.close()
+
+
+def test_projection_reuses_derived_defaults_for_the_same_settings_object() -> None:
+    defaults = SubtitleServiceSettings(OPENAI_BASE_URL="api.example.com")
+    with patch.object(store, "normalize_openai_base_url", wraps=store.normalize_openai_base_url) as normalize:
+        first = store._project_translate_settings({}, "", "", defaults)
+        calls = normalize.call_count
+        second = store._project_translate_settings({"rag_top_k": 3}, "", "", defaults)
+
+    assert first["openai_base_url"] == second["openai_base_url"] == "https://api.example.com/v1"
+    assert normalize.call_count == calls
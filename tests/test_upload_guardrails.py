@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import io
+import os
 import zipfile
 
 import pytest
@@ -99,3 +100,67 @@ def test_safe_extract_zip_rejects_backslash_traversal_without_partial_dest(tmp_p
     assert exc.value.status_code == 400
     assert not dest.exists()
     assert not list(tmp_path.glob(".model.extract-*"))
+
+
+def test_dir_size_bytes_counts_nested_files_and_skips_dir_symlinks(tmp_path) -> None:
+    model = tmp_path / "model"
+    (model / "weights").mkdir(parents=True)
+    (model / "config.json").write_bytes(b"12")
+    (model / "weights" / "model.bin").write_bytes(b"12345")
+    (model / "alias.bin").symlink_to(model / "weights" / "model.bin")
+    (model / "loop").symlink_to(model, target_is_directory=True)
+
+    assert subtitle_main._dir_size_bytes(model) == 12
+    assert subtitle_main._dir_size_bytes(tmp_path / "missing") == 0
+
+
+def test_model_dir_size_is_cached_until_top_level_mtime_changes(tmp_path, monkeypatch) -> None:
+    model = tmp_path / "model"
+    model.mkdir()
+    (model / "a.bin").write_bytes(b"123")
+    calls: list[object] = []
+    real_dir_size = subtitle_main._dir_size_bytes
+    monkeypatch.setattr(subtitle_main, "_MODEL_SIZE_CACHE", {})
+    monkeypatch.setattr(subtitle_main, "_dir_size_bytes", lambda p: calls.append(p) or real_dir_size(p))
+
+    assert subtitle_main._model_dir_size_bytes(model) == 3
+    assert subtitle_main._model_dir_size_bytes(model) == 3
+    assert len(calls) == 1
+
+    (model / "b.bin").write_bytes(b"45")
+    st = model.stat()
+    os.utime(model, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert subtitle_main._model_dir_size_bytes(model) == 5
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("name", ["", "  ", "-model", "a/b", "a" * 65, "mo del", "модель"])
+def test_validate_model_name_rejects_unsafe_names(name: str) -> None:
+    with pytest.raises(HTTPException):
+        subtitle_main._validate_model_name(name)
+
+
+def test_validate_model_name_strips_and_accepts_safe_names() -> None:
+    assert subtitle_main._validate_model_name(" large-v3.int8 ") == "large-v3.int8"
+    assert subtitle_main._validate_model_name("a" * 64) == "a" * 64
+
+
+def test_copy_upload_to_tempfile_rejects_oversize_and_removes_temp(tmp_path, monkeypatch) -> None:
+    real_named_temporary_file = subtitle_main.tempfile.NamedTemporaryFile
+
+    def named_temporary_file(*args: object, **kwargs: object):
+        kwargs["dir"] = tmp_path
+        return real_named_temporary_file(*args, **kwargs)
+
+    monkeypatch.setattr(subtitle_main.tempfile, "NamedTemporaryFile", named_temporary_file)
+    monkeypatch.setattr(subtitle_main, "_UPLOAD_COPY_CHUNK_BYTES", 2)
+
+    copied = subtitle_main._copy_upload_to_tempfile(io.BytesIO(b"abcdef"), max_bytes=6)
+    assert copied.read_bytes() == b"abcdef"
+    copied.unlink()
+
+    with pytest.raises(subtitle_main.UploadTooLargeError):
+        subtitle_main._copy_upload_to_tempfile(io.BytesIO(b"abcdefg"), max_bytes=6)
+
+    assert list(tmp_path.iterdir()) == []
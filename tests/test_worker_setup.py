@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from videoroll.apps.subtitle_service import worker
+from videoroll.db.session import get_engine, get_sessionmaker
+
+
+def test_s3_store_is_built_and_bucket_checked_once_per_process() -> None:
+    with patch.object(worker, "_S3_STORE", None), patch.object(worker, "S3Store") as store_cls:
+        first = worker._s3()
+        second = worker._s3()
+    assert first is second is store_cls.return_value
+    store_cls.assert_called_once_with(worker.settings)
+    first.ensure_bucket.assert_called_once_with()
+
+
+def test_s3_store_is_rebuilt_after_fork() -> None:
+    stale = MagicMock()
+    with patch.object(worker, "_S3_STORE", (-1, stale)), patch.object(worker, "S3Store") as store_cls:
+        assert worker._s3() is store_cls.return_value
+    stale.ensure_bucket.assert_not_called()
+
+
+def test_s3_store_is_not_cached_when_bucket_check_fails() -> None:
+    with patch.object(worker, "_S3_STORE", None), patch.object(worker, "S3Store") as store_cls:
+        store_cls.return_value.ensure_bucket.side_effect = [RuntimeError("s3 down"), None]
+        with pytest.raises(RuntimeError):
+            worker._s3()
+        worker._s3()
+    assert store_cls.call_count == 2
+
+
+def test_sessionmaker_is_reused_per_database_url() -> None:
+    url = "sqlite://"
+    factory = get_sessionmaker(url)
+    assert get_sessionmaker(url) is factory
+    assert factory.kw["bind"] is get_engine(url)
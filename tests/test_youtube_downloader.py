@@ -77,6 +77,19 @@ class YouTubeDownloaderTests(unittest.TestCase):
         )
         self.assertFalse(yd._looks_like_requested_format_unavailable("ERROR: network timeout"))
 
+    def test_resolve_downloaded_file_falls_back_to_largest_media_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            work_dir = Path(tmp)
+            (work_dir / "small.mp4").write_bytes(b"x" * 10)
+            (work_dir / "large.webm").write_bytes(b"x" * 100)
+            (work_dir / "huge.webm.part").write_bytes(b"x" * 1000)
+            (work_dir / "notes.txt").write_bytes(b"x" * 500)
+            (work_dir / "nested").mkdir()
+
+            resolved = yd._resolve_downloaded_file({}, work_dir=work_dir)
+
+        self.assertEqual(resolved.name, "large.webm")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from unittest import TestCase
 from unittest.mock import patch
 
-from videoroll.apps.youtube_ingest.youtube_feed import fetch_youtube_feed
+from videoroll.apps.youtube_ingest import youtube_feed
+from videoroll.apps.youtube_ingest.youtube_feed import (
+    _parse_datetime,
+    close_youtube_feed_clients,
+    fetch_youtube_feed,
+    fetch_youtube_feed_cached,
+)
 
 
 def _build_rss_xml(count: int) -> str:
@@ -29,38 +36,39 @@ def _build_rss_xml(count: int) -> str:
 
 class _FakeResponse:
     def __init__(self, text: str) -> None:
-        self.text = text
+        self.content = text.encode("utf-8")
 
     def raise_for_status(self) -> None:
         return None
 
 
 class _FakeHttpxClient:
-    def __init__(self, *_args: object, **_kwargs: object) -> None:
-        pass
-
-    def __enter__(self) -> "_FakeHttpxClient":
-        return self
+    instances = 0
 
-    def __exit__(self, *_args: object) -> None:
-        return None
+    def __init__(self, *_args: object, **_kwargs: object) -> None:
+        type(self).instances += 1
 
     def get(self, _url: str) -> _FakeResponse:
         return _FakeResponse(_build_rss_xml(15))
 
+    def close(self) -> None:
+        return None
+
 
 class _FakeYdl:
-    def __init__(self, *_args: object, **_kwargs: object) -> None:
-        pass
+    instances = 0
 
-    def __enter__(self) -> "_FakeYdl":
-        return self
+    def __init__(self, params: dict[str, object] | None = None) -> None:
+        type(self).instances += 1
+        self.params = dict(params or {})
+        self.playlistends: list[object] = []
 
-    def __exit__(self, *_args: object) -> None:
+    def close(self) -> None:
         return None
 
     def extract_info(self, _url: str, download: bool = False) -> dict[str, object]:
         assert download is False
+        self.playlistends.append(self.params.get("playlistend"))
         return {
             "entries": [
                 {
@@ -79,7 +87,70 @@ class _FailingYdl(_FakeYdl):
         raise RuntimeError("yt-dlp failed")
 
 
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    def setex(self, key: str, ttl: int, value: str) -> None:
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+
+class _BrokenRedis:
+    def get(self, _key: str) -> str | None:
+        raise ConnectionError("redis down")
+
+    def setex(self, _key: str, _ttl: int, _value: str) -> None:
+        raise ConnectionError("redis down")
+
+
 class YouTubeFeedTests(TestCase):
+    def setUp(self) -> None:
+        close_youtube_feed_clients()
+        self.addCleanup(close_youtube_feed_clients)
+
+    def test_parse_datetime_accepts_zulu_and_offset_forms(self) -> None:
+        expected = datetime(2026, 2, 19, 12, 34, 56, tzinfo=timezone.utc)
+        self.assertEqual(_parse_datetime("2026-02-19T12:34:56Z"), expected)
+        self.assertEqual(_parse_datetime("2026-02-19T12:34:56+00:00"), expected)
+
+    def test_ytdlp_instance_is_reused_with_per_call_playlistend(self) -> None:
+        _FakeYdl.instances = 0
+        with patch("videoroll.apps.youtube_ingest.youtube_feed.yt_dlp.YoutubeDL", _FakeYdl):
+            list(fetch_youtube_feed("channel", "UCexample1234567890", user_agent="UA/1.0", limit=20))
+            list(fetch_youtube_feed("channel", "UCexample1234567890", user_agent="UA/1.0", limit=30))
+
+        (pool,) = youtube_feed._FEED_YDL_POOLS.values()
+        self.assertEqual(_FakeYdl.instances, 1)
+        self.assertEqual([ydl.playlistends for ydl in pool], [[20, 30]])
+
+    def test_concurrent_checkouts_get_separate_ytdlp_instances(self) -> None:
+        _FakeYdl.instances = 0
+        with patch("videoroll.apps.youtube_ingest.youtube_feed.yt_dlp.YoutubeDL", _FakeYdl):
+            with youtube_feed._checkout_feed_ydl("UA/1.0", None) as first:
+                with youtube_feed._checkout_feed_ydl("UA/1.0", None) as second:
+                    self.assertIsNot(first, second)
+            with youtube_feed._checkout_feed_ydl("UA/1.0", None) as reused:
+                self.assertIn(reused, (first, second))
+
+        self.assertEqual(_FakeYdl.instances, 2)
+
+    def test_rss_fallback_reuses_one_http_client(self) -> None:
+        _FakeHttpxClient.instances = 0
+        with (
+            patch("videoroll.apps.youtube_ingest.youtube_feed.httpx.Client", _FakeHttpxClient),
+            patch("videoroll.apps.youtube_ingest.youtube_feed.yt_dlp.YoutubeDL", _FailingYdl),
+        ):
+            for _ in range(3):
+                entries = list(fetch_youtube_feed("channel", "UCexample1234567890", user_agent="UA/1.0", limit=20))
+                self.assertEqual(len(entries), 15)
+
+        self.assertEqual(_FakeHttpxClient.instances, 1)
+
     def test_fetch_youtube_feed_prefers_ytdlp_when_limit_exceeds_rss_cap(self) -> None:
         with (
             patch("videoroll.apps.youtube_ingest.youtube_feed.httpx.Client", _FakeHttpxClient),
@@ -101,3 +172,32 @@ class YouTubeFeedTests(TestCase):
         self.assertEqual(len(entries), 15)
         self.assertEqual(entries[0].video_id, "rss-000")
         self.assertEqual(entries[-1].video_id, "rss-014")
+
+    def test_cached_feed_serves_repeat_scans_from_redis(self) -> None:
+        with patch("videoroll.apps.youtube_ingest.youtube_feed.yt_dlp.YoutubeDL", _FakeYdl):
+            fetched = list(fetch_youtube_feed("channel", "UCexample1234567890", user_agent="UA/1.0", limit=20))
+        fake_redis = _FakeRedis()
+        with (
+            patch("videoroll.apps.youtube_ingest.youtube_feed._feed_cache_client", return_value=fake_redis),
+            patch(
+                "videoroll.apps.youtube_ingest.youtube_feed.fetch_youtube_feed",
+                side_effect=lambda *_args, **_kwargs: iter(fetched),
+            ) as fetch,
+        ):
+            first = fetch_youtube_feed_cached("channel", "UCexample1234567890", "UA/1.0", redis_url="redis://cache")
+            second = fetch_youtube_feed_cached("channel", "UCexample1234567890", "UA/1.0", redis_url="redis://cache")
+
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(first, fetched)
+        self.assertEqual(second, fetched)
+        self.assertEqual(list(fake_redis.ttls.values()), [60])
+
+    def test_cached_feed_falls_back_to_a_live_fetch_when_redis_fails(self) -> None:
+        with (
+            patch("videoroll.apps.youtube_ingest.youtube_feed._feed_cache_client", return_value=_BrokenRedis()),
+            patch("videoroll.apps.youtube_ingest.youtube_feed.httpx.Client", _FakeHttpxClient),
+            patch("videoroll.apps.youtube_ingest.youtube_feed.yt_dlp.YoutubeDL", _FailingYdl),
+        ):
+            entries = fetch_youtube_feed_cached("channel", "UCexample1234567890", "UA/1.0", redis_url="redis://cache")
+
+        self.assertEqual(len(entries), 15)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+from videoroll.apps.youtube_settings_store import (
+    YOUTUBE_SETTINGS_KEY,
+    get_youtube_proxy,
+    get_youtube_settings,
+    update_youtube_settings,
+)
+from videoroll.db.base import Base
+from videoroll.db.models import AppSetting
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(_type: JSONB, _compiler: object, **_kwargs: object) -> str:
+    return "JSON"
+
+
+def _sqlite_session() -> Session:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=[AppSetting.__table__])
+    return sessionmaker(bind=engine)()
+
+
+def test_get_youtube_proxy_falls_back_to_default_only_when_unset() -> None:
+    unset = _sqlite_session()
+    cleared = _sqlite_session()
+    try:
+        assert get_youtube_proxy(unset, default_proxy=" http://env:1 ") == "http://env:1"
+
+        cleared.add(AppSetting(key=YOUTUBE_SETTINGS_KEY, value_json={"proxy": ""}))
+        cleared.commit()
+        # An explicitly cleared proxy wins over the env default, as in get_youtube_settings().
+        assert get_youtube_proxy(cleared, default_proxy="http://env:1") == ""
+        assert get_youtube_settings(cleared, default_proxy="http://env:1")["proxy"] == ""
+    finally:
+        unset.close()
+        cleared.close()
+
+
+def test_get_youtube_proxy_is_cached_until_settings_are_updated() -> None:
+    db = _sqlite_session()
+    try:
+        update_youtube_settings(db, {"proxy": "socks5://a:1"})
+        assert get_youtube_proxy(db) == "socks5://a:1"
+
+        statements: list[str] = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+        assert get_youtube_proxy(db) == "socks5://a:1"
+        assert statements == []
+
+        update_youtube_settings(db, {"proxy": "socks5://b:2"})
+        assert get_youtube_proxy(db) == "socks5://b:2"
+    finally:
+        db.close()
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
 import sys
+import threading
 import types
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from unittest import TestCase
 from unittest.mock import patch
 from uuid import uuid4
 
+import anyio
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
 try:
     import httpx as _httpx  # type: ignore
 except ModuleNotFoundError:
@@ -19,15 +29,181 @@ except ModuleNotFoundError:
     fake_httpx.Client = Client
     sys.modules["httpx"] = fake_httpx
 
+from videoroll.apps.youtube_ingest import main
+from videoroll.apps.youtube_ingest.schemas import YouTubeIngestRequest, YouTubeSourceScanRequest
 from videoroll.apps.youtube_ingest.source_service import (
+    _auto_pipeline_producer,
     _start_auto_pipeline,
     _prepare_scan_entries,
     resolve_youtube_source_input,
+    scan_youtube_source_by_id,
     source_to_read_dict,
     youtube_source_is_due,
 )
 from videoroll.apps.youtube_ingest.youtube_feed import FeedEntry
-from videoroll.db.models import SourceLicense, YouTubeSource, YouTubeSourceType
+from videoroll.db.base import Base
+from videoroll.db.models import (
+    AppSetting,
+    IngestedVideo,
+    SourceLicense,
+    SourceType,
+    Task,
+    TaskStatus,
+    YouTubeSource,
+    YouTubeSourceType,
+)
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(_type: JSONB, _compiler: object, **_kwargs: object) -> str:
+    return "JSON"
+
+
+def _scan_session() -> Session:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(
+        engine,
+        tables=[AppSetting.__table__, Task.__table__, IngestedVideo.__table__, YouTubeSource.__table__],
+    )
+    return sessionmaker(bind=engine, autoflush=False)()
+
+
+class YouTubeSourceScanTests(TestCase):
+    def _scan(self, db: Session, source: YouTubeSource, entries: list[FeedEntry]) -> object:
+        with (
+            patch("videoroll.apps.youtube_ingest.source_service.fetch_youtube_feed_cached", return_value=entries),
+            patch("videoroll.apps.youtube_ingest.source_service.get_auto_profile", return_value={}),
+            patch("videoroll.apps.youtube_ingest.source_service.get_youtube_proxy", return_value=""),
+        ):
+            return scan_youtube_source_by_id(db, source.id, user_agent="UA/1.0", auto_process_override=False, force=True)
+
+    def _source(self, db: Session) -> YouTubeSource:
+        src = YouTubeSource(
+            source_type=YouTubeSourceType.channel,
+            source_id="UCabc1234567890xyz",
+            license=SourceLicense.authorized,
+            enabled=True,
+            scan_limit=10,
+        )
+        db.add(src)
+        db.commit()
+        return src
+
+    def test_scan_inserts_new_entries_in_one_commit(self) -> None:
+        db = _scan_session()
+        src = self._source(db)
+        now = datetime.now(timezone.utc)
+        entries = [FeedEntry(video_id=f"vid-{i}", title=str(i), published_at=now - timedelta(minutes=i)) for i in range(5)]
+        commits: list[None] = []
+        event.listen(db, "after_commit", lambda _session: commits.append(None))
+
+        result = self._scan(db, src, entries)
+
+        self.assertEqual(len(result.created_task_ids), 5)
+        # Lock acquire, the batch, lock release.
+        self.assertEqual(len(commits), 3)
+        rows = db.query(IngestedVideo.source_id, IngestedVideo.task_id).all()
+        self.assertEqual({source_id for source_id, _ in rows}, {entry.video_id for entry in entries})
+        self.assertEqual({task_id for _, task_id in rows}, set(result.created_task_ids))
+
+    def test_scan_leaves_entries_before_since_out_of_the_dedupe_query(self) -> None:
+        db = _scan_session()
+        src = self._source(db)
+        now = datetime.now(timezone.utc)
+        entries = [FeedEntry(video_id=f"vid-{i}", title=str(i), published_at=now - timedelta(days=i)) for i in range(4)]
+        statements: list[tuple[str, object]] = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append((args[2], args[3])))
+
+        with (
+            patch("videoroll.apps.youtube_ingest.source_service.fetch_youtube_feed_cached", return_value=entries),
+            patch("videoroll.apps.youtube_ingest.source_service.get_auto_profile", return_value={}),
+            patch("videoroll.apps.youtube_ingest.source_service.get_youtube_proxy", return_value=""),
+        ):
+            result = scan_youtube_source_by_id(
+                db,
+                src.id,
+                user_agent="UA/1.0",
+                auto_process_override=False,
+                since=now - timedelta(days=1, hours=12),
+                force=True,
+            )
+
+        self.assertEqual(len(result.created_task_ids), 2)
+        lookup_params = [params for sql, params in statements if sql.lstrip().startswith("SELECT ingested_videos.source_id")]
+        self.assertEqual(len(lookup_params), 1)
+        self.assertIn("vid-1", lookup_params[0])
+        self.assertNotIn("vid-2", lookup_params[0])
+        self.assertNotIn("vid-3", lookup_params[0])
+
+    def test_scan_skips_entries_claimed_by_a_concurrent_ingest(self) -> None:
+        db = _scan_session()
+        src = self._source(db)
+        now = datetime.now(timezone.utc)
+        entries = [FeedEntry(video_id=f"vid-{i}", title=str(i), published_at=now - timedelta(minutes=i)) for i in range(3)]
+        real_prepare = _prepare_scan_entries
+
+        def _prepare_then_race(*args: object, **kwargs: object) -> object:
+            out = real_prepare(*args, **kwargs)
+            # Another ingest claims vid-1 after the dedupe query ran.
+            task = Task(source_type=SourceType.youtube, source_license=SourceLicense.authorized, status=TaskStatus.ingested)
+            db.add(task)
+            db.flush()
+            db.add(IngestedVideo(platform="youtube", source_id="vid-1", task_id=task.id))
+            db.commit()
+            return out
+
+        with patch("videoroll.apps.youtube_ingest.source_service._prepare_scan_entries", side_effect=_prepare_then_race):
+            result = self._scan(db, src, entries)
+
+        self.assertEqual(len(result.created_task_ids), 2)
+        self.assertEqual(result.skipped_duplicates, 1)
+        # The task prepared for vid-1 is not left behind without its video row.
+        self.assertEqual(db.query(Task).count(), 3)
+        rows = dict(db.query(IngestedVideo.source_id, IngestedVideo.task_id).all())
+        self.assertEqual({rows["vid-0"], rows["vid-2"]}, set(result.created_task_ids))
+        self.assertEqual(db.query(IngestedVideo).count(), 3)
+
+
+class YouTubeScanEndpointTests(TestCase):
+    def test_scan_endpoint_runs_off_the_event_loop_and_maps_lock_conflicts(self) -> None:
+        settings = types.SimpleNamespace(database_url="sqlite://", user_agent="UA/1.0", youtube_proxy=None, redis_url="redis://x")
+        scan_threads: list[threading.Thread] = []
+
+        def fake_scan(*_args: object, **_kwargs: object) -> None:
+            scan_threads.append(threading.current_thread())
+            raise RuntimeError("source scan already running")
+
+        async def call() -> threading.Thread:
+            with self.assertRaises(HTTPException) as ctx:
+                await main.scan_source_by_row_id(uuid4(), YouTubeSourceScanRequest(), settings=settings)
+            self.assertEqual(ctx.exception.status_code, 409)
+            return threading.current_thread()
+
+        with (
+            patch.object(main, "get_sessionmaker", lambda _url: lambda: _scan_session()),
+            patch.object(main, "scan_youtube_source_by_id", fake_scan),
+        ):
+            loop_thread = anyio.run(call)
+
+        self.assertEqual(len(scan_threads), 1)
+        self.assertIsNot(scan_threads[0], loop_thread)
+
+
+class YouTubeIngestEndpointTests(TestCase):
+    def test_ingest_single_does_not_reload_the_new_task(self) -> None:
+        db = _scan_session()
+        statements: list[str] = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        first = main.ingest_single(YouTubeIngestRequest(url="https://youtu.be/dQw4w9WgXcQ"), db=db)
+        again = main.ingest_single(YouTubeIngestRequest(url="https://www.youtube.com/watch?v=dQw4w9WgXcQ"), db=db)
+
+        # Dedupe lookup + two INSERTs for the new video, one lookup for the repeat.
+        self.assertEqual(len(statements), 4)
+        self.assertFalse(first.deduped)
+        self.assertTrue(again.deduped)
+        self.assertEqual(again.task_id, first.task_id)
+        self.assertEqual(db.query(IngestedVideo.task_id).scalar(), first.task_id)
 
 
 class _FakeYdl:
@@ -63,7 +239,33 @@ class _FakeCeleryApp:
         return _FakeAsyncResult("job-123")
 
 
+class _FakeProducerCeleryApp:
+    def __init__(self) -> None:
+        self.acquired = 0
+        self.producers: list[object] = []
+
+    @contextmanager
+    def producer_or_acquire(self) -> Iterator[object]:
+        self.acquired += 1
+        yield "producer-1"
+
+    def send_task(self, name: str, *, args: list[object], queue: str, producer: object) -> _FakeAsyncResult:
+        self.producers.append(producer)
+        return _FakeAsyncResult(f"job-{len(self.producers)}")
+
+
 class YouTubeSourceServiceTests(TestCase):
+    def test_start_auto_pipeline_reuses_a_held_producer(self) -> None:
+        fake_celery = _FakeProducerCeleryApp()
+
+        with patch("videoroll.apps.subtitle_service.worker.celery_app", fake_celery):
+            with _auto_pipeline_producer() as producer:
+                job_ids = [_start_auto_pipeline(uuid4(), producer=producer) for _ in range(3)]
+
+        self.assertEqual(job_ids, ["job-1", "job-2", "job-3"])
+        self.assertEqual(fake_celery.acquired, 1)
+        self.assertEqual(fake_celery.producers, ["producer-1"] * 3)
+
     def test_start_auto_pipeline_passes_auto_publish_override(self) -> None:
         task_id = uuid4()
         fake_celery = _FakeCeleryApp()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from videoroll.utils import youtube_urls
+from videoroll.utils.youtube_urls import canonicalize_youtube_url, extract_youtube_video_id
+
+
+_URLS = [
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    " https://www.youtube.com/watch?v=dQw4w9WgXcQ ",
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42",
+    "https://www.youtube.com/watch?v=abc",
+    "https://www.youtube.com/watch?v=bad%20id!",
+    "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+    "http://youtube.com/watch?v=dQw4w9WgXcQ",
+    "https://youtu.be/dQw4w9WgXcQ?si=x",
+    "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+    "https://www.youtube.com/embed/dQw4w9WgXcQ",
+    "https://www.youtube.com/live/dQw4w9WgXcQ",
+    "https://www.youtube.com/channel/UCabc1234567890xyz",
+    "https://example.com/watch?v=dQw4w9WgXcQ",
+    "",
+]
+
+
+@pytest.mark.parametrize("url", _URLS)
+def test_extract_youtube_video_id_fast_path_agrees_with_urlparse(url: str) -> None:
+    fast = extract_youtube_video_id(url)
+    with patch.object(youtube_urls, "_CANONICAL_WATCH_URL_RE", youtube_urls.re.compile(r"(?!)")):
+        slow = extract_youtube_video_id(url)
+    assert fast == slow
+
+
+def test_canonicalize_youtube_url_round_trips() -> None:
+    canonical = canonicalize_youtube_url("https://youtu.be/dQw4w9WgXcQ")
+    assert canonical == "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    assert canonicalize_youtube_url(canonical) == canonical
+    assert extract_youtube_video_id(canonical) == "dQw4w9WgXcQ"